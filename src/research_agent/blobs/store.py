@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+import zlib
+from typing import Any, Iterable, Iterator
+
+from loguru import logger
+
+from research_agent.config import StorageConfig
+
+try:  # Optional dependency; gzip is used when zstandard is unavailable.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+@dataclass
+class BlobRef:
+    digest: str
+    path: Path
+    # Uncompressed bytes from ``put_*``; ``find`` and ``iter_blobs`` report the on-disk size.
+    size: int
+    compression: str
+
+
+class BlobStore:
+    """Content-addressed blob store with hash-sharded directories.
+
+    Blobs live at ``<root>/<aa>/<bb>/<sha256>[.gz|.zst]``. Writes are idempotent:
+    storing content that already exists only returns the existing reference.
+    """
+
+    def __init__(self, root: Path, compression: str = "none") -> None:
+        compression = compression.strip().lower()
+        if compression not in _SUFFIXES:
+            raise ValueError(f"Unknown blob compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstd blob compression requested but zstandard is not installed; using gzip")
+            compression = "gzip"
+        self.root = root
+        self.compression = compression
+
+    @classmethod
+    def from_config(cls, config: StorageConfig) -> "BlobStore":
+        return cls(Path(config.blobs_dir), compression=config.blob_compression)
+
+    def put_bytes(self, data: bytes) -> BlobRef:
+        digest = hashlib.sha256(data).hexdigest()
+        existing = self.find(digest)
+        if existing is not None:
+            return BlobRef(digest=digest, path=existing.path, size=len(data), compression=existing.compression)
+        path = self._path(digest, self.compression)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(_compress(data, self.compression))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return BlobRef(digest=digest, path=path, size=len(data), compression=self.compression)
+
+    def put_stream(self, chunks: Iterable[bytes]) -> BlobRef:
+        """Store a body chunk by chunk, hashing as it goes, without holding it in memory.
+
+        If ``chunks`` raises, the partial write is discarded and the error propagates.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            compressor = _compressobj(self.compression)
+            with os.fdopen(fd, "wb") as handle:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    handle.write(compressor.compress(chunk) if compressor else chunk)
+                if compressor:
+                    handle.write(compressor.flush())
+            digest = hasher.hexdigest()
+            existing = self.find(digest)
+            if existing is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+                return BlobRef(digest=digest, path=existing.path, size=size, compression=existing.compression)
+            path = self._path(digest, self.compression)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return BlobRef(digest=digest, path=path, size=size, compression=self.compression)
+
+    def put_text(self, text: str) -> BlobRef:
+        return self.put_bytes(text.encode("utf-8"))
+
+    def get_bytes(self, digest: str) -> bytes:
+        ref = self.find(digest)
+        if ref is None:
+            raise FileNotFoundError(f"Blob not found: {digest}")
+        return _decompress(ref.path.read_bytes(), ref.compression)
+
+    def find(self, digest: str) -> BlobRef | None:
+        digest = digest.removeprefix("sha256:")
+        for compression in _SUFFIXES:
+            path = self._path(digest, compression)
+            if path.exists():
+                return BlobRef(
+                    digest=digest,
+                    path=path,
+                    size=path.stat().st_size,
+                    compression=compression,
+                )
+        return None
+
+    def link_into(self, ref: BlobRef, dest: Path) -> bool:
+        """Hardlink an uncompressed blob to ``dest``; False when a manifest reference is needed."""
+        if ref.compression != "none":
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(ref.path, dest)
+        except OSError as e:
+            logger.debug(f"Hardlink {ref.path} -> {dest} failed: {e}")
+            return False
+        return True
+
+    def iter_blobs(self) -> Iterator[BlobRef]:
+        if not self.root.exists():
+            return
+        for path in self.root.glob("??/??/*"):
+            if path.name.endswith(".tmp"):
+                continue
+            digest, _, suffix = path.name.partition(".")
+            compression = {"": "none", "gz": "gzip", "zst": "zstd"}.get(suffix)
+            if compression is None:
+                continue
+            yield BlobRef(digest=digest, path=path, size=path.stat().st_size, compression=compression)
+
+    def collect_garbage(
+        self,
+        referenced: set[str],
+        min_age_s: float = 3600.0,
+        dry_run: bool = False,
+    ) -> list[BlobRef]:
+        """Delete blobs that no run references.
+
+        Blobs younger than ``min_age_s`` are kept so a run that is still writing
+        its sources is never collected from under it.
+        """
+        cutoff = time.time() - min_age_s
+        removed: list[BlobRef] = []
+        for ref in self.iter_blobs():
+            if ref.digest in referenced:
+                continue
+            if ref.path.stat().st_mtime > cutoff:
+                continue
+            if not dry_run:
+                ref.path.unlink(missing_ok=True)
+            removed.append(ref)
+        return removed
+
+    def _path(self, digest: str, compression: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / f"{digest}{_SUFFIXES[compression]}"
+
+
+def iter_blob(ref: BlobRef, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Yield a stored blob's uncompressed bytes in chunks."""
+    if ref.compression == "gzip":
+        handle: Any = gzip.open(ref.path, "rb")
+    elif ref.compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst blobs")
+        handle = zstandard.ZstdDecompressor().stream_reader(ref.path.open("rb"), closefd=True)
+    else:
+        handle = ref.path.open("rb")
+    with handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
+
+
+def _compressobj(compression: str) -> Any:
+    """Incremental compressor with ``compress``/``flush``, or None to store as is."""
+    if compression == "gzip":
+        # wbits=31 writes a gzip container, readable by gzip.decompress.
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    if compression == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor().compressobj()
+    return None
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if compression == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst blobs")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
@@ -36,10 +36,44 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Directory of local HTML/PDF/TXT files to ingest (offline mode).",
     )
+    run_parser.add_argument(
+        "--cache-only",
+        action="store_true",
+        help="Serve every fetch from stored sources and never contact origins",
+    )
+    run_parser.add_argument(
+        "--replay-warc",
+        action="store_true",
+        help="Serve every fetch from captured WARC records and never contact origins",
+    )
 
     db_parser = subparsers.add_parser("db-init", help="Initialize the SQLite database")
     db_parser.add_argument("--config", required=True, help="Path to YAML config")
 
+    gc_parser = subparsers.add_parser("blobs-gc", help="Delete source blobs no run references")
+    gc_parser.add_argument("--config", required=True, help="Path to YAML config")
+    gc_parser.add_argument(
+        "--min-age-hours",
+        type=float,
+        default=1.0,
+        help="Keep unreferenced blobs younger than this (protects in-flight runs)",
+    )
+    gc_parser.add_argument("--dry-run", action="store_true", help="List blobs without deleting")
+
+    search_parser = subparsers.add_parser(
+        "search-evidence",
+        help="Search propositions and source text stored by earlier runs",
+    )
+    search_parser.add_argument("query", help="Free-text query")
+    search_parser.add_argument("--config", required=True, help="Path to YAML config")
+    search_parser.add_argument("--limit", type=int, default=10, help="Maximum hits to show")
+
+    index_parser = subparsers.add_parser(
+        "index-sources",
+        help="Add previously ingested sources to the full-text index",
+    )
+    index_parser.add_argument("--config", required=True, help="Path to YAML config")
+
     llm_parser = subparsers.add_parser("llm-test", help="Test LLM connectivity")
     llm_parser.add_argument("--config", required=True, help="Path to YAML config")
     llm_parser.add_argument(
@@ -71,6 +105,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable optional LLM-as-judge validators",
     )
+    eval_parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Serve repeated prompts from the LLM response cache instead of sampling fresh",
+    )
 
     return parser
 
@@ -94,12 +133,76 @@ def main() -> None:
         logger.info(f"Applied {len(applied)} migrations.")
         return
 
+    if args.command == "blobs-gc":
+        from research_agent.blobs.store import BlobStore
+        from research_agent.evidence.store import EvidenceStore
+
+        setup_logging(level=log_level)
+        store = EvidenceStore(Path(config.storage.sqlite_path))
+        store.init()
+        try:
+            referenced = set(store.blob_refcounts())
+        finally:
+            store.close()
+        blobs = BlobStore.from_config(config.storage)
+        removed = blobs.collect_garbage(
+            referenced,
+            min_age_s=args.min_age_hours * 3600,
+            dry_run=args.dry_run,
+        )
+        freed = sum(ref.size for ref in removed)
+        verb = "Would remove" if args.dry_run else "Removed"
+        logger.info(f"{verb} {len(removed)} blobs ({freed} bytes); {len(referenced)} referenced.")
+        return
+
+    if args.command == "search-evidence":
+        from research_agent.evidence.store import EvidenceStore
+
+        setup_logging(level=log_level)
+        store = EvidenceStore(Path(config.storage.sqlite_path))
+        store.init()
+        try:
+            hits = store.search_evidence(args.query, limit=args.limit)
+        finally:
+            store.close()
+        for hit in hits:
+            logger.info(f"{hit.score:6.2f} {hit.kind:<11} {hit.title or hit.doc_id} <{hit.url}>")
+            logger.info(f"       {hit.snippet}")
+        logger.info(f"{len(hits)} hits.")
+        return
+
+    if args.command == "index-sources":
+        from research_agent.blobs.store import BlobStore
+        from research_agent.evidence.store import EvidenceStore
+
+        setup_logging(level=log_level)
+        store = EvidenceStore(Path(config.storage.sqlite_path))
+        store.init()
+        blobs = BlobStore.from_config(config.storage)
+        indexed = 0
+        try:
+            pending = store.unindexed_sources()
+            for doc_id, title, text_hash in pending:
+                if blobs.find(text_hash) is None:
+                    logger.warning(f"Parsed text for {doc_id} is no longer stored; skipping")
+                    continue
+                store.index_source_text(doc_id, title, blobs.get_bytes(text_hash).decode("utf-8"))
+                indexed += 1
+        finally:
+            store.close()
+        logger.info(f"Indexed {indexed} of {len(pending)} unindexed sources.")
+        return
+
     if args.command == "run":
         from research_agent.runner import run
 
         # Console-only logging initially; runner sets up file logging after creating run_dir
         setup_logging(level=log_level)
 
+        if args.cache_only:
+            config.cache.http_mode = "cache_only"
+        if args.replay_warc:
+            config.storage.warc_replay = True
         sources_path = Path(args.sources) if args.sources else None
         input_dir = Path(args.input_dir) if args.input_dir else None
         try:
@@ -126,15 +229,16 @@ def main() -> None:
             thinking_extent=config.agent.thinking.extent,
             override=args.model,
         )
-        response = routed.client.chat(
-            [
-                {
-                    "role": "user",
-                    "content": args.prompt,
-                }
-            ],
-            max_tokens=32,
-        )
+        with routed.client:
+            response = routed.client.chat(
+                [
+                    {
+                        "role": "user",
+                        "content": args.prompt,
+                    }
+                ],
+                max_tokens=32,
+            )
         logger.info(f"Model: {routed.name}")
         logger.info(response)
         return
@@ -152,6 +256,7 @@ def main() -> None:
             output_dir=output_dir,
             temperature_override=args.temperature,
             enable_llm_judge=args.enable_llm_judge,
+            use_llm_cache=args.llm_cache,
         )
         logger.success(f"Eval run complete: {run_dir}")
         return
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 import os
 
 import yaml
 
+# off: always GET; revalidate: conditional GET once stale; cache_only: never touch the network.
+HTTP_CACHE_MODES = ("off", "revalidate", "cache_only")
+
 
 @dataclass
 class ThinkingConfig:
@@ -21,6 +24,10 @@ class ThinkingConfig:
 class AgentConfig:
     mode: str
     thinking: ThinkingConfig
+    # "staged" finishes each step for all documents before the next; "streaming"
+    # overlaps search, fetch, parse and extraction per document.
+    pipeline: str = "staged"
+    pipeline_queue_size: int = 8
 
 
 @dataclass
@@ -30,6 +37,11 @@ class SearchConfig:
     freshness_days: int
     safe_mode: str
     api_budget_usd: float
+    # Providers are queried concurrently; each gets ``provider_timeout_s`` (or its
+    # entry in ``provider_timeouts``) and the whole fan-out stops at ``deadline_s``.
+    provider_timeout_s: float = 10.0
+    provider_timeouts: dict[str, float] = field(default_factory=dict)
+    deadline_s: float = 20.0
 
 
 @dataclass
@@ -37,6 +49,14 @@ class StorageConfig:
     sqlite_path: Path
     warc_dir: Path
     runs_dir: Path
+    blobs_dir: Path = Path("./data/blobs")
+    # none | gzip | zstd (zstd needs the optional zstandard package)
+    blob_compression: str = "none"
+    # Append every network response to rolling gzip WARC files under warc_dir.
+    warc_capture: bool = True
+    warc_max_file_mb: float = 1024.0
+    # Serve fetches from captured WARC records only; nothing touches the network.
+    warc_replay: bool = False
 
 
 @dataclass
@@ -44,6 +64,10 @@ class ModelEndpointConfig:
     api_base: str
     model_name: str
     timeout_s: int
+    max_connections: int = 16
+    max_keepalive_connections: int = 8
+    keepalive_expiry_s: float = 30.0
+    http2: bool = False
 
 
 @dataclass
@@ -58,6 +82,49 @@ class RoutingConfig:
     heavy_uses_openrouter: bool
 
 
+@dataclass
+class FetchConfig:
+    timeout_s: int = 30
+    max_concurrency: int = 8
+    per_host_concurrency: int = 2
+    # Downloads past this size are aborted; bodies past spool_mb go straight to the blob store.
+    max_body_mb: float = 50.0
+    spool_mb: float = 8.0
+    # Politeness: at most one request per host_delay_s to a host (bursts of host_burst),
+    # slowed to the host's robots.txt crawl delay when that is longer.
+    host_delay_s: float = 1.0
+    host_burst: int = 1
+    respect_robots: bool = True
+    robots_ttl_hours: float = 24.0
+    user_agent: str = "research-agent"
+
+
+@dataclass
+class ParseConfig:
+    # 0 picks a worker count from the CPU count; 1 disables the process pool.
+    pdf_workers: int = 0
+
+
+@dataclass
+class CacheConfig:
+    llm_enabled: bool = True
+    llm_max_entries: int = 20000
+    llm_max_age_days: int = 30
+    parse_enabled: bool = True
+    extraction_enabled: bool = True
+    labels_enabled: bool = True
+    search_enabled: bool = True
+    search_ttl_hours: float = 24.0
+    # Per-provider TTL overrides, e.g. {"google_pse": 72}.
+    search_ttls_hours: dict[str, float] = field(default_factory=dict)
+    # How long past its TTL an entry is still served while it is refreshed.
+    search_stale_hours: float = 168.0
+    # off | revalidate | cache_only (replay stored sources without network)
+    http_mode: str = "revalidate"
+    # Sources fetched within this window are reused without contacting the origin.
+    http_fresh_hours: float = 1.0
+
+
 @dataclass
 class AppConfig:
     agent: AgentConfig
@@ -65,6 +132,9 @@ class AppConfig:
     storage: StorageConfig
     models: ModelsConfig
     routing: RoutingConfig
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    fetch: FetchConfig = field(default_factory=FetchConfig)
+    parse: ParseConfig = field(default_factory=ParseConfig)
 
 
 def load_config(path: Path) -> AppConfig:
@@ -88,6 +158,9 @@ def _from_dict(data: dict[str, Any]) -> AppConfig:
     models_data = _get_map(data, "models")
     model_data = _get_map(data, "model")
     routing_data = _get_map(data, "routing")
+    cache_data = _get_map(data, "cache")
+    fetch_data = _get_map(data, "fetch")
+    parse_data = _get_map(data, "parse")
 
     thinking = ThinkingConfig(
         extent=str(thinking_data.get("extent", "medium")),
@@ -100,6 +173,8 @@ def _from_dict(data: dict[str, Any]) -> AppConfig:
     agent = AgentConfig(
         mode=str(agent_data.get("mode", "native")),
         thinking=thinking,
+        pipeline=str(agent_data.get("pipeline", "staged")),
+        pipeline_queue_size=int(agent_data.get("pipeline_queue_size", 8)),
     )
 
     providers_raw = search_data.get("providers", ["brave", "google_pse", "tavily", "serper"])
@@ -110,12 +185,22 @@ def _from_dict(data: dict[str, Any]) -> AppConfig:
         freshness_days=int(search_data.get("freshness_days", 365)),
         safe_mode=str(search_data.get("safe_mode", "standard")),
         api_budget_usd=float(search_data.get("api_budget_usd", 0.5)),
+        provider_timeout_s=float(search_data.get("provider_timeout_s", 10.0)),
+        provider_timeouts={
+            str(name): float(value) for name, value in _get_map(search_data, "provider_timeouts").items()
+        },
+        deadline_s=float(search_data.get("deadline_s", 20.0)),
     )
 
     storage = StorageConfig(
         sqlite_path=Path(storage_data.get("sqlite_path", "./data/agent.db")),
         warc_dir=Path(storage_data.get("warc_dir", "./warc")),
         runs_dir=Path(storage_data.get("runs_dir", "./runs")),
+        blobs_dir=Path(storage_data.get("blobs_dir", "./data/blobs")),
+        blob_compression=str(storage_data.get("blob_compression", "none")),
+        warc_capture=_to_bool(storage_data.get("warc_capture"), default=True),
+        warc_max_file_mb=float(storage_data.get("warc_max_file_mb", 1024.0)),
+        warc_replay=_to_bool(storage_data.get("warc_replay"), default=False),
     )
 
     models = _load_models_config(models_data, model_data)
@@ -123,7 +208,48 @@ def _from_dict(data: dict[str, Any]) -> AppConfig:
         heavy_uses_openrouter=_to_bool(routing_data.get("heavy_uses_openrouter"), default=True),
     )
 
-    return AppConfig(agent=agent, search=search, storage=storage, models=models, routing=routing)
+    cache = CacheConfig(
+        llm_enabled=_to_bool(cache_data.get("llm_enabled"), default=True),
+        llm_max_entries=int(cache_data.get("llm_max_entries", 20000)),
+        llm_max_age_days=int(cache_data.get("llm_max_age_days", 30)),
+        parse_enabled=_to_bool(cache_data.get("parse_enabled"), default=True),
+        extraction_enabled=_to_bool(cache_data.get("extraction_enabled"), default=True),
+        labels_enabled=_to_bool(cache_data.get("labels_enabled"), default=True),
+        search_enabled=_to_bool(cache_data.get("search_enabled"), default=True),
+        search_ttl_hours=float(cache_data.get("search_ttl_hours", 24.0)),
+        search_ttls_hours={
+            str(name): float(value) for name, value in _get_map(cache_data, "search_ttls_hours").items()
+        },
+        search_stale_hours=float(cache_data.get("search_stale_hours", 168.0)),
+        http_mode=_http_mode(cache_data.get("http_mode", "revalidate")),
+        http_fresh_hours=float(cache_data.get("http_fresh_hours", 1.0)),
+    )
+
+    fetch = FetchConfig(
+        timeout_s=int(fetch_data.get("timeout_s", 30)),
+        max_concurrency=int(fetch_data.get("max_concurrency", 8)),
+        per_host_concurrency=int(fetch_data.get("per_host_concurrency", 2)),
+        max_body_mb=float(fetch_data.get("max_body_mb", 50.0)),
+        spool_mb=float(fetch_data.get("spool_mb", 8.0)),
+        host_delay_s=float(fetch_data.get("host_delay_s", 1.0)),
+        host_burst=int(fetch_data.get("host_burst", 1)),
+        respect_robots=_to_bool(fetch_data.get("respect_robots"), default=True),
+        robots_ttl_hours=float(fetch_data.get("robots_ttl_hours", 24.0)),
+        user_agent=str(fetch_data.get("user_agent", "research-agent")),
+    )
+
+    parse = ParseConfig(pdf_workers=int(parse_data.get("pdf_workers", 0)))
+
+    return AppConfig(
+        agent=agent,
+        search=search,
+        storage=storage,
+        models=models,
+        routing=routing,
+        cache=cache,
+        fetch=fetch,
+        parse=parse,
+    )
 
 
 def _apply_env_overrides(config: AppConfig) -> None:
@@ -196,9 +322,20 @@ def _endpoint_from(
         api_base=str(data.get("api_base", default_base)),
         model_name=str(data.get("model_name", default_name)),
         timeout_s=int(data.get("timeout_s", default_timeout)),
+        max_connections=int(data.get("max_connections", 16)),
+        max_keepalive_connections=int(data.get("max_keepalive_connections", 8)),
+        keepalive_expiry_s=float(data.get("keepalive_expiry_s", 30.0)),
+        http2=_to_bool(data.get("http2"), default=False),
     )
 
 
+def _http_mode(value: Any) -> str:
+    mode = str(value).strip().lower()
+    if mode not in HTTP_CACHE_MODES:
+        raise ValueError(f"cache.http_mode must be one of {', '.join(HTTP_CACHE_MODES)}; got {value!r}.")
+    return mode
+
+
 def _get_map(data: dict[str, Any], key: str) -> dict[str, Any]:
     value = data.get(key, {})
     if isinstance(value, dict):
@@ -0,0 +1,4 @@
+ALTER TABLE run_sources ADD COLUMN text_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_run_sources_content_hash ON run_sources(content_hash);
+CREATE INDEX IF NOT EXISTS idx_run_sources_text_hash ON run_sources(text_hash);
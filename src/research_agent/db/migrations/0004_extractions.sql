@@ -0,0 +1,10 @@
+CREATE TABLE IF NOT EXISTS extractions (
+    doc_id TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    proposition_ids_json TEXT NOT NULL,
+    extracted_at TEXT NOT NULL,
+    PRIMARY KEY (doc_id, text_hash, model, fingerprint),
+    FOREIGN KEY(doc_id) REFERENCES source_docs(id)
+);
@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS label_memo (
+    signature TEXT NOT NULL,
+    quote_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    label TEXT NOT NULL,
+    labelled_at TEXT NOT NULL,
+    PRIMARY KEY (signature, quote_hash, model, prompt_version)
+);
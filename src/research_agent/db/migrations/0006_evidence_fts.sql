@@ -0,0 +1,44 @@
+-- Full-text indexes over extracted claims and parsed source text. Rows share
+-- rowids with propositions and source_docs so updates never scan the index.
+CREATE VIRTUAL TABLE IF NOT EXISTS propositions_fts USING fts5(
+    claim_text,
+    quote,
+    tokenize = 'porter unicode61'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS source_text_fts USING fts5(
+    title,
+    body,
+    tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS propositions_fts_insert AFTER INSERT ON propositions BEGIN
+    INSERT INTO propositions_fts (rowid, claim_text, quote)
+    VALUES (
+        new.rowid,
+        json_extract(new.payload_json, '$.claim_text'),
+        json_extract(new.payload_json, '$.quote')
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS propositions_fts_update AFTER UPDATE ON propositions BEGIN
+    DELETE FROM propositions_fts WHERE rowid = old.rowid;
+    INSERT INTO propositions_fts (rowid, claim_text, quote)
+    VALUES (
+        new.rowid,
+        json_extract(new.payload_json, '$.claim_text'),
+        json_extract(new.payload_json, '$.quote')
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS propositions_fts_delete AFTER DELETE ON propositions BEGIN
+    DELETE FROM propositions_fts WHERE rowid = old.rowid;
+END;
+
+CREATE TRIGGER IF NOT EXISTS source_text_fts_delete AFTER DELETE ON source_docs BEGIN
+    DELETE FROM source_text_fts WHERE rowid = old.rowid;
+END;
+
+INSERT INTO propositions_fts (rowid, claim_text, quote)
+SELECT rowid, json_extract(payload_json, '$.claim_text'), json_extract(payload_json, '$.quote')
+FROM propositions;
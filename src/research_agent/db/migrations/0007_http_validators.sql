@@ -0,0 +1,4 @@
+ALTER TABLE source_docs ADD COLUMN etag TEXT;
+ALTER TABLE source_docs ADD COLUMN last_modified TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_source_docs_url_retrieved ON source_docs(url, retrieved_at);
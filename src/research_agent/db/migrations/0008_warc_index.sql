@@ -0,0 +1,15 @@
+CREATE TABLE IF NOT EXISTS warc_records (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  url TEXT NOT NULL,
+  target_uri TEXT NOT NULL,
+  digest TEXT NOT NULL,
+  warc_file TEXT NOT NULL,
+  offset INTEGER NOT NULL,
+  length INTEGER NOT NULL,
+  status INTEGER NOT NULL,
+  content_type TEXT,
+  retrieved_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_warc_records_url ON warc_records(url, retrieved_at);
+CREATE INDEX IF NOT EXISTS idx_warc_records_target ON warc_records(target_uri, retrieved_at);
@@ -0,0 +1,4 @@
+-- The URL a fetch asked for; source_docs.url is the final URL after redirects.
+ALTER TABLE source_docs ADD COLUMN requested_url TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_source_docs_requested_retrieved ON source_docs(requested_url, retrieved_at);
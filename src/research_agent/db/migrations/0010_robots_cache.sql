@@ -0,0 +1,9 @@
+-- Per-host robots.txt decisions, reused across runs until expires_at.
+-- body is NULL for fixed decisions: allow_all=1 (no robots.txt) or 0 (unreachable).
+CREATE TABLE IF NOT EXISTS robots_rules (
+    host TEXT PRIMARY KEY,
+    body TEXT,
+    allow_all INTEGER NOT NULL,
+    fetched_at TEXT NOT NULL,
+    expires_at TEXT NOT NULL
+);
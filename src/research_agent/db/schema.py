@@ -6,7 +6,30 @@ from pathlib import Path
 import sqlite3
 
 
-MIGRATIONS = ["0001_init.sql", "0002_claim_text_and_run_sources.sql"]
+MIGRATIONS = [
+    "0001_init.sql",
+    "0002_claim_text_and_run_sources.sql",
+    "0003_run_source_blobs.sql",
+    "0004_extractions.sql",
+    "0005_label_memo.sql",
+    "0006_evidence_fts.sql",
+    "0007_http_validators.sql",
+    "0008_warc_index.sql",
+    "0009_source_requested_url.sql",
+    "0010_robots_cache.sql",
+]
+
+
+# Connection profile for the evidence store: WAL lets readers proceed during writes and
+# synchronous=NORMAL only fsyncs at checkpoints, which is safe under WAL.
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("foreign_keys", "ON"),
+    ("cache_size", "-20000"),
+    ("mmap_size", "268435456"),
+    ("temp_store", "MEMORY"),
+)
 
 
 @dataclass
@@ -18,8 +41,7 @@ class MigrationResult:
 def apply_migrations(db_path: Path) -> list[MigrationResult]:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA journal_mode=WAL;")
-    conn.execute("PRAGMA foreign_keys=ON;")
+    apply_pragmas(conn)
     conn.row_factory = sqlite3.Row
 
     results: list[MigrationResult] = []
@@ -46,3 +68,8 @@ def apply_migrations(db_path: Path) -> list[MigrationResult]:
 
     conn.close()
     return results
+
+
+def apply_pragmas(conn: sqlite3.Connection) -> None:
+    for name, value in PRAGMAS:
+        conn.execute(f"PRAGMA {name}={value};")
@@ -19,7 +19,8 @@ from research_agent.evals.stages import (
 )
 from research_agent.evals.stats import binomial_tail_p_value
 from research_agent.evals.utils import load_document_text
-from research_agent.llm.router import get_model_client
+from research_agent.llm.router import RoutedModel, get_model_client
+from research_agent.parse.cache import ParseCache
 
 
 @dataclass
@@ -50,6 +51,7 @@ def run_suite(
     output_dir: Path | None = None,
     temperature_override: float | None = None,
     enable_llm_judge: bool = False,
+    use_llm_cache: bool = False,
 ) -> Path:
     suite = load_suite(suite_path)
     fixtures_dir = _resolve_fixtures_dir(suite_path, suite.fixtures_dir)
@@ -59,21 +61,29 @@ def run_suite(
     run_dir.mkdir(parents=True, exist_ok=True)
 
     summaries: list[CaseSummary] = []
-    for case in suite.cases:
-        temperatures = _resolve_temperatures(suite, case, temperature_override)
-        for temperature in temperatures:
-            summary = _run_case(
-                case=case,
-                suite=suite,
-                config=config,
-                trials_override=trials_override,
-                model_override=model_override,
-                run_dir=run_dir,
-                fixtures_dir=fixtures_dir,
-                temperature=temperature,
-                enable_llm_judge=enable_llm_judge,
-            )
-            summaries.append(summary)
+    clients = _ClientPool(config)
+    parse_cache = ParseCache.from_config(config)
+    try:
+        for case in suite.cases:
+            temperatures = _resolve_temperatures(suite, case, temperature_override)
+            for temperature in temperatures:
+                summary = _run_case(
+                    case=case,
+                    suite=suite,
+                    config=config,
+                    clients=clients,
+                    trials_override=trials_override,
+                    model_override=model_override,
+                    run_dir=run_dir,
+                    fixtures_dir=fixtures_dir,
+                    parse_cache=parse_cache,
+                    temperature=temperature,
+                    enable_llm_judge=enable_llm_judge,
+                    use_llm_cache=use_llm_cache,
+                )
+                summaries.append(summary)
+    finally:
+        clients.close()
 
     summary_payload = {
         "suite_id": suite.suite_id,
@@ -92,21 +102,20 @@ def _run_case(
     case: EvalCase,
     suite: EvalSuite,
     config: AppConfig,
+    clients: _ClientPool,
     trials_override: int | None,
     model_override: str | None,
     run_dir: Path,
     fixtures_dir: Path,
+    parse_cache: ParseCache | None,
     temperature: float,
     enable_llm_judge: bool,
+    use_llm_cache: bool,
 ) -> CaseSummary:
     trials = trials_override or case.trials or suite.trials
     thinking_extent = case.thinking_extent or suite.thinking_extent or config.agent.thinking.extent
     case_model = case.model or suite.model
-    routed = get_model_client(
-        config,
-        thinking_extent=thinking_extent,
-        override=model_override or case_model,
-    )
+    routed = clients.get(thinking_extent, model_override or case_model)
 
     successes = 0
     failures = 0
@@ -114,8 +123,19 @@ def _run_case(
     trial_details: list[dict[str, Any]] = []
     case_key = f"{case.case_id}_t{temperature:g}"
     for trial_index in range(1, trials + 1):
-        recording_client = RecordingClient(routed.client, override_temperature=temperature)
-        stage_result = _run_stage(case, recording_client, fixtures_dir, thinking_extent, temperature)
+        recording_client = RecordingClient(
+            routed.client,
+            override_temperature=temperature,
+            use_cache=use_llm_cache,
+        )
+        stage_result = _run_stage(
+            case,
+            recording_client,
+            fixtures_dir,
+            thinking_extent,
+            temperature,
+            parse_cache,
+        )
         trial_judge = LLMJudge(
             enabled=enable_llm_judge,
             llm_client=recording_client if enable_llm_judge else None,
@@ -190,6 +210,7 @@ def _run_stage(
     fixtures_dir: Path,
     thinking_extent: str,
     temperature: float,
+    parse_cache: ParseCache | None = None,
 ) -> Any:
     stage = case.stage
     inputs = case.inputs
@@ -197,7 +218,7 @@ def _run_stage(
     if "documents" in inputs:
         for doc in inputs.get("documents", []):
             if isinstance(doc, dict):
-                documents.append(load_document_text(doc, fixtures_dir))
+                documents.append(load_document_text(doc, fixtures_dir, parse_cache))
 
     if stage == "extract_propositions":
         return run_extract_propositions(
@@ -287,18 +308,54 @@ def _resolve_temperatures(
     return [0.1]
 
 
+class _ClientPool:
+    """Shares one pooled LLM client per routing choice across the whole suite."""
+
+    def __init__(self, config: AppConfig) -> None:
+        self._config = config
+        self._routed: dict[tuple[str, str | None], RoutedModel] = {}
+
+    def get(self, thinking_extent: str, override: str | None) -> RoutedModel:
+        key = (thinking_extent, override)
+        if key not in self._routed:
+            self._routed[key] = get_model_client(
+                self._config,
+                thinking_extent=thinking_extent,
+                override=override,
+            )
+        return self._routed[key]
+
+    def close(self) -> None:
+        for routed in self._routed.values():
+            routed.client.close()
+        self._routed.clear()
+
+
 class RecordingClient:
-    def __init__(self, client, override_temperature: float | None = None) -> None:
+    """Records raw calls for a trial; bypasses the response cache so trials stay independent."""
+
+    def __init__(
+        self,
+        client,
+        override_temperature: float | None = None,
+        use_cache: bool = False,
+    ) -> None:
         self._client = client
         self.calls: list[dict[str, Any]] = []
         self.override_temperature = override_temperature
+        self.use_cache = use_cache
         self.model_name = client.model_name
         self.api_base = client.api_base
 
     def chat(self, messages, temperature: float = 0.2, max_tokens: int = 512) -> str:
         if self.override_temperature is not None:
             temperature = self.override_temperature
-        response = self._client.chat(messages, temperature=temperature, max_tokens=max_tokens)
+        response = self._client.chat(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            use_cache=self.use_cache,
+        )
         self.calls.append(
             {
                 "messages": messages,
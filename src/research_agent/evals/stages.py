@@ -6,7 +6,7 @@ from typing import Any
 
 from research_agent.evidence.adjudicate import label_evidence
 from research_agent.evidence.reduce import reduce_evidence
-from research_agent.evidence.extract import extract_propositions
+from research_agent.evidence.extract import extract_propositions_many
 from research_agent.evidence.policy import policy_for_extent
 from research_agent.llm.client import OpenAICompatClient
 from research_agent.types import DocumentText, Proposition
@@ -26,8 +26,8 @@ def run_extract_propositions(
 ) -> StageResult:
     policy = policy_for_extent(thinking_extent)
     propositions: list[Proposition] = []
-    for doc in documents:
-        propositions.extend(extract_propositions(doc, llm_client, policy))
+    for doc_props in extract_propositions_many(documents, llm_client, policy):
+        propositions.extend(doc_props)
     payload = {"propositions": to_jsonable(propositions)}
     return StageResult(payload=payload, errors=[])
 
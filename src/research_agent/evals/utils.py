@@ -3,16 +3,21 @@ from __future__ import annotations
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
+import hashlib
 import json
 import re
 from typing import Any, Iterable
 
-from research_agent.parse.html import extract_text as extract_html_text
-from research_agent.parse.pdf import extract_text as extract_pdf_text
+from research_agent.parse.cache import ParseCache
+from research_agent.parse.source import parse_source
 from research_agent.types import DocumentText
 
 
-def load_document_text(doc_input: dict[str, Any], fixtures_dir: Path | None) -> DocumentText:
+def load_document_text(
+    doc_input: dict[str, Any],
+    fixtures_dir: Path | None,
+    parse_cache: ParseCache | None = None,
+) -> DocumentText:
     doc_id = str(doc_input.get("doc_id", "doc"))
     title = str(doc_input.get("title", ""))
     url = str(doc_input.get("url", ""))
@@ -21,6 +26,7 @@ def load_document_text(doc_input: dict[str, Any], fixtures_dir: Path | None) ->
     content_type = str(doc_input.get("content_type", "text/plain"))
     text = str(doc_input.get("text", ""))
     format_hint = str(doc_input.get("format", "")).lower()
+    content_hash = ""
 
     if fixture:
         fixture_path = Path(fixture)
@@ -29,16 +35,14 @@ def load_document_text(doc_input: dict[str, Any], fixtures_dir: Path | None) ->
             fixture_path = (base / fixture).resolve()
         suffix = fixture_path.suffix.lower()
         if format_hint == "pdf" or suffix == ".pdf":
-            text = extract_pdf_text(fixture_path.read_bytes())
             content_type = "application/pdf"
+        elif format_hint == "html" or suffix in {".html", ".htm"}:
+            content_type = "text/html"
         else:
-            raw_text = fixture_path.read_text()
-            if format_hint == "html" or suffix in {".html", ".htm"}:
-                text = extract_html_text(raw_text)
-                content_type = "text/html"
-            else:
-                text = raw_text
-                content_type = "text/plain"
+            content_type = "text/plain"
+        raw = fixture_path.read_bytes()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        text = parse_source(raw, content_type, content_hash=content_hash, cache=parse_cache).text
 
     return DocumentText(
         doc_id=doc_id,
@@ -46,7 +50,7 @@ def load_document_text(doc_input: dict[str, Any], fixtures_dir: Path | None) ->
         title=title,
         snippet=snippet,
         text=text,
-        content_hash="",
+        content_hash=content_hash,
         content_type=content_type,
         retrieved_at=datetime.utcnow(),
         engine=None,
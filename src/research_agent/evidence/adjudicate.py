@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import hashlib
 import json
 import re
 from typing import Any
 
 from research_agent.evidence.policy import EvidencePolicy
+from research_agent.evidence.store import EvidenceStore
 from research_agent.llm.client import OpenAICompatClient
+from research_agent.logging import trace
+
+# Bump when the labelling prompts change so memoized labels are not reused.
+PROMPT_VERSION = "1"
+_LABELS = frozenset({"support", "refute", "neutral"})
 
 
 @dataclass
@@ -21,6 +28,65 @@ def label_evidence(
     llm_client: OpenAICompatClient,
     policy: EvidencePolicy,
 ) -> list[str]:
+    return _with_defaults(_label_claim(claim_text, evidence, llm_client, policy))
+
+
+def label_evidence_batch(
+    claims: list[tuple[str, list[dict[str, Any]]]],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[list[str]]:
+    """Label several claims' evidence with one prompt.
+
+    Claims whose labels are missing from the response are relabelled with their
+    own ``label_evidence`` call. A single-claim batch uses the per-claim prompt.
+    """
+    return [_with_defaults(labels) for labels in label_evidence_batch_raw(claims, llm_client, policy)]
+
+
+def label_evidence_batch_raw(
+    claims: list[tuple[str, list[dict[str, Any]]]],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[list[str | None]]:
+    """Like ``label_evidence_batch``, but None marks a quote no reply labelled.
+
+    Only real labels may be memoized; a None slot is shown as neutral but asked again next run.
+    """
+    if len(claims) == 1:
+        claim_text, evidence = claims[0]
+        return [_label_claim(claim_text, evidence, llm_client, policy)]
+
+    limited = [(claim_text, evidence[: policy.max_evidence_per_claim]) for claim_text, evidence in claims]
+    total_quotes = sum(len(evidence) for _, evidence in limited)
+    response = llm_client.chat(
+        [
+            {"role": "system", "content": "You label evidence as support, refute, or neutral."},
+            {"role": "user", "content": _build_batch_prompt(limited)},
+        ],
+        temperature=0.1,
+        max_tokens=max(400, 24 * total_quotes),
+    )
+    parsed = _parse_batch_labels(response, [len(evidence) for _, evidence in limited])
+
+    results: list[list[str | None]] = []
+    fallbacks = 0
+    for (claim_text, evidence), labels in zip(limited, parsed):
+        if labels is None and evidence:
+            fallbacks += 1
+            results.append(_label_claim(claim_text, evidence, llm_client, policy))
+        else:
+            results.append(list(labels or []))
+    trace("adjudication_batch", claims=len(claims), quotes=total_quotes, fallbacks=fallbacks)
+    return results
+
+
+def _label_claim(
+    claim_text: str,
+    evidence: list[dict[str, Any]],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[str | None]:
     if not evidence:
         return []
 
@@ -34,10 +100,68 @@ def label_evidence(
         temperature=0.1,
         max_tokens=400,
     )
-    labels = _parse_labels(response, len(limited))
-    if not labels:
-        labels = ["neutral"] * len(limited)
-    return labels
+    return _parse_labels(response, len(limited))
+
+
+def _with_defaults(labels: list[str | None]) -> list[str]:
+    return [label or "neutral" for label in labels]
+
+
+def recall_labels(
+    store: EvidenceStore,
+    signature: str,
+    evidence: list[dict[str, Any]],
+    model: str,
+) -> list[str | None]:
+    """Memoized label for each evidence item, or None where the quote is unseen."""
+    hashes = [quote_hash(item) for item in evidence]
+    known = store.load_labels(signature, hashes, model, PROMPT_VERSION)
+    return [known.get(digest) for digest in hashes]
+
+
+def remember_labels(
+    store: EvidenceStore,
+    signature: str,
+    evidence: list[dict[str, Any]],
+    labels: list[str],
+    model: str,
+) -> None:
+    store.save_labels(
+        signature,
+        {quote_hash(item): label for item, label in zip(evidence, labels)},
+        model,
+        PROMPT_VERSION,
+    )
+
+
+def quote_hash(item: dict[str, Any]) -> str:
+    quote = " ".join(str(item.get("quote", "")).split())
+    return hashlib.sha256(quote.encode("utf-8")).hexdigest()[:16]
+
+
+def pack_claim_batches(
+    claims: list[tuple[str, list[dict[str, Any]]]],
+    policy: EvidencePolicy,
+) -> list[list[int]]:
+    """Group claim indexes so each batch prompt stays within the policy token budget."""
+    budget = policy.adjudication_batch_tokens
+    if budget <= 0:
+        return [[idx] for idx in range(len(claims))]
+
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = _estimate_tokens(_build_batch_prompt([]))
+    for idx, (claim_text, evidence) in enumerate(claims):
+        cost = _estimate_tokens(_format_claim(idx, claim_text, evidence[: policy.max_evidence_per_claim]))
+        if current and used + cost > budget:
+            batches.append(current)
+            current = []
+            used = _estimate_tokens(_build_batch_prompt([]))
+        current.append(idx)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
 
 
 def _build_prompt(claim_text: str, evidence: list[dict[str, Any]]) -> str:
@@ -62,12 +186,62 @@ def _build_prompt(claim_text: str, evidence: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def _parse_labels(text: str, expected: int) -> list[str]:
-    data = _parse_json_list(text)
-    if not data:
-        return []
-    labels = ["neutral"] * expected
-    for item in data:
+def _build_batch_prompt(claims: list[tuple[str, list[dict[str, Any]]]]) -> str:
+    lines = [
+        "For each CLAIM, label each of its QUOTES as support, refute, or neutral for that claim.",
+        "Return JSON array only: [{\"claim\":0,\"index\":0,\"label\":\"support\"}, ...]",
+        "",
+    ]
+    for idx, (claim_text, evidence) in enumerate(claims):
+        lines.append(_format_claim(idx, claim_text, evidence))
+    return "\n".join(lines)
+
+
+def _format_claim(claim_index: int, claim_text: str, evidence: list[dict[str, Any]]) -> str:
+    lines = [f"CLAIM {claim_index}:", claim_text, "QUOTES:"]
+    for idx, item in enumerate(evidence):
+        lines.append(f"[{idx}] {item.get('quote', '')}")
+        title = str(item.get("title", ""))
+        if title:
+            lines.append(f"Source: {title}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _estimate_tokens(text: str) -> int:
+    # Rough English average; good enough for packing, not for hard limits.
+    return len(text) // 4 + 1
+
+
+def _parse_batch_labels(text: str, expected: list[int]) -> list[list[str] | None]:
+    """Per-claim labels, or None for claims the response did not fully cover."""
+    slots: list[list[str | None]] = [[None] * count for count in expected]
+    for item in _parse_json_list(text):
+        if not isinstance(item, dict):
+            continue
+        claim = item.get("claim")
+        index = item.get("index")
+        if not isinstance(claim, int) or not isinstance(index, int):
+            continue
+        if claim < 0 or claim >= len(expected) or index < 0 or index >= expected[claim]:
+            continue
+        label = str(item.get("label", "")).strip().lower()
+        if label in _LABELS:
+            slots[claim][index] = label
+    # A truncated reply must not pass off missing quotes as neutral.
+    return [_complete(claim_slots) for claim_slots in slots]
+
+
+def _complete(slots: list[str | None]) -> list[str] | None:
+    if not slots or any(label is None for label in slots):
+        return None
+    return [label for label in slots if label is not None]
+
+
+def _parse_labels(text: str, expected: int) -> list[str | None]:
+    """Label per quote, None where the response gave no valid label."""
+    labels: list[str | None] = [None] * expected
+    for item in _parse_json_list(text):
         if not isinstance(item, dict):
             continue
         index = item.get("index")
@@ -76,9 +250,8 @@ def _parse_labels(text: str, expected: int) -> list[str]:
             continue
         if index < 0 or index >= expected:
             continue
-        if label not in {"support", "refute", "neutral"}:
-            label = "neutral"
-        labels[index] = label
+        if label in _LABELS:
+            labels[index] = label
     return labels
 
 
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass
+import re
+
+_WORD_RE = re.compile(r"\w+")
+_RUN_RE = re.compile(r"\S+")
+
+# Lower rank wins when the same quote matches in several places.
+MATCH_MODES = ("exact", "casefold", "whitespace", "fuzzy")
+
+# Fuzzy matches below this similarity (1 - edits / quote length) are rejected.
+FUZZY_MIN_SCORE = 0.8
+# Words occurring more often than this in the search window are useless as seeds.
+_MAX_SEED_POSTINGS = 64
+
+
+@dataclass
+class AnchorMatch:
+    start: int
+    end: int
+    mode: str
+    score: float = 1.0
+
+
+class AnchorIndex:
+    """Quote lookup over one document, built once and reused for every proposition.
+
+    The document is case-folded and whitespace-collapsed into a normalized copy with
+    an offset map back to the original, and every word of that copy is indexed by
+    position. A quote is located by probing the positions of its rarest interior
+    word instead of scanning the document.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._norm, self._offsets = _normalize_with_offsets(text)
+        self._postings: dict[str, list[int]] = {}
+        for match in _WORD_RE.finditer(self._norm):
+            self._postings.setdefault(match.group(0), []).append(match.start())
+
+    def find(self, quote: str, within: tuple[int, int] | None = None) -> AnchorMatch | None:
+        """Locate ``quote``, preferring matches inside the ``within`` span of the original text.
+
+        Among equally placed matches an exact one beats a case-insensitive one, which
+        beats a whitespace-tolerant one; ties go to the earliest position.
+        """
+        needle = _normalize(quote)
+        if not needle:
+            return None
+        best: tuple[tuple[bool, int, int], AnchorMatch] | None = None
+        for norm_start in self._candidates(needle):
+            start = self._offsets.original(norm_start)
+            end = self._offsets.original(norm_start + len(needle) - 1) + 1
+            mode = _match_mode(self.text[start:end], quote)
+            outside = within is not None and not (within[0] <= start and end <= within[1])
+            key = (outside, MATCH_MODES.index(mode), start)
+            if best is None or key < best[0]:
+                best = (key, AnchorMatch(start=start, end=end, mode=mode))
+        return best[1] if best else None
+
+    def find_fuzzy(
+        self,
+        quote: str,
+        within: tuple[int, int] | None = None,
+        min_score: float = FUZZY_MIN_SCORE,
+        max_alignments: int = 3,
+    ) -> AnchorMatch | None:
+        """Approximately locate a quote the model paraphrased slightly.
+
+        Words shared with the quote vote for alignment diagonals in the normalized
+        text; the best few diagonals are aligned with an edit distance bounded by
+        ``min_score``. With ``within`` only that span of the original text is searched.
+        """
+        needle = _normalize(quote)
+        if not needle:
+            return None
+        if within is not None:
+            lo = self._offsets.normalized(within[0])
+            hi = self._offsets.normalized(within[1])
+        else:
+            lo, hi = 0, len(self._norm)
+
+        votes: Counter[int] = Counter()
+        for word in _WORD_RE.finditer(needle):
+            postings = self._postings.get(word.group(0))
+            if not postings:
+                continue
+            first, last = bisect_left(postings, lo), bisect_left(postings, hi)
+            if last - first > _MAX_SEED_POSTINGS:
+                continue
+            for position in postings[first:last]:
+                votes[position - word.start()] += 1
+
+        max_edits = int(len(needle) * (1.0 - min_score))
+        best: tuple[int, int, int] | None = None
+        tried: list[int] = []
+        for diagonal, _ in votes.most_common():
+            if len(tried) >= max_alignments:
+                break
+            if any(abs(diagonal - other) <= max_edits for other in tried):
+                continue
+            tried.append(diagonal)
+            window_start = max(lo, diagonal - max_edits)
+            window_end = min(hi, diagonal + len(needle) + max_edits)
+            aligned = _align(needle, self._norm[window_start:window_end], max_edits)
+            if aligned is not None and (best is None or aligned[0] < best[0]):
+                best = (aligned[0], window_start + aligned[1], window_start + aligned[2])
+        if best is None:
+            return None
+
+        edits, norm_start, norm_end = best
+        # Alignments can absorb a separator space at either edge; trim it.
+        while norm_start < norm_end and self._norm[norm_start] == " ":
+            norm_start += 1
+        while norm_end > norm_start and self._norm[norm_end - 1] == " ":
+            norm_end -= 1
+        if norm_start >= norm_end:
+            return None
+        return AnchorMatch(
+            start=self._offsets.original(norm_start),
+            end=self._offsets.original(norm_end - 1) + 1,
+            mode="fuzzy",
+            score=round(1.0 - edits / len(needle), 3),
+        )
+
+    def _candidates(self, needle: str) -> list[int]:
+        words = list(_WORD_RE.finditer(needle))
+        # Edge words may be partial ("oils at 100"), so only interior words are
+        # guaranteed to appear whole in the index.
+        interior = words[1:-1]
+        if not interior:
+            return _find_all(self._norm, needle)
+        probe = min(interior, key=lambda word: len(self._postings.get(word.group(0), ())))
+        offset = probe.start()
+        candidates: list[int] = []
+        for position in self._postings.get(probe.group(0), ()):
+            start = position - offset
+            if start >= 0 and self._norm.startswith(needle, start):
+                candidates.append(start)
+        return candidates
+
+
+def _align(needle: str, haystack: str, max_edits: int) -> tuple[int, int, int] | None:
+    """Best placement of ``needle`` anywhere in ``haystack`` by edit distance.
+
+    Returns ``(edits, start, end)`` within ``haystack``, or None when every
+    alignment needs more than ``max_edits`` edits. Uses Myers' bit-parallel
+    edit distance, so each haystack character costs a few integer operations
+    on ``len(needle)``-bit masks instead of a row of the full table.
+    """
+    scores = [len(needle)] + _edit_scores(needle, haystack, anchored=False)
+    edits, end = min((score, col) for col, score in enumerate(scores))
+    if edits > max_edits:
+        return None
+    # The shortest match ending at ``end`` at that cost: align the reversed
+    # needle against the reversed prefix, anchored at ``end``.
+    tail = _edit_scores(needle[::-1], haystack[end - 1 :: -1] if end else "", anchored=True)
+    length = next(col for col, score in enumerate(tail, start=1) if score == edits) if edits < len(needle) else 0
+    return edits, end - length, end
+
+
+def _edit_scores(pattern: str, text: str, anchored: bool) -> list[int]:
+    """Edit distance of ``pattern`` against ``text[:j]`` for each j >= 1.
+
+    Unanchored, the match may start anywhere in ``text``; anchored, it starts at 0.
+    """
+    size = len(pattern)
+    mask = (1 << size) - 1
+    high = 1 << (size - 1)
+    peq: dict[str, int] = {}
+    for bit, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << bit)
+    positive, negative, score = mask, 0, size
+    scores: list[int] = []
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | negative
+        xh = ((((eq & positive) + positive) & mask) ^ positive) | eq
+        ph = negative | (~(xh | positive) & mask)
+        mh = positive & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | anchored) & mask
+        mh = (mh << 1) & mask
+        positive = mh | (~(xv | ph) & mask)
+        negative = ph & xv
+        scores.append(score)
+    return scores
+
+
+def _match_mode(found: str, quote: str) -> str:
+    if found == quote.strip():
+        return "exact"
+    if found.casefold() == quote.strip().casefold():
+        return "casefold"
+    return "whitespace"
+
+
+def _normalize(text: str) -> str:
+    """Case-fold and collapse whitespace runs to one space, trimming both ends."""
+    return " ".join(run.casefold() for run in text.split())
+
+
+class _OffsetMap:
+    """Maps positions in the normalized text back to the original text.
+
+    One segment per whitespace-separated run keeps memory proportional to the
+    word count; runs whose case-folding changes length get one segment per char.
+    """
+
+    def __init__(self) -> None:
+        self.norm_starts = array("q")
+        self.orig_starts = array("q")
+        self.orig_lengths = array("q")
+
+    def add(self, norm_start: int, orig_start: int, orig_length: int) -> None:
+        self.norm_starts.append(norm_start)
+        self.orig_starts.append(orig_start)
+        self.orig_lengths.append(orig_length)
+
+    def normalized(self, orig_index: int) -> int:
+        segment = bisect_right(self.orig_starts, orig_index) - 1
+        if segment < 0:
+            return 0
+        delta = min(orig_index - self.orig_starts[segment], self.orig_lengths[segment])
+        return self.norm_starts[segment] + delta
+
+    def original(self, norm_index: int) -> int:
+        segment = bisect_right(self.norm_starts, norm_index) - 1
+        delta = min(norm_index - self.norm_starts[segment], self.orig_lengths[segment] - 1)
+        return self.orig_starts[segment] + delta
+
+
+def _normalize_with_offsets(text: str) -> tuple[str, _OffsetMap]:
+    parts: list[str] = []
+    offsets = _OffsetMap()
+    position = 0
+    for match in _RUN_RE.finditer(text):
+        run = match.group(0)
+        folded = run.casefold()
+        if parts:
+            parts.append(" ")
+            position += 1
+        if len(folded) == len(run):
+            offsets.add(position, match.start(), len(run))
+        else:
+            cursor = position
+            for index, char in enumerate(run):
+                offsets.add(cursor, match.start() + index, 1)
+                cursor += len(char.casefold())
+        parts.append(folded)
+        position += len(folded)
+    return "".join(parts), offsets
+
+
+def _find_all(haystack: str, needle: str) -> list[int]:
+    positions: list[int] = []
+    start = haystack.find(needle)
+    while start >= 0:
+        positions.append(start)
+        start = haystack.find(needle, start + 1)
+    return positions
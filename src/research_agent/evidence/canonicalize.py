@@ -1,18 +1,75 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import hashlib
+import random
 import re
+import zlib
 
+from loguru import logger
+
+from research_agent.evidence.relevance import tokenize
+from research_agent.logging import trace
 from research_agent.types import Proposition
 
+# Minimum token-set Jaccard similarity for two claims to share a signature.
+CLUSTER_THRESHOLD = 0.7
+
+# 16 bands of 4 rows: pairs at ~0.5 Jaccard or above almost always share a band.
+_BANDS = 16
+_ROWS = 4
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_BANDS * _ROWS)
+]
+
+_QUANTITY_RE = re.compile(
+    r"(?<![\w.])(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:°\s*|(?:degrees?|deg)\s+)?(%|[a-zµ]+\b)?",
+    re.IGNORECASE,
+)
+_UNIT_ALIASES = {
+    "c": "c",
+    "celsius": "c",
+    "f": "f",
+    "fahrenheit": "f",
+    "k": "k",
+    "kelvin": "k",
+    "%": "pct",
+    "percent": "pct",
+}
+_UNITS = frozenset(
+    (
+        "km m cm mm nm kg g mg µg l ml mph kph s ms h hr min "
+        "hz khz mhz ghz w kw mw v pa kpa atm psi ppm"
+    ).split()
+)
+_NEGATION_RE = re.compile(r"\b(?:not|no|never|cannot|without|neither|nor)\b|n't\b")
+
+
+@dataclass
+class ClaimFeatures:
+    tokens: frozenset[str]
+    # Number+unit tokens ("100c", "212f"); claims only merge when these agree.
+    quantities: frozenset[str]
+    negated: bool
+
 
 def canonicalize_propositions(propositions: list[Proposition]) -> list[Proposition]:
+    canonical_texts: list[str] = []
     for prop in propositions:
         claim_text = str(prop.payload.get("claim_text", "")).strip()
         canonical = normalize_claim_text(claim_text)
-        signature = signature_for_text(canonical)
         prop.payload["canonical_text"] = canonical
-        prop.payload["claim_signature"] = signature
+        canonical_texts.append(canonical)
+
+    representatives = cluster_claims(canonical_texts)
+    for prop, rep in zip(propositions, representatives):
+        prop.payload["claim_signature"] = signature_for_text(canonical_texts[rep])
+
+    clusters = len(set(representatives))
+    logger.debug(f"Clustered {len(propositions)} propositions into {clusters} claims")
+    trace("claims_clustered", propositions=len(propositions), clusters=clusters)
     return propositions
 
 
@@ -26,3 +83,77 @@ def signature_for_text(text: str) -> str:
     normalized = normalize_claim_text(text).lower()
     digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
     return digest
+
+
+def claim_features(text: str) -> ClaimFeatures:
+    quantities: set[str] = set()
+
+    def take_quantity(match: re.Match[str]) -> str:
+        number = match.group(1).replace(",", "")
+        unit = (match.group(2) or "").lower()
+        canonical = _UNIT_ALIASES.get(unit, unit if unit in _UNITS else "")
+        quantities.add(number + canonical)
+        # Unknown trailing words are ordinary text, not units.
+        return " " if canonical or not unit else f" {unit} "
+
+    remainder = _QUANTITY_RE.sub(take_quantity, text)
+    tokens = set(tokenize(remainder)) | quantities
+    return ClaimFeatures(
+        tokens=frozenset(tokens),
+        quantities=frozenset(quantities),
+        negated=_NEGATION_RE.search(text.lower()) is not None,
+    )
+
+
+def cluster_claims(texts: list[str], threshold: float = CLUSTER_THRESHOLD) -> list[int]:
+    """Map each text to the index of its cluster's first member.
+
+    MinHash signatures are banded into LSH buckets so each claim is only compared
+    with the cluster representatives it collides with, keeping the pass close to
+    linear. A claim joins the most similar colliding representative whose token
+    Jaccard reaches ``threshold`` and whose quantities and negation agree.
+    """
+    representatives: list[int] = []
+    exact: dict[str, int] = {}
+    features: dict[int, ClaimFeatures] = {}
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+
+    for index, text in enumerate(texts):
+        key = text.lower()
+        if key in exact:
+            representatives.append(representatives[exact[key]])
+            continue
+        exact[key] = index
+        current = claim_features(text)
+        features[index] = current
+        if not current.tokens:
+            representatives.append(index)
+            continue
+
+        bands = _bands(_minhash(current.tokens))
+        candidates = {rep for band in bands for rep in buckets.get(band, ())}
+        best_rep, best_score = index, 0.0
+        for rep in sorted(candidates):
+            other = features[rep]
+            if other.quantities != current.quantities or other.negated != current.negated:
+                continue
+            score = len(current.tokens & other.tokens) / len(current.tokens | other.tokens)
+            if score >= threshold and score > best_score:
+                best_rep, best_score = rep, score
+        representatives.append(best_rep)
+        if best_rep == index:
+            for band in bands:
+                buckets.setdefault(band, []).append(index)
+    return representatives
+
+
+def _minhash(tokens: frozenset[str]) -> list[int]:
+    hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+    return [min((a * value + b) % _PRIME for value in hashes) for a, b in _PERMUTATIONS]
+
+
+def _bands(signature: list[int]) -> list[tuple[int, tuple[int, ...]]]:
+    return [
+        (band, tuple(signature[band * _ROWS : (band + 1) * _ROWS]))
+        for band in range(_BANDS)
+    ]
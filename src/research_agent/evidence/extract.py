@@ -1,48 +1,173 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+import asyncio
 import hashlib
 import json
 import re
+import threading
 from typing import Any
 
 from loguru import logger
 
+from research_agent.evidence.anchors import AnchorIndex
 from research_agent.evidence.policy import EvidencePolicy
+from research_agent.evidence.relevance import select_chunks, tokenize
+from research_agent.evidence.store import EvidenceStore
 from research_agent.llm.client import OpenAICompatClient
 from research_agent.logging import trace
 from research_agent.types import Annotation, AnnotationSelector, DocumentText, Proposition
 
 
+# A unit ends after sentence punctuation (plus closing quotes/brackets) and the
+# whitespace that follows it, or at a blank line between paragraphs.
+_UNIT_BREAK = re.compile(r"\n[ \t]*\n\s*|(?<=[.!?])[\"')\]]*\s+")
+
+# Bump when the prompt or proposition assembly changes so stored extractions are not reused.
+EXTRACTION_VERSION = "1"
+
+# One chunk's extracted items; None when the model's reply could not be parsed.
+ChunkItems = list[dict[str, Any]] | None
+
+
 @dataclass
 class ExtractResult:
     propositions: list[Proposition]
 
 
+@dataclass
+class TextChunk:
+    text: str
+    # Offset of ``text`` within the source document.
+    start: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+
 def extract_propositions(
     document: DocumentText,
     llm_client: OpenAICompatClient,
     policy: EvidencePolicy,
+    question: str | None = None,
 ) -> list[Proposition]:
-    if not document.text.strip():
-        return []
+    return extract_propositions_many([document], llm_client, policy, question=question)[0]
+
+
+def extract_propositions_many(
+    documents: list[DocumentText],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+    question: str | None = None,
+    store: EvidenceStore | None = None,
+) -> list[list[Proposition]]:
+    """Extract propositions for several documents, one result list per document.
+
+    With a ``question``, chunks are ranked for relevance per document and across
+    the whole batch before any LLM call; otherwise each document's leading chunks
+    are used.
+
+    With ``policy.max_inflight_llm_requests > 1`` every chunk of every document is
+    dispatched at once through a bounded thread pool; results are still assembled in
+    chunk order so ``max_props_per_doc`` truncation is deterministic.
+
+    With a ``store``, a document whose text, model, question and extraction policy
+    match an earlier extraction gets that extraction's propositions back without any
+    LLM call; the others are extracted and recorded for next time, unless they came
+    back empty or with an unparseable reply. Chunks are planned for the remaining
+    documents only, so adding a document to a run costs that document's extraction.
+    """
+    results: list[list[Proposition] | None] = [None] * len(documents)
+    keys: list[tuple[str, str, str, str]] = []
+    if store is not None:
+        keys = [
+            _extraction_key(document, llm_client.model_name, policy, question)
+            for document in documents
+        ]
+        results = [store.load_extraction(*key) for key in keys]
+        reused = sum(1 for result in results if result is not None)
+        logger.info(f"Reusing stored extractions for {reused}/{len(documents)} documents")
+        trace("extractions_reused", reused=reused, total=len(documents))
+
+    pending = [idx for idx, result in enumerate(results) if result is None]
+    pending_docs = [documents[idx] for idx in pending]
+    pending_plans = _plan_chunks(pending_docs, policy, question, policy.max_chunks_per_run)
+    if policy.max_inflight_llm_requests <= 1:
+        chunk_items = _extract_serial(pending_docs, pending_plans, llm_client, policy)
+    else:
+        chunk_items = _extract_concurrent(pending_docs, pending_plans, llm_client, policy)
+
+    for idx, chunks, items_per_chunk in zip(pending, pending_plans, chunk_items):
+        propositions = _finish_document(documents[idx], chunks, items_per_chunk, llm_client, policy)
+        # Empty or partly unparsed results may be a model failure; extract again next run.
+        if store is not None and propositions and all(items is not None for items in items_per_chunk):
+            store.save_extraction(*keys[idx], propositions)
+        results[idx] = propositions
+    return [result or [] for result in results]
 
-    propositions: list[Proposition] = []
-    chunks = chunk_text(document.text, policy.chunk_chars, policy.chunk_overlap)
-    total_chunks = min(len(chunks), policy.max_chunks_per_doc)
-    for i, chunk in enumerate(chunks[: policy.max_chunks_per_doc], start=1):
-        if len(propositions) >= policy.max_props_per_doc:
-            break
-        logger.debug(f"Processing chunk {i}/{total_chunks} for {document.doc_id}")
-        items = _extract_from_chunk(document, chunk, llm_client, policy.max_props_per_chunk)
-        for item in items:
-            if len(propositions) >= policy.max_props_per_doc:
-                break
-            prop = _build_proposition(document, item, llm_client)
-            if prop:
-                propositions.append(prop)
 
+async def extract_propositions_async(
+    document: DocumentText,
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+    limiter: asyncio.Semaphore,
+    question: str | None = None,
+    store: EvidenceStore | None = None,
+    store_lock: threading.Lock | None = None,
+) -> list[Proposition]:
+    """Extract one document from a running event loop.
+
+    ``limiter`` is shared across every document in flight so the total number of
+    concurrent LLM requests stays at ``policy.max_inflight_llm_requests``. Chunk
+    relevance is ranked within the document only, since the rest of the run is
+    not known yet.
+
+    With a ``store``, extractions are reused and recorded as in
+    ``extract_propositions_many``; ``store_lock`` serializes access with other
+    threads writing through the same connection.
+    """
+    lock = store_lock or threading.Lock()
+    key = _extraction_key(document, llm_client.model_name, policy, question)
+    if store is not None:
+        stored = await asyncio.to_thread(_locked, lock, store.load_extraction, *key)
+        trace("extractions_reused", reused=int(stored is not None), total=1)
+        if stored is not None:
+            return stored
+
+    async def run_chunk(chunk: TextChunk) -> ChunkItems:
+        async with limiter:
+            return await asyncio.to_thread(
+                _extract_from_chunk,
+                document,
+                chunk.text,
+                llm_client,
+                policy.max_props_per_chunk,
+            )
+
+    chunks = _plan_chunks([document], policy, question, max_per_run=0)[0]
+    items_per_chunk = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+    propositions = _finish_document(document, chunks, list(items_per_chunk), llm_client, policy)
+    if store is not None and propositions and all(items is not None for items in items_per_chunk):
+        await asyncio.to_thread(_locked, lock, store.save_extraction, *key, propositions)
+    return propositions
+
+
+def _locked(lock: threading.Lock, fn: Any, *args: Any) -> Any:
+    with lock:
+        return fn(*args)
+
+
+def _finish_document(
+    document: DocumentText,
+    chunks: list[TextChunk],
+    items_per_chunk: list[ChunkItems],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[Proposition]:
+    propositions = _assemble_propositions(document, chunks, items_per_chunk, llm_client, policy)
     # Trace extracted propositions
     trace(
         "propositions_extracted",
@@ -52,12 +177,151 @@ def extract_propositions(
     return propositions
 
 
+def _plan_chunks(
+    documents: list[DocumentText],
+    policy: EvidencePolicy,
+    question: str | None,
+    max_per_run: int,
+) -> list[list[TextChunk]]:
+    chunked = [_document_chunks(doc, policy) for doc in documents]
+    selected = select_chunks(
+        question,
+        [[chunk.text for chunk in chunks] for chunks in chunked],
+        policy.max_chunks_per_doc,
+        max_per_run,
+    )
+    plans: list[list[TextChunk]] = []
+    for document, chunks, indexes in zip(documents, chunked, selected):
+        if question and chunks:
+            trace(
+                "chunks_selected",
+                doc_id=document.doc_id,
+                total=len(chunks),
+                selected=indexes,
+            )
+        plans.append([chunks[idx] for idx in indexes])
+    return plans
+
+
+def _extraction_key(
+    document: DocumentText,
+    model: str,
+    policy: EvidencePolicy,
+    question: str | None,
+) -> tuple[str, str, str, str]:
+    """(doc_id, text hash, model, fingerprint) identifying one extraction of a document.
+
+    Only per-document inputs go in: which chunks the run-wide ranking and run cap
+    pick depends on the other documents, and must not invalidate this one.
+    """
+    text_hash = hashlib.sha256(document.text.encode("utf-8")).hexdigest()
+    settings = {
+        "version": EXTRACTION_VERSION,
+        "max_props_per_chunk": policy.max_props_per_chunk,
+        "max_props_per_doc": policy.max_props_per_doc,
+        "max_chunks_per_doc": policy.max_chunks_per_doc,
+        "chunk_chars": policy.chunk_chars,
+        "chunk_overlap_sentences": policy.chunk_overlap_sentences,
+        "question": " ".join(tokenize(question or "")),
+    }
+    fingerprint = hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return document.doc_id, text_hash, model, fingerprint
+
+
+def _document_chunks(document: DocumentText, policy: EvidencePolicy) -> list[TextChunk]:
+    if not document.text.strip():
+        return []
+    return chunk_spans(document.text, policy.chunk_chars, policy.chunk_overlap_sentences)
+
+
+def _extract_serial(
+    documents: list[DocumentText],
+    plans: list[list[TextChunk]],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[list[ChunkItems]]:
+    chunk_items: list[list[ChunkItems]] = []
+    for document, chunks in zip(documents, plans):
+        doc_items: list[ChunkItems] = []
+        # Proposition ids, so duplicates from overlapping chunks count once, as in assembly.
+        seen: set[str] = set()
+        for i, chunk in enumerate(chunks, start=1):
+            if len(seen) >= policy.max_props_per_doc:
+                break
+            logger.debug(f"Processing chunk {i}/{len(chunks)} for {document.doc_id}")
+            items = _extract_from_chunk(document, chunk.text, llm_client, policy.max_props_per_chunk)
+            seen.update(
+                _make_prop_id(document.doc_id, _as_str(item.get("claim_text")), _as_str(item.get("quote")))
+                for item in items or []
+                if _is_complete(item)
+            )
+            doc_items.append(items)
+        chunk_items.append(doc_items)
+    return chunk_items
+
+
+def _extract_concurrent(
+    documents: list[DocumentText],
+    plans: list[list[TextChunk]],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[list[ChunkItems]]:
+    total = sum(len(chunks) for chunks in plans)
+    logger.debug(
+        f"Dispatching {total} chunks across {len(documents)} documents "
+        f"(max {policy.max_inflight_llm_requests} in flight)"
+    )
+    pool = ThreadPoolExecutor(max_workers=policy.max_inflight_llm_requests)
+    try:
+        futures = [
+            [
+                pool.submit(
+                    _extract_from_chunk,
+                    document,
+                    chunk.text,
+                    llm_client,
+                    policy.max_props_per_chunk,
+                )
+                for chunk in chunks
+            ]
+            for document, chunks in zip(documents, plans)
+        ]
+        return [[future.result() for future in doc_futures] for doc_futures in futures]
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _assemble_propositions(
+    document: DocumentText,
+    chunks: list[TextChunk],
+    items_per_chunk: list[ChunkItems],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[Proposition]:
+    propositions: list[Proposition] = []
+    seen: set[str] = set()
+    if not any(items_per_chunk):
+        return propositions
+    index = AnchorIndex(document.text)
+    for chunk, items in zip(chunks, items_per_chunk):
+        for item in items or []:
+            if len(propositions) >= policy.max_props_per_doc:
+                return propositions
+            prop = _build_proposition(document, item, llm_client, index, chunk)
+            # Overlapping sentences can yield the same proposition from two chunks.
+            if prop and prop.id not in seen:
+                seen.add(prop.id)
+                propositions.append(prop)
+    return propositions
+
+
 def _extract_from_chunk(
     document: DocumentText,
     chunk: str,
     llm_client: OpenAICompatClient,
     max_props: int,
-) -> list[dict[str, Any]]:
+) -> list[dict[str, Any]] | None:
+    """Items the model returned for one chunk, or None when its reply was not a JSON list."""
     prompt = _build_prompt(document, chunk, max_props)
     response = llm_client.chat(
         [
@@ -68,8 +332,8 @@ def _extract_from_chunk(
         max_tokens=900,
     )
     parsed = _parse_json_list(response)
-    if not parsed:
-        return []
+    if parsed is None:
+        return None
     return [item for item in parsed if isinstance(item, dict)]
 
 
@@ -88,10 +352,16 @@ def _build_prompt(document: DocumentText, chunk: str, max_props: int) -> str:
     )
 
 
+def _is_complete(item: dict[str, Any]) -> bool:
+    return bool(_as_str(item.get("claim_text")) and _as_str(item.get("quote")))
+
+
 def _build_proposition(
     document: DocumentText,
     item: dict[str, Any],
     llm_client: OpenAICompatClient,
+    index: AnchorIndex,
+    chunk: TextChunk | None = None,
 ) -> Proposition | None:
     claim_text = _as_str(item.get("claim_text"))
     quote = _as_str(item.get("quote"))
@@ -99,7 +369,7 @@ def _build_proposition(
     if not claim_text or not quote:
         return None
 
-    anchor = _make_anchor(document.text, quote, document.doc_id)
+    anchor = _make_anchor(index, quote, document.doc_id, chunk)
     anchors = [anchor] if anchor else []
     prop_id = _make_prop_id(document.doc_id, claim_text, quote)
     payload = {
@@ -121,6 +391,51 @@ def _build_proposition(
     )
 
 
+def chunk_spans(text: str, chunk_chars: int, overlap_sentences: int = 1) -> list[TextChunk]:
+    """Pack whole sentences into chunks of at most ``chunk_chars`` characters.
+
+    Consecutive chunks share ``overlap_sentences`` sentences. A sentence longer
+    than ``chunk_chars`` is split into fixed-size pieces.
+    """
+    if not text:
+        return []
+    if chunk_chars <= 0:
+        return [TextChunk(text=text, start=0)]
+
+    units: list[tuple[int, int]] = []
+    for start, end in zip(*_unit_bounds(text)):
+        while end - start > chunk_chars:
+            units.append((start, start + chunk_chars))
+            start += chunk_chars
+        units.append((start, end))
+
+    chunks: list[TextChunk] = []
+    first = 0
+    while first < len(units):
+        last = first
+        while last + 1 < len(units) and units[last + 1][1] - units[first][0] <= chunk_chars:
+            last += 1
+        start, end = units[first][0], units[last][1]
+        chunks.append(TextChunk(text=text[start:end], start=start))
+        if last + 1 >= len(units):
+            break
+        first = max(first + 1, last + 1 - overlap_sentences)
+        # Drop the overlap when it leaves no room for the next new unit.
+        if units[last + 1][1] - units[first][0] > chunk_chars:
+            first = last + 1
+    return chunks
+
+
+def _unit_bounds(text: str) -> tuple[list[int], list[int]]:
+    """Start and end offsets of sentence/paragraph units, found in one pass."""
+    starts = [0]
+    for match in _UNIT_BREAK.finditer(text):
+        if 0 < match.end() < len(text):
+            starts.append(match.end())
+    ends = starts[1:] + [len(text)]
+    return starts, ends
+
+
 def chunk_text(text: str, chunk_chars: int, overlap: int) -> list[str]:
     if chunk_chars <= 0:
         return [text]
@@ -136,31 +451,40 @@ def chunk_text(text: str, chunk_chars: int, overlap: int) -> list[str]:
     return chunks
 
 
-def _make_anchor(text: str, quote: str, doc_id: str) -> Annotation | None:
+def _make_anchor(
+    index: AnchorIndex,
+    quote: str,
+    doc_id: str,
+    chunk: TextChunk | None = None,
+) -> Annotation | None:
     if not quote:
         return None
-    start = text.find(quote)
-    if start < 0:
-        start = text.lower().find(quote.lower())
-    if start < 0:
+    # Quotes come from the chunk the model saw, so matches there win.
+    span = (chunk.start, chunk.end) if chunk else None
+    match = index.find(quote, within=span) or index.find_fuzzy(quote, within=span)
+    if match is None:
         selector: AnnotationSelector = {
             "type": "TextQuoteSelector",
             "exact": quote,
         }
         return Annotation(doc_id=doc_id, selector=selector, quote=quote, context="")
 
-    end = start + len(quote)
+    text = index.text
+    start, end = match.start, match.end
+    exact = text[start:end]
     prefix = text[max(0, start - 80) : start]
     suffix = text[end : min(len(text), end + 80)]
     selector = {
         "type": "TextQuoteSelector",
-        "exact": quote,
+        "exact": exact,
         "prefix": prefix,
         "suffix": suffix,
         "start": start,
         "end": end,
+        "match": match.mode,
+        "score": match.score,
     }
-    context = prefix + quote + suffix
+    context = prefix + exact + suffix
     return Annotation(doc_id=doc_id, selector=selector, quote=quote, context=context)
 
 
@@ -170,7 +494,7 @@ def _make_prop_id(doc_id: str, claim_text: str, quote: str) -> str:
     return f"prop_{digest}"
 
 
-def _parse_json_list(text: str) -> list[Any]:
+def _parse_json_list(text: str) -> list[Any] | None:
     text = text.strip()
     try:
         parsed = json.loads(text)
@@ -182,15 +506,15 @@ def _parse_json_list(text: str) -> list[Any]:
     match = re.search(r"\[[\s\S]*\]", text)
     if not match:
         logger.warning("Failed to parse LLM response as JSON: no array found")
-        return []
+        return None
     try:
         parsed = json.loads(match.group(0))
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse LLM response as JSON: {e}")
-        return []
+        return None
     if isinstance(parsed, list):
         return parsed
-    return []
+    return None
 
 
 def _normalize_claim_type(value: str) -> str:
@@ -12,6 +12,16 @@ class EvidencePolicy:
     max_props_per_doc: int
     max_claims: int
     max_evidence_per_claim: int
+    max_inflight_llm_requests: int = 1
+    # Whole sentences repeated at the start of the next chunk; ``chunk_overlap``
+    # (characters) only applies to the legacy ``chunk_text`` splitter.
+    chunk_overlap_sentences: int = 1
+    # Run-wide cap on chunks sent for extraction when a question is available;
+    # 0 means only the per-document cap applies.
+    max_chunks_per_run: int = 0
+    # Approximate prompt-token budget for packing several claims into one
+    # adjudication prompt; 0 labels each claim with its own call.
+    adjudication_batch_tokens: int = 0
 
 
 def policy_for_extent(extent: str) -> EvidencePolicy:
@@ -21,37 +31,49 @@ def policy_for_extent(extent: str) -> EvidencePolicy:
             chunk_chars=2000,
             chunk_overlap=200,
             max_chunks_per_doc=2,
+            max_chunks_per_run=12,
             max_props_per_chunk=3,
             max_props_per_doc=6,
             max_claims=10,
             max_evidence_per_claim=6,
+            max_inflight_llm_requests=4,
         )
     if normalized == "high":
         return EvidencePolicy(
             chunk_chars=3000,
             chunk_overlap=240,
+            chunk_overlap_sentences=2,
             max_chunks_per_doc=4,
+            max_chunks_per_run=60,
             max_props_per_chunk=5,
             max_props_per_doc=12,
             max_claims=30,
             max_evidence_per_claim=12,
+            max_inflight_llm_requests=8,
+            adjudication_batch_tokens=3000,
         )
     if normalized == "heavy":
         return EvidencePolicy(
             chunk_chars=3500,
             chunk_overlap=280,
+            chunk_overlap_sentences=2,
             max_chunks_per_doc=5,
+            max_chunks_per_run=100,
             max_props_per_chunk=6,
             max_props_per_doc=16,
             max_claims=40,
             max_evidence_per_claim=14,
+            max_inflight_llm_requests=16,
+            adjudication_batch_tokens=4000,
         )
     return EvidencePolicy(
         chunk_chars=2500,
         chunk_overlap=200,
         max_chunks_per_doc=3,
+        max_chunks_per_run=30,
         max_props_per_chunk=4,
         max_props_per_doc=8,
         max_claims=20,
         max_evidence_per_claim=10,
+        max_inflight_llm_requests=8,
     )
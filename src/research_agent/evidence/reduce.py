@@ -2,13 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Iterable
+import asyncio
 
 from loguru import logger
 
-from research_agent.evidence.adjudicate import label_evidence
+from research_agent.evidence.adjudicate import (
+    label_evidence_batch_raw,
+    pack_claim_batches,
+    recall_labels,
+    remember_labels,
+)
 from research_agent.evidence.canonicalize import canonicalize_propositions
-from research_agent.evidence.extract import extract_propositions
+from research_agent.evidence.extract import extract_propositions_many
 from research_agent.evidence.policy import EvidencePolicy, policy_for_extent
+from research_agent.evidence.store import EvidenceStore
 from research_agent.llm.client import OpenAICompatClient
 from research_agent.logging import trace
 from research_agent.types import ClaimGroup, DocumentText, Proposition
@@ -23,34 +30,63 @@ def reduce_evidence(
     docs: Iterable[DocumentText],
     llm_client: OpenAICompatClient,
     thinking_extent: str,
+    question: str | None = None,
+    store: EvidenceStore | None = None,
+    label_store: EvidenceStore | None = None,
 ) -> ReduceResult:
+    """Extract, group and adjudicate claims across ``docs``.
+
+    Passing a ``store`` makes extraction incremental: unchanged documents reuse the
+    propositions stored by an earlier run and only new ones are sent to the LLM.
+    With a ``label_store``, quotes already labelled for a claim are not relabelled.
+    """
     policy = policy_for_extent(thinking_extent)
 
+    documents = list(docs)
+
     logger.info("Extracting propositions...")
-    propositions = map_to_propositions(docs, llm_client, policy)
+    propositions = map_to_propositions(documents, llm_client, policy, question=question, store=store)
     logger.info(f"Extracted {len(propositions)} propositions")
 
+    canonical, merged = prepare_claims(propositions, documents, policy)
+    adjudicated = adjudicate(merged, llm_client, policy, store=label_store)
+    logger.info(f"Adjudicated {len(adjudicated)} claims")
+
+    return ReduceResult(propositions=canonical, claim_groups=adjudicated)
+
+
+def prepare_claims(
+    propositions: list[Proposition],
+    docs: Iterable[DocumentText],
+    policy: EvidencePolicy,
+) -> tuple[list[Proposition], list[MergedGroup]]:
+    """Canonicalize, group and merge extracted propositions ahead of adjudication."""
     canonical = canonicalize_propositions(propositions)
     logger.info(f"Canonicalized to {len(canonical)} propositions")
 
     groups = group_claims(canonical, policy)
     logger.info(f"Grouped into {len(groups)} claim groups")
 
-    merged = merge_claims(groups, docs, policy)
-    adjudicated = adjudicate(merged, llm_client, policy)
-    logger.info(f"Adjudicated {len(adjudicated)} claims")
-
-    return ReduceResult(propositions=canonical, claim_groups=adjudicated)
+    return canonical, merge_claims(groups, docs, policy)
 
 
 def map_to_propositions(
     docs: Iterable[DocumentText],
     llm_client: OpenAICompatClient,
     policy: EvidencePolicy,
+    question: str | None = None,
+    store: EvidenceStore | None = None,
 ) -> list[Proposition]:
+    documents = list(docs)
     propositions: list[Proposition] = []
-    for doc in docs:
-        doc_props = extract_propositions(doc, llm_client, policy)
+    extracted = extract_propositions_many(
+        documents,
+        llm_client,
+        policy,
+        question=question,
+        store=store,
+    )
+    for doc, doc_props in zip(documents, extracted):
         logger.debug(f"Extracted {len(doc_props)} propositions from {doc.doc_id}")
         propositions.extend(doc_props)
     return propositions
@@ -145,51 +181,166 @@ def adjudicate(
     groups: Iterable[MergedGroup],
     llm_client: OpenAICompatClient,
     policy: EvidencePolicy,
+    store: EvidenceStore | None = None,
 ) -> list[ClaimGroup]:
-    adjudicated: list[ClaimGroup] = []
-    for group in groups:
-        logger.debug(f"Adjudicating claim: {group.claim_text[:50]}...")
-        labels = label_evidence(group.claim_text, group.evidence, llm_client, policy)
-        counts = {"support": 0, "refute": 0, "neutral": 0}
-        labeled_evidence: list[dict[str, object]] = []
-        for idx, entry in enumerate(group.evidence):
-            label = labels[idx] if idx < len(labels) else "neutral"
-            counts[label] = counts.get(label, 0) + 1
-            entry_with_label = dict(entry)
-            entry_with_label["label"] = label
-            labeled_evidence.append(entry_with_label)
-
-        stance = derive_stance(counts)
-
-        # Trace adjudication result
-        trace(
-            "claim_adjudicated",
-            signature=group.signature,
-            claim_text=group.claim_text,
-            stance=stance,
-            counts=counts,
-        )
-        rationale = (
-            f"support={counts['support']}, refute={counts['refute']}, neutral={counts['neutral']} "
-            f"across {len(labeled_evidence)} evidence items."
-        )
-        merge_payload = {
-            "counts": counts,
-            "evidence": labeled_evidence,
-            "canonical_text": _canonical_from_props(group.propositions),
-        }
-        adjudicated.append(
-            ClaimGroup(
-                signature=group.signature,
-                claim_text=group.claim_text,
-                domain="general",
-                propositions=[prop.id for prop in group.propositions],
-                merge=merge_payload,
-                stance=stance,
-                rationale=rationale,
+    """Label each group's evidence; with a ``store`` only unseen quotes go to the LLM."""
+    pending = list(groups)
+    known = _recall_labels(pending, llm_client, store)
+    claims = _unlabelled_claims(pending, known)
+    fresh: list[list[str | None]] = [[] for _ in pending]
+    for batch in _label_batches(claims, policy):
+        for idx, batch_labels in zip(batch, _label_batch(claims, batch, llm_client, policy)):
+            fresh[idx] = batch_labels
+    labels = _merge_labels(pending, known, fresh, llm_client, store)
+    return [_claim_group(group, group_labels) for group, group_labels in zip(pending, labels)]
+
+
+async def adjudicate_async(
+    groups: Iterable[MergedGroup],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+    limiter: asyncio.Semaphore,
+    store: EvidenceStore | None = None,
+) -> list[ClaimGroup]:
+    """Label every batch concurrently under ``limiter``; results keep group order.
+
+    Memo reads and writes stay on the event loop thread; only LLM calls run in workers.
+    """
+    pending = list(groups)
+    known = _recall_labels(pending, llm_client, store)
+    claims = _unlabelled_claims(pending, known)
+    batches = _label_batches(claims, policy)
+
+    async def label(batch: list[int]) -> list[list[str | None]]:
+        async with limiter:
+            return await asyncio.to_thread(_label_batch, claims, batch, llm_client, policy)
+
+    batch_labels = await asyncio.gather(*(label(batch) for batch in batches))
+    fresh: list[list[str | None]] = [[] for _ in pending]
+    for batch, results in zip(batches, batch_labels):
+        for idx, group_labels in zip(batch, results):
+            fresh[idx] = group_labels
+    labels = _merge_labels(pending, known, fresh, llm_client, store)
+    return [_claim_group(group, group_labels) for group, group_labels in zip(pending, labels)]
+
+
+def _recall_labels(
+    groups: list[MergedGroup],
+    llm_client: OpenAICompatClient,
+    store: EvidenceStore | None,
+) -> list[list[str | None]]:
+    if store is None:
+        return [[None] * len(group.evidence) for group in groups]
+    known = [
+        recall_labels(store, group.signature, group.evidence, llm_client.model_name)
+        for group in groups
+    ]
+    recalled = sum(1 for labels in known for label in labels if label is not None)
+    total = sum(len(labels) for labels in known)
+    logger.debug(f"Recalled {recalled}/{total} evidence labels")
+    trace("labels_recalled", recalled=recalled, total=total)
+    return known
+
+
+def _unlabelled_claims(
+    groups: list[MergedGroup],
+    known: list[list[str | None]],
+) -> list[tuple[str, list[dict[str, object]]]]:
+    return [
+        (group.claim_text, [entry for entry, label in zip(group.evidence, labels) if label is None])
+        for group, labels in zip(groups, known)
+    ]
+
+
+def _merge_labels(
+    groups: list[MergedGroup],
+    known: list[list[str | None]],
+    fresh: list[list[str | None]],
+    llm_client: OpenAICompatClient,
+    store: EvidenceStore | None,
+) -> list[list[str]]:
+    """Fill each group's unseen slots, in order, with the freshly returned labels.
+
+    Slots no reply labelled read as neutral but are not memoized, so the next run asks again.
+    """
+    merged: list[list[str]] = []
+    for group, group_known, group_fresh in zip(groups, known, fresh):
+        new_labels = iter(group_fresh)
+        filled = [label if label is not None else next(new_labels, None) for label in group_known]
+        merged.append([label or "neutral" for label in filled])
+        if store is not None:
+            learned = [
+                idx for idx, label in enumerate(group_known) if label is None and filled[idx] is not None
+            ]
+            remember_labels(
+                store,
+                group.signature,
+                [group.evidence[idx] for idx in learned],
+                [str(filled[idx]) for idx in learned],
+                llm_client.model_name,
             )
-        )
-    return adjudicated
+    return merged
+
+
+def _label_batches(
+    claims: list[tuple[str, list[dict[str, object]]]],
+    policy: EvidencePolicy,
+) -> list[list[int]]:
+    # Claims whose quotes are all labelled already need no LLM call.
+    pending = [idx for idx, (_, evidence) in enumerate(claims) if evidence]
+    batches = pack_claim_batches([claims[idx] for idx in pending], policy)
+    return [[pending[pos] for pos in batch] for batch in batches]
+
+
+def _label_batch(
+    claims: list[tuple[str, list[dict[str, object]]]],
+    batch: list[int],
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+) -> list[list[str | None]]:
+    for idx in batch:
+        logger.debug(f"Adjudicating claim: {claims[idx][0][:50]}...")
+    return label_evidence_batch_raw([claims[idx] for idx in batch], llm_client, policy)
+
+
+def _claim_group(group: MergedGroup, labels: list[str]) -> ClaimGroup:
+    counts = {"support": 0, "refute": 0, "neutral": 0}
+    labeled_evidence: list[dict[str, object]] = []
+    for idx, entry in enumerate(group.evidence):
+        label = labels[idx] if idx < len(labels) else "neutral"
+        counts[label] = counts.get(label, 0) + 1
+        entry_with_label = dict(entry)
+        entry_with_label["label"] = label
+        labeled_evidence.append(entry_with_label)
+
+    stance = derive_stance(counts)
+
+    # Trace adjudication result
+    trace(
+        "claim_adjudicated",
+        signature=group.signature,
+        claim_text=group.claim_text,
+        stance=stance,
+        counts=counts,
+    )
+    rationale = (
+        f"support={counts['support']}, refute={counts['refute']}, neutral={counts['neutral']} "
+        f"across {len(labeled_evidence)} evidence items."
+    )
+    merge_payload = {
+        "counts": counts,
+        "evidence": labeled_evidence,
+        "canonical_text": _canonical_from_props(group.propositions),
+    }
+    return ClaimGroup(
+        signature=group.signature,
+        claim_text=group.claim_text,
+        domain="general",
+        propositions=[prop.id for prop in group.propositions],
+        merge=merge_payload,
+        stance=stance,
+        rationale=rationale,
+    )
 
 
 def derive_stance(counts: dict[str, int]) -> str:
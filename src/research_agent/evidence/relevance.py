@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections import Counter
+import math
+import re
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    (
+        "a about an and are as at be by can do does for from how in is it its of on or "
+        "that the this to was what when where which who why with"
+    ).split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [_stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def _stem(token: str) -> str:
+    # Crude suffix folding so "boils", "boiled" and "boiling" share a term.
+    for suffix in ("ing", "ed", "s"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[: -len(suffix)]
+    return token
+
+
+class BM25:
+    """Okapi BM25 over a fixed set of passages."""
+
+    def __init__(self, passages: list[list[str]], k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._counts = [Counter(tokens) for tokens in passages]
+        self._lengths = [len(tokens) for tokens in passages]
+        self._avg_length = (sum(self._lengths) / len(passages)) if passages else 0.0
+        doc_freq: Counter[str] = Counter()
+        for counts in self._counts:
+            doc_freq.update(counts.keys())
+        total = len(passages)
+        self._idf = {
+            term: math.log(1.0 + (total - freq + 0.5) / (freq + 0.5)) for term, freq in doc_freq.items()
+        }
+
+    def scores(self, query_terms: list[str]) -> list[float]:
+        terms = set(query_terms)
+        results: list[float] = []
+        for counts, length in zip(self._counts, self._lengths):
+            norm = self.k1 * (1.0 - self.b + self.b * length / (self._avg_length or 1.0))
+            score = 0.0
+            for term in terms:
+                freq = counts.get(term, 0)
+                if freq:
+                    score += self._idf[term] * freq * (self.k1 + 1.0) / (freq + norm)
+            results.append(score)
+        return results
+
+
+def select_chunks(
+    question: str | None,
+    chunked: list[list[str]],
+    max_per_doc: int,
+    max_per_run: int = 0,
+) -> list[list[int]]:
+    """Pick the chunk indexes to extract for each document, in chunk order.
+
+    Chunks are ranked by BM25 against the question, with IDF computed over every
+    chunk in the run. Each document keeps its ``max_per_doc`` best chunks, then the
+    run keeps its ``max_per_run`` best overall (0 disables the run cap). Without a
+    question, or for a document where nothing matches, the leading chunks are kept.
+    """
+    query_terms = tokenize(question or "")
+    if not query_terms:
+        return [list(range(min(len(chunks), max_per_doc))) for chunks in chunked]
+
+    bm25 = BM25([tokenize(chunk) for chunks in chunked for chunk in chunks])
+    flat_scores = bm25.scores(query_terms)
+
+    candidates: list[tuple[float, int, int]] = []
+    offset = 0
+    for doc_index, chunks in enumerate(chunked):
+        scores = flat_scores[offset : offset + len(chunks)]
+        offset += len(chunks)
+        if not any(scores):
+            ranked = list(range(len(chunks)))
+        else:
+            ranked = sorted(range(len(chunks)), key=lambda idx: (-scores[idx], idx))
+        candidates.extend((scores[idx], doc_index, idx) for idx in ranked[:max_per_doc])
+
+    if max_per_run > 0 and len(candidates) > max_per_run:
+        candidates.sort(key=lambda item: (-item[0], item[1], item[2]))
+        candidates = candidates[:max_per_run]
+
+    selected: list[list[int]] = [[] for _ in chunked]
+    for _, doc_index, chunk_index in candidates:
+        selected[doc_index].append(chunk_index)
+    return [sorted(indexes) for indexes in selected]
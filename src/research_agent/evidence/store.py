@@ -1,14 +1,61 @@
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
 from pathlib import Path
 import json
+import re
 import sqlite3
+from typing import Iterable
 
-from research_agent.db.schema import apply_migrations
+from research_agent.db.schema import apply_migrations, apply_pragmas
 from research_agent.types import Annotation, ClaimGroup, Proposition, SourceDoc
 
+_QUERY_TERM_RE = re.compile(r"\w+")
+_SOURCE_COLUMNS = (
+    "id, url, retrieved_at, content_hash, warc_path, mime, publish_date, source_type, "
+    "engine, license_hint, meta_json, etag, last_modified, requested_url"
+)
+
+
+@dataclass
+class EvidenceHit:
+    # "proposition" for an extracted claim, "source" for parsed source text.
+    kind: str
+    doc_id: str
+    url: str
+    title: str
+    snippet: str
+    # BM25 relevance; higher is better. search_evidence scales it to 0-1 per index.
+    score: float
+    proposition_id: str | None = None
+
+
+@dataclass
+class WarcRecord:
+    """Where one captured response lives: a gzip member at ``offset`` in ``warc_file``."""
+
+    url: str
+    target_uri: str
+    digest: str
+    warc_file: str
+    offset: int
+    length: int
+    status: int
+    content_type: str
+    retrieved_at: datetime
+
+
+@dataclass
+class RobotsEntry:
+    """A host's robots.txt, or a fixed allow/deny decision when ``body`` is None."""
+
+    host: str
+    body: str | None
+    allow_all: bool
+    fetched_at: datetime
+    expires_at: datetime
+
 
 class EvidenceStore:
     def __init__(self, db_path: Path) -> None:
@@ -20,8 +67,9 @@ class EvidenceStore:
 
     def connect(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
-            self._conn.execute("PRAGMA foreign_keys=ON;")
+            # Callers that write from several threads serialize access themselves.
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            apply_pragmas(self._conn)
         return self._conn
 
     def close(self) -> None:
@@ -34,8 +82,8 @@ class EvidenceStore:
         with conn:
             conn.execute(
                 """
-                INSERT INTO source_docs (id, url, retrieved_at, content_hash, warc_path, mime, publish_date, source_type, engine, license_hint, meta_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO source_docs (id, url, retrieved_at, content_hash, warc_path, mime, publish_date, source_type, engine, license_hint, meta_json, etag, last_modified, requested_url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(id) DO UPDATE SET
                     url=excluded.url,
                     retrieved_at=excluded.retrieved_at,
@@ -46,7 +94,10 @@ class EvidenceStore:
                     source_type=excluded.source_type,
                     engine=excluded.engine,
                     license_hint=excluded.license_hint,
-                    meta_json=excluded.meta_json
+                    meta_json=excluded.meta_json,
+                    etag=excluded.etag,
+                    last_modified=excluded.last_modified,
+                    requested_url=excluded.requested_url
                 """,
                 (
                     source.id,
@@ -60,77 +111,366 @@ class EvidenceStore:
                     source.engine,
                     source.license_hint,
                     _json_dumps(source.meta),
+                    source.etag,
+                    source.last_modified,
+                    source.requested_url,
                 ),
             )
 
     def insert_annotation(self, annotation: Annotation) -> None:
+        self.insert_annotations([annotation])
+
+    def insert_annotations(self, annotations: Iterable[Annotation]) -> None:
         conn = self.connect()
         with conn:
+            _insert_annotations(conn, annotations)
+
+    def upsert_proposition(self, proposition: Proposition) -> None:
+        self.upsert_propositions([proposition])
+
+    def upsert_propositions(self, propositions: Iterable[Proposition]) -> None:
+        conn = self.connect()
+        with conn:
+            _upsert_propositions(conn, propositions)
+
+    def upsert_claim_group(self, claim: ClaimGroup) -> None:
+        self.upsert_claim_groups([claim])
+
+    def upsert_claim_groups(self, claims: Iterable[ClaimGroup]) -> None:
+        conn = self.connect()
+        with conn:
+            _upsert_claim_groups(conn, claims)
+
+    def persist_evidence(
+        self,
+        propositions: list[Proposition],
+        claim_groups: list[ClaimGroup],
+    ) -> None:
+        """Write propositions, their anchors and claim groups in a single transaction."""
+        conn = self.connect()
+        with conn:
+            _upsert_propositions(conn, propositions)
+            _insert_annotations(conn, (anchor for prop in propositions for anchor in prop.anchors))
+            _upsert_claim_groups(conn, claim_groups)
+
+    def save_extraction(
+        self,
+        doc_id: str,
+        text_hash: str,
+        model: str,
+        fingerprint: str,
+        propositions: list[Proposition],
+    ) -> None:
+        """Record which propositions one extraction of a document produced."""
+        conn = self.connect()
+        with conn:
+            _upsert_propositions(conn, propositions)
             conn.execute(
                 """
-                INSERT INTO annotations (doc_id, selector_json, quote, context)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO extractions (doc_id, text_hash, model, fingerprint, proposition_ids_json, extracted_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(doc_id, text_hash, model, fingerprint) DO UPDATE SET
+                    proposition_ids_json=excluded.proposition_ids_json,
+                    extracted_at=excluded.extracted_at
                 """,
                 (
-                    annotation.doc_id,
-                    _json_dumps(annotation.selector),
-                    annotation.quote,
-                    annotation.context,
+                    doc_id,
+                    text_hash,
+                    model,
+                    fingerprint,
+                    _json_dumps([prop.id for prop in propositions]),
+                    datetime.utcnow().isoformat(),
                 ),
             )
 
-    def upsert_proposition(self, proposition: Proposition) -> None:
+    def load_extraction(
+        self,
+        doc_id: str,
+        text_hash: str,
+        model: str,
+        fingerprint: str,
+    ) -> list[Proposition] | None:
+        """Propositions from a matching earlier extraction, or None if there is none."""
+        conn = self.connect()
+        row = conn.execute(
+            """
+            SELECT proposition_ids_json FROM extractions
+            WHERE doc_id = ? AND text_hash = ? AND model = ? AND fingerprint = ?
+            """,
+            (doc_id, text_hash, model, fingerprint),
+        ).fetchone()
+        if row is None:
+            return None
+        ids = json.loads(row[0])
+        if not ids:
+            return []
+        placeholders = ", ".join("?" for _ in ids)
+        rows = conn.execute(
+            f"""
+            SELECT id, type, payload_json, anchors_json, doc_id, quality_json, extracted_at
+            FROM propositions WHERE id IN ({placeholders})
+            """,
+            ids,
+        ).fetchall()
+        by_id = {row[0]: _proposition_from_row(row) for row in rows}
+        # A proposition deleted since then invalidates the whole extraction.
+        if len(by_id) != len(ids):
+            return None
+        return [by_id[prop_id] for prop_id in ids]
+
+    def load_labels(
+        self,
+        signature: str,
+        quote_hashes: list[str],
+        model: str,
+        prompt_version: str,
+    ) -> dict[str, str]:
+        """Memoized labels for a claim's quotes, keyed by quote hash."""
+        if not quote_hashes:
+            return {}
+        conn = self.connect()
+        placeholders = ", ".join("?" for _ in quote_hashes)
+        rows = conn.execute(
+            f"""
+            SELECT quote_hash, label FROM label_memo
+            WHERE signature = ? AND model = ? AND prompt_version = ? AND quote_hash IN ({placeholders})
+            """,
+            (signature, model, prompt_version, *quote_hashes),
+        ).fetchall()
+        return {str(quote_hash): str(label) for quote_hash, label in rows}
+
+    def save_labels(
+        self,
+        signature: str,
+        labels: dict[str, str],
+        model: str,
+        prompt_version: str,
+    ) -> None:
+        if not labels:
+            return
+        labelled_at = datetime.utcnow().isoformat()
+        conn = self.connect()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO label_memo (signature, quote_hash, model, prompt_version, label, labelled_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(signature, quote_hash, model, prompt_version) DO UPDATE SET
+                    label=excluded.label,
+                    labelled_at=excluded.labelled_at
+                """,
+                [
+                    (signature, quote_hash, model, prompt_version, label, labelled_at)
+                    for quote_hash, label in labels.items()
+                ],
+            )
+
+    def index_source_text(self, doc_id: str, title: str, text: str) -> None:
+        """(Re)index a source's parsed text; the source row must already exist."""
+        conn = self.connect()
+        with conn:
+            row = conn.execute("SELECT rowid FROM source_docs WHERE id = ?", (doc_id,)).fetchone()
+            if row is None:
+                return
+            conn.execute("DELETE FROM source_text_fts WHERE rowid = ?", (row[0],))
+            conn.execute(
+                "INSERT INTO source_text_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (row[0], title, text),
+            )
+
+    def search_evidence(self, query: str, limit: int = 10) -> list[EvidenceHit]:
+        """Rank stored propositions and source texts against a free-text query.
+
+        Every query word is an optional term, so partial matches still rank. BM25
+        scores from the two indexes are not comparable, so each index's scores are
+        divided by its best one before the hits are merged.
+        """
+        match = _match_query(query)
+        if not match or limit <= 0:
+            return []
+        conn = self.connect()
+        rows = conn.execute(
+            """
+            SELECT p.id, p.doc_id, s.url, json_extract(s.meta_json, '$.title'),
+                   snippet(propositions_fts, -1, '[', ']', '...', 16), bm25(propositions_fts)
+            FROM propositions_fts
+            JOIN propositions p ON p.rowid = propositions_fts.rowid
+            LEFT JOIN source_docs s ON s.id = p.doc_id
+            WHERE propositions_fts MATCH ?
+            ORDER BY bm25(propositions_fts)
+            LIMIT ?
+            """,
+            (match, limit),
+        ).fetchall()
+        claims = [
+            EvidenceHit(
+                kind="proposition",
+                doc_id=doc_id,
+                url=url or "",
+                title=title or "",
+                snippet=snippet,
+                score=-rank,
+                proposition_id=prop_id,
+            )
+            for prop_id, doc_id, url, title, snippet, rank in rows
+        ]
+        hits = _scaled(claims) + _scaled(self.search_sources(query, limit=limit))
+        # Stable sort: on equal scores claims stay ahead of source texts.
+        hits.sort(key=lambda hit: hit.score, reverse=True)
+        return hits[:limit]
+
+    def search_sources(self, query: str, limit: int = 10) -> list[EvidenceHit]:
+        """Rank indexed source texts against a free-text query."""
+        match = _match_query(query)
+        if not match or limit <= 0:
+            return []
+        conn = self.connect()
+        rows = conn.execute(
+            """
+            SELECT s.id, s.url, source_text_fts.title,
+                   snippet(source_text_fts, 1, '[', ']', '...', 24), bm25(source_text_fts)
+            FROM source_text_fts
+            JOIN source_docs s ON s.rowid = source_text_fts.rowid
+            WHERE source_text_fts MATCH ?
+            ORDER BY bm25(source_text_fts)
+            LIMIT ?
+            """,
+            (match, limit),
+        ).fetchall()
+        return [
+            EvidenceHit(
+                kind="source",
+                doc_id=doc_id,
+                url=url,
+                title=title or "",
+                snippet=snippet,
+                score=-rank,
+            )
+            for doc_id, url, title, snippet, rank in rows
+        ]
+
+    def get_source(self, doc_id: str) -> SourceDoc | None:
+        conn = self.connect()
+        row = conn.execute(f"SELECT {_SOURCE_COLUMNS} FROM source_docs WHERE id = ?", (doc_id,)).fetchone()
+        return _source_from_row(row) if row else None
+
+    def latest_source_for_url(self, url: str) -> SourceDoc | None:
+        """Most recently retrieved source for ``url``, matched on the requested or the final URL."""
+        conn = self.connect()
+        row = conn.execute(
+            f"""
+            SELECT {_SOURCE_COLUMNS} FROM source_docs
+            WHERE url = ? OR requested_url = ?
+            ORDER BY retrieved_at DESC
+            LIMIT 1
+            """,
+            (url, url),
+        ).fetchone()
+        return _source_from_row(row) if row else None
+
+    def insert_warc_record(self, record: WarcRecord) -> None:
         conn = self.connect()
         with conn:
             conn.execute(
                 """
-                INSERT INTO propositions (id, type, payload_json, anchors_json, doc_id, quality_json, extracted_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    type=excluded.type,
-                    payload_json=excluded.payload_json,
-                    anchors_json=excluded.anchors_json,
-                    doc_id=excluded.doc_id,
-                    quality_json=excluded.quality_json,
-                    extracted_at=excluded.extracted_at
+                INSERT INTO warc_records (
+                    url, target_uri, digest, warc_file, offset, length, status, content_type, retrieved_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
-                    proposition.id,
-                    proposition.type,
-                    _json_dumps(proposition.payload),
-                    _json_dumps(proposition.anchors),
-                    proposition.doc_id,
-                    _json_dumps(proposition.quality),
-                    proposition.extracted_at.isoformat(),
+                    record.url,
+                    record.target_uri,
+                    record.digest,
+                    record.warc_file,
+                    record.offset,
+                    record.length,
+                    record.status,
+                    record.content_type,
+                    record.retrieved_at.isoformat(),
                 ),
             )
 
-    def upsert_claim_group(self, claim: ClaimGroup) -> None:
+    def latest_warc_record(self, url: str) -> WarcRecord | None:
+        """Most recent capture of ``url``, matched on the requested or the final URL."""
+        conn = self.connect()
+        row = conn.execute(
+            """
+            SELECT url, target_uri, digest, warc_file, offset, length, status, content_type, retrieved_at
+            FROM warc_records
+            WHERE url = ? OR target_uri = ?
+            ORDER BY retrieved_at DESC, id DESC
+            LIMIT 1
+            """,
+            (url, url),
+        ).fetchone()
+        if row is None:
+            return None
+        return WarcRecord(
+            url=row[0],
+            target_uri=row[1],
+            digest=row[2],
+            warc_file=row[3],
+            offset=int(row[4]),
+            length=int(row[5]),
+            status=int(row[6]),
+            content_type=row[7] or "",
+            retrieved_at=datetime.fromisoformat(row[8]),
+        )
+
+    def load_robots(self, host: str) -> RobotsEntry | None:
+        conn = self.connect()
+        row = conn.execute(
+            "SELECT host, body, allow_all, fetched_at, expires_at FROM robots_rules WHERE host = ?",
+            (host,),
+        ).fetchone()
+        if row is None:
+            return None
+        return RobotsEntry(
+            host=row[0],
+            body=row[1],
+            allow_all=bool(row[2]),
+            fetched_at=datetime.fromisoformat(row[3]),
+            expires_at=datetime.fromisoformat(row[4]),
+        )
+
+    def save_robots(self, entry: RobotsEntry) -> None:
         conn = self.connect()
         with conn:
             conn.execute(
                 """
-                INSERT INTO claim_groups (signature, claim_text, domain, propositions_json, merge_json, stance, rationale)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(signature) DO UPDATE SET
-                    claim_text=excluded.claim_text,
-                    domain=excluded.domain,
-                    propositions_json=excluded.propositions_json,
-                    merge_json=excluded.merge_json,
-                    stance=excluded.stance,
-                    rationale=excluded.rationale
+                INSERT INTO robots_rules (host, body, allow_all, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(host) DO UPDATE SET
+                    body=excluded.body,
+                    allow_all=excluded.allow_all,
+                    fetched_at=excluded.fetched_at,
+                    expires_at=excluded.expires_at
                 """,
                 (
-                    claim.signature,
-                    claim.claim_text,
-                    claim.domain,
-                    _json_dumps(claim.propositions),
-                    _json_dumps(claim.merge) if claim.merge else None,
-                    claim.stance,
-                    claim.rationale,
+                    entry.host,
+                    entry.body,
+                    int(entry.allow_all),
+                    entry.fetched_at.isoformat(),
+                    entry.expires_at.isoformat(),
                 ),
             )
 
+    def unindexed_sources(self) -> list[tuple[str, str, str]]:
+        """(doc_id, title, text blob digest) for recorded sources missing from the text index."""
+        conn = self.connect()
+        rows = conn.execute(
+            """
+            SELECT s.id, COALESCE(json_extract(s.meta_json, '$.title'), ''), MAX(r.text_hash)
+            FROM source_docs s
+            JOIN run_sources r ON r.doc_id = s.id
+            WHERE r.text_hash IS NOT NULL
+              AND s.rowid NOT IN (SELECT rowid FROM source_text_fts)
+            GROUP BY s.id
+            """
+        ).fetchall()
+        return [(str(doc_id), str(title), str(text_hash)) for doc_id, title, text_hash in rows]
+
     def insert_run_source(
         self,
         run_id: str,
@@ -146,6 +486,7 @@ class EvidenceStore:
         content_hash: str,
         raw_path: str,
         text_path: str,
+        text_hash: str | None = None,
     ) -> None:
         conn = self.connect()
         with conn:
@@ -164,9 +505,10 @@ class EvidenceStore:
                     content_type,
                     content_hash,
                     raw_path,
-                    text_path
+                    text_path,
+                    text_hash
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(run_id, doc_id) DO UPDATE SET
                     url=excluded.url,
                     engine=excluded.engine,
@@ -178,7 +520,8 @@ class EvidenceStore:
                     content_type=excluded.content_type,
                     content_hash=excluded.content_hash,
                     raw_path=excluded.raw_path,
-                    text_path=excluded.text_path
+                    text_path=excluded.text_path,
+                    text_hash=excluded.text_hash
                 """,
                 (
                     run_id,
@@ -194,9 +537,25 @@ class EvidenceStore:
                     content_hash,
                     raw_path,
                     text_path,
+                    text_hash,
                 ),
             )
 
+    def blob_refcounts(self) -> dict[str, int]:
+        """Count run_sources rows referencing each raw or parsed-text blob digest."""
+        conn = self.connect()
+        rows = conn.execute(
+            """
+            SELECT digest, COUNT(*) FROM (
+                SELECT content_hash AS digest FROM run_sources WHERE content_hash IS NOT NULL
+                UNION ALL
+                SELECT text_hash AS digest FROM run_sources WHERE text_hash IS NOT NULL
+            )
+            GROUP BY digest
+            """
+        ).fetchall()
+        return {str(digest): int(count) for digest, count in rows}
+
     def record_run(
         self,
         run_id: str,
@@ -246,3 +605,123 @@ def _json_default(value: object) -> str:
     if isinstance(value, datetime):
         return value.isoformat()
     return str(value)
+
+
+def _match_query(text: str) -> str:
+    """FTS5 query OR-ing every distinct word, quoted so user input is never parsed as syntax."""
+    terms = dict.fromkeys(term.lower() for term in _QUERY_TERM_RE.findall(text))
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+def _scaled(hits: list[EvidenceHit]) -> list[EvidenceHit]:
+    top = max((hit.score for hit in hits), default=0.0)
+    if top > 0:
+        for hit in hits:
+            hit.score = round(hit.score / top, 4)
+    return hits
+
+
+def _source_from_row(row: tuple) -> SourceDoc:
+    return SourceDoc(
+        id=row[0],
+        url=row[1],
+        retrieved_at=datetime.fromisoformat(row[2]),
+        content_hash=row[3],
+        warc_path=row[4],
+        mime=row[5],
+        publish_date=row[6],
+        source_type=row[7],
+        engine=row[8],
+        license_hint=row[9],
+        meta=json.loads(row[10]) if row[10] else {},
+        etag=row[11],
+        last_modified=row[12],
+        requested_url=row[13],
+    )
+
+
+def _proposition_from_row(row: tuple) -> Proposition:
+    prop_id, prop_type, payload_json, anchors_json, doc_id, quality_json, extracted_at = row
+    return Proposition(
+        id=prop_id,
+        type=prop_type,
+        payload=json.loads(payload_json),
+        anchors=[Annotation(**anchor) for anchor in json.loads(anchors_json)],
+        doc_id=doc_id,
+        quality=json.loads(quality_json),
+        extracted_at=datetime.fromisoformat(extracted_at),
+    )
+
+
+def _insert_annotations(conn: sqlite3.Connection, annotations: Iterable[Annotation]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO annotations (doc_id, selector_json, quote, context)
+        VALUES (?, ?, ?, ?)
+        """,
+        [
+            (
+                annotation.doc_id,
+                _json_dumps(annotation.selector),
+                annotation.quote,
+                annotation.context,
+            )
+            for annotation in annotations
+        ],
+    )
+
+
+def _upsert_propositions(conn: sqlite3.Connection, propositions: Iterable[Proposition]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO propositions (id, type, payload_json, anchors_json, doc_id, quality_json, extracted_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            type=excluded.type,
+            payload_json=excluded.payload_json,
+            anchors_json=excluded.anchors_json,
+            doc_id=excluded.doc_id,
+            quality_json=excluded.quality_json,
+            extracted_at=excluded.extracted_at
+        """,
+        [
+            (
+                proposition.id,
+                proposition.type,
+                _json_dumps(proposition.payload),
+                _json_dumps(proposition.anchors),
+                proposition.doc_id,
+                _json_dumps(proposition.quality),
+                proposition.extracted_at.isoformat(),
+            )
+            for proposition in propositions
+        ],
+    )
+
+
+def _upsert_claim_groups(conn: sqlite3.Connection, claims: Iterable[ClaimGroup]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO claim_groups (signature, claim_text, domain, propositions_json, merge_json, stance, rationale)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(signature) DO UPDATE SET
+            claim_text=excluded.claim_text,
+            domain=excluded.domain,
+            propositions_json=excluded.propositions_json,
+            merge_json=excluded.merge_json,
+            stance=excluded.stance,
+            rationale=excluded.rationale
+        """,
+        [
+            (
+                claim.signature,
+                claim.claim_text,
+                claim.domain,
+                _json_dumps(claim.propositions),
+                _json_dumps(claim.merge) if claim.merge else None,
+                claim.stance,
+                claim.rationale,
+            )
+            for claim in claims
+        ],
+    )
@@ -2,9 +2,48 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
+from typing import Iterator
+import codecs
+import hashlib
 
+from loguru import logger
 import httpx
 
+from research_agent.blobs.store import BlobRef, BlobStore, iter_blob
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+# Bodies past this size are streamed into the blob store instead of memory.
+DEFAULT_SPOOL_BYTES = 8 * 1024 * 1024
+# Enough of the body to recognise a PDF, markup or a binary signature.
+SNIFF_BYTES = 1024
+
+# Declared types that can never parse into text; aborted before reading the body.
+_BLOCKED_TYPE_PREFIXES = ("image/", "audio/", "video/", "font/")
+_BINARY_SIGNATURES = (
+    b"\x89PNG",
+    b"GIF8",
+    b"\xff\xd8\xff",
+    b"PK\x03\x04",
+    b"\x1f\x8b",
+    b"RIFF",
+    b"OggS",
+    b"7z\xbc\xaf",
+    b"Rar!",
+    b"\x7fELF",
+)
+# UTF-16/32 text is full of NUL bytes; longer BOMs first, since UTF-32-LE starts like UTF-16-LE.
+_WIDE_BOMS = (
+    (b"\xff\xfe\x00\x00", "utf-32-le"),
+    (b"\x00\x00\xfe\xff", "utf-32-be"),
+    (b"\xff\xfe", "utf-16-le"),
+    (b"\xfe\xff", "utf-16-be"),
+)
+
+
+class FetchAbortedError(RuntimeError):
+    """Raised when a download is abandoned for its size or content type."""
+
 
 @dataclass
 class FetchedDoc:
@@ -13,17 +52,193 @@ class FetchedDoc:
     content: bytes
     headers: dict[str, str]
     retrieved_at: datetime
+    # "<file>#<offset>" of the WARC record holding this response, once captured.
+    warc_path: str | None = None
+    # Hex sha256 of the body, computed while it streamed in.
+    content_hash: str | None = None
+    # Spooled bodies live here and ``content`` stays empty; read them with body().
+    blob: BlobRef | None = None
+
+    def body(self) -> bytes:
+        if self.blob is None:
+            return self.content
+        return b"".join(iter_blob(self.blob))
+
+    def iter_body(self) -> Iterator[bytes]:
+        if self.blob is None:
+            yield self.content
+        else:
+            yield from iter_blob(self.blob)
+
+    def size(self) -> int:
+        return len(self.content) if self.blob is None else self.blob.size
+
+    def sha256(self) -> str:
+        if self.blob is not None:
+            return self.blob.digest
+        if self.content_hash is None:
+            self.content_hash = hashlib.sha256(self.content).hexdigest()
+        return self.content_hash
+
+
+def build_http_client(
+    timeout_s: int = 30,
+    max_connections: int = 32,
+    user_agent: str | None = None,
+) -> httpx.Client:
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    headers = {"User-Agent": user_agent} if user_agent else None
+    return httpx.Client(timeout=timeout_s, follow_redirects=True, limits=limits, headers=headers)
+
+
+def fetch_url(
+    url: str,
+    timeout_s: int = 30,
+    client: httpx.Client | None = None,
+    headers: dict[str, str] | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    spool: BlobStore | None = None,
+    spool_bytes: int = DEFAULT_SPOOL_BYTES,
+) -> FetchedDoc:
+    """GET ``url``, streaming the body. With conditional ``headers`` a 304 comes back empty.
+
+    Downloads larger than ``max_bytes``, or whose first bytes are neither text nor
+    PDF, are aborted with FetchAbortedError. Given a ``spool`` store, bodies past
+    ``spool_bytes`` are written straight into it instead of being held in memory.
+    """
+    limits = _Limits(max_bytes=max_bytes, spool=spool, spool_bytes=spool_bytes)
+    if client is None:
+        with build_http_client(timeout_s, max_connections=1) as own_client:
+            return _get(own_client, url, headers, limits)
+    return _get(client, url, headers, limits)
+
+
+@dataclass
+class _Limits:
+    max_bytes: int = DEFAULT_MAX_BYTES
+    spool: BlobStore | None = None
+    spool_bytes: int = DEFAULT_SPOOL_BYTES
 
 
-def fetch_url(url: str, timeout_s: int = 30) -> FetchedDoc:
-    # TODO: Add robots.txt checks, rate limiting, and WARC capture.
-    with httpx.Client(timeout=timeout_s, follow_redirects=True) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        return FetchedDoc(
+def _get(
+    client: httpx.Client,
+    url: str,
+    headers: dict[str, str] | None = None,
+    limits: _Limits | None = None,
+) -> FetchedDoc:
+    limits = limits or _Limits()
+    with client.stream("GET", url, headers=headers) as response:
+        if response.status_code != 304:
+            response.raise_for_status()
+        response_headers = {k: v for k, v in response.headers.items()}
+        fetched = FetchedDoc(
             url=str(response.url),
             status_code=response.status_code,
-            content=response.content,
-            headers={k: v for k, v in response.headers.items()},
+            content=b"",
+            headers=response_headers,
             retrieved_at=datetime.utcnow(),
         )
+        if response.status_code == 304:
+            return fetched
+        _check_declared(url, response_headers, limits.max_bytes)
+        _read_body(url, response.iter_bytes(), fetched, limits)
+    return fetched
+
+
+def _check_declared(url: str, headers: dict[str, str], max_bytes: int) -> None:
+    declared_type = headers.get("content-type", "").lower()
+    if declared_type.startswith(_BLOCKED_TYPE_PREFIXES):
+        raise FetchAbortedError(f"{url}: unsupported content type {declared_type}")
+    length = headers.get("content-length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise FetchAbortedError(f"{url}: {length} bytes exceeds the {max_bytes} byte limit")
+
+
+def _read_body(url: str, chunks: Iterator[bytes], fetched: FetchedDoc, limits: _Limits) -> None:
+    """Fill ``fetched`` from ``chunks``, sniffing, hashing and capping as they arrive."""
+    hasher = hashlib.sha256()
+    buffer = bytearray()
+    received = 0
+    sniffed = False
+
+    def capped(rest: Iterator[bytes]) -> Iterator[bytes]:
+        nonlocal received
+        for chunk in rest:
+            received += len(chunk)
+            if received > limits.max_bytes:
+                raise FetchAbortedError(f"{url}: body exceeds the {limits.max_bytes} byte limit")
+            yield chunk
+
+    stream = capped(chunks)
+    for chunk in stream:
+        hasher.update(chunk)
+        buffer += chunk
+        if not sniffed and len(buffer) >= SNIFF_BYTES:
+            _apply_sniff(url, bytes(buffer[:SNIFF_BYTES]), fetched.headers)
+            sniffed = True
+        if limits.spool is not None and len(buffer) > limits.spool_bytes:
+            if not sniffed:
+                _apply_sniff(url, bytes(buffer[:SNIFF_BYTES]), fetched.headers)
+            fetched.blob = limits.spool.put_stream(chain([bytes(buffer)], stream))
+            fetched.content_hash = fetched.blob.digest
+            logger.debug(f"Spooled {fetched.blob.size} bytes from {url} to the blob store")
+            return
+    if not sniffed:
+        _apply_sniff(url, bytes(buffer), fetched.headers)
+    fetched.content = bytes(buffer)
+    fetched.content_hash = hasher.hexdigest()
+
+
+def _apply_sniff(url: str, head: bytes, headers: dict[str, str]) -> None:
+    sniffed = sniff_content_type(head, _charset(headers.get("content-type", "")))
+    if sniffed is None:
+        raise FetchAbortedError(f"{url}: body is neither text nor PDF")
+    declared = headers.get("content-type", "").lower()
+    # Trust the bytes over a missing or generic declared type.
+    if sniffed == "application/pdf" and "pdf" not in declared:
+        headers["content-type"] = sniffed
+    elif not declared or declared.startswith("application/octet-stream"):
+        headers["content-type"] = sniffed
+
+
+def sniff_content_type(head: bytes, charset: str | None = None) -> str | None:
+    """Guess a parseable type from a body's first bytes; None for binary payloads.
+
+    NUL bytes mean binary unless a BOM or the declared ``charset`` says UTF-16/32.
+    """
+    wide = _wide_encoding(head, charset)
+    if wide is not None:
+        text = head.decode(wide, errors="ignore").lstrip("\ufeff \t\r\n")
+        return "text/html" if text.startswith("<") else "text/plain"
+    stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if stripped.startswith(b"%PDF-"):
+        return "application/pdf"
+    if stripped.startswith(_BINARY_SIGNATURES) or b"\x00" in head:
+        return None
+    if stripped.startswith(b"<"):
+        return "text/html"
+    return "text/plain"
+
+
+def _wide_encoding(head: bytes, charset: str | None) -> str | None:
+    for bom, encoding in _WIDE_BOMS:
+        if head.startswith(bom):
+            return encoding
+    if charset and charset.replace("_", "-").startswith(("utf-16", "utf-32")):
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            return None
+        return charset
+    return None
+
+
+def _charset(content_type: str) -> str | None:
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip('"').lower() or None
+    return None
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+import threading
+
+from loguru import logger
+
+from research_agent.blobs.store import BlobStore
+from research_agent.config import HTTP_CACHE_MODES
+from research_agent.evidence.store import EvidenceStore
+from research_agent.fetch.fetcher import FetchedDoc
+from research_agent.fetch.pool import FetchFn
+from research_agent.logging import trace
+from research_agent.types import SourceDoc
+
+
+class NotCachedError(RuntimeError):
+    """Raised in cache_only mode for a URL with no stored response."""
+
+
+@dataclass
+class HttpCacheStats:
+    fresh: int = 0
+    not_modified: int = 0
+    refetched: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "fresh": self.fresh,
+            "not_modified": self.not_modified,
+            "refetched": self.refetched,
+            "misses": self.misses,
+        }
+
+
+@dataclass
+class HttpCache:
+    """Serves fetches from previously stored sources, revalidating them with the origin.
+
+    Bodies come from the blob store and validators (ETag, Last-Modified) from
+    ``source_docs``. A source retrieved within ``fresh_s`` is used as is; an older
+    one is revalidated with a conditional GET, and a 304 reuses the stored body.
+    """
+
+    store: EvidenceStore
+    blobs: BlobStore
+    fresh_s: float = 3600.0
+    mode: str = "revalidate"
+    # Guards ``store``; pass the lock of any other thread writing through it.
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    stats: HttpCacheStats = field(default_factory=HttpCacheStats)
+
+    def __post_init__(self) -> None:
+        if self.mode not in HTTP_CACHE_MODES:
+            raise ValueError(f"Unknown HTTP cache mode: {self.mode}")
+
+    def wrap(self, fetch_fn: FetchFn) -> FetchFn:
+        def fetch(url: str, **kwargs: Any) -> FetchedDoc:
+            return self.fetch(url, fetch_fn, **kwargs)
+
+        return fetch
+
+    def fetch(self, url: str, fetch_fn: FetchFn, **kwargs: Any) -> FetchedDoc:
+        with self.lock:
+            source = self.store.latest_source_for_url(url)
+        if source is not None and self.blobs.find(source.content_hash) is None:
+            source = None
+
+        if source is None:
+            if self.mode == "cache_only":
+                raise NotCachedError(f"{url} is not in the HTTP cache")
+            self.stats.misses += 1
+            return fetch_fn(url, **kwargs)
+
+        age_s = (datetime.utcnow() - source.retrieved_at).total_seconds()
+        if self.mode == "cache_only" or age_s <= self.fresh_s:
+            self.stats.fresh += 1
+            trace("http_cache", url=url, outcome="fresh", age_s=round(age_s, 1))
+            return self._stored(source, source.retrieved_at)
+
+        validators = _conditional_headers(source)
+        fetched = fetch_fn(url, headers=validators, **kwargs) if validators else fetch_fn(url, **kwargs)
+        if fetched.status_code == 304:
+            self.stats.not_modified += 1
+            trace("http_cache", url=url, outcome="not_modified", age_s=round(age_s, 1))
+            logger.debug(f"Not modified: {url}")
+            return self._stored(source, fetched.retrieved_at, fetched.headers)
+        self.stats.refetched += 1
+        trace("http_cache", url=url, outcome="refetched", age_s=round(age_s, 1))
+        return fetched
+
+    def _stored(
+        self,
+        source: SourceDoc,
+        retrieved_at: datetime,
+        fresh_headers: dict[str, str] | None = None,
+    ) -> FetchedDoc:
+        headers = {"content-type": source.mime}
+        if source.etag:
+            headers["etag"] = source.etag
+        if source.last_modified:
+            headers["last-modified"] = source.last_modified
+        # A 304 may carry updated validators.
+        for name in ("etag", "last-modified"):
+            if fresh_headers and fresh_headers.get(name):
+                headers[name] = fresh_headers[name]
+        return FetchedDoc(
+            url=source.url,
+            status_code=200,
+            content=self.blobs.get_bytes(source.content_hash),
+            headers=headers,
+            retrieved_at=retrieved_at,
+            warc_path=source.warc_path,
+        )
+
+
+def _conditional_headers(source: SourceDoc) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if source.etag:
+        headers["If-None-Match"] = source.etag
+    if source.last_modified:
+        headers["If-Modified-Since"] = source.last_modified
+    return headers
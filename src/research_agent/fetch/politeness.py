@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+import threading
+import time
+
+from loguru import logger
+import httpx
+
+from research_agent.config import FetchConfig
+from research_agent.evidence.store import EvidenceStore, RobotsEntry
+from research_agent.fetch.fetcher import FetchedDoc, build_http_client
+from research_agent.logging import trace
+
+# An unreachable robots.txt (5xx, network error) disallows the host, but only this long.
+UNREACHABLE_RETRY_S = 300.0
+
+
+class RobotsDisallowedError(RuntimeError):
+    """Raised for a URL the host's robots.txt does not allow us to fetch."""
+
+
+def host_key(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+@dataclass
+class TokenBucket:
+    """One request per ``interval_s`` on average, with bursts of up to ``capacity``.
+
+    Tokens may go negative: each reservation queues behind the previous one.
+    """
+
+    interval_s: float
+    capacity: float = 1.0
+    tokens: float = 1.0
+    updated: float = field(default_factory=time.monotonic)
+
+    def ready_in(self, now: float, ahead: int = 0) -> float:
+        """Seconds until a token is free with ``ahead`` requests queued before us."""
+        self._refill(now)
+        missing = 1 + ahead - self.tokens
+        return max(0.0, missing * self.interval_s)
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return how long to wait before using it."""
+        wait_s = self.ready_in(now)
+        self.tokens -= 1
+        return wait_s
+
+    def _refill(self, now: float) -> None:
+        if self.interval_s <= 0:
+            self.tokens = self.capacity
+        else:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval_s)
+        self.updated = now
+
+
+@dataclass
+class RobotsRules:
+    # None means the decision is fixed: allow (missing robots.txt) or deny (unreachable).
+    parser: RobotFileParser | None
+    allow_all: bool
+    crawl_delay_s: float | None
+    expires_at: datetime
+
+    def allows(self, url: str, user_agent: str) -> bool:
+        if self.parser is None:
+            return self.allow_all
+        return self.parser.can_fetch(user_agent, url)
+
+
+class RobotsCache:
+    """Per-host robots.txt decisions, fetched once and reused for ``ttl_s``.
+
+    With a ``store`` the decisions outlive the run: later runs reuse them until
+    they expire instead of fetching robots.txt again.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = "research-agent",
+        ttl_s: float = 86400.0,
+        store: EvidenceStore | None = None,
+        lock: threading.Lock | None = None,
+    ) -> None:
+        self.user_agent = user_agent
+        self.ttl_s = ttl_s
+        self.store = store
+        # Guards ``store``; pass the lock of any other thread writing through it.
+        self.store_lock = lock or threading.Lock()
+        self._rules: dict[str, RobotsRules] = {}
+        self._lock = threading.Lock()
+        # One robots.txt fetch per host even when several workers ask at once.
+        self._host_locks: dict[str, threading.Lock] = {}
+
+    def rules_for(self, url: str, client: httpx.Client | None = None, timeout_s: float = 10.0) -> RobotsRules:
+        if urlparse(url).scheme not in ("http", "https"):
+            return RobotsRules(None, allow_all=True, crawl_delay_s=None, expires_at=datetime.max)
+        host = host_key(url)
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            rules = self._rules.get(host)
+            if rules is None or rules.expires_at <= datetime.utcnow():
+                rules = self._load(host)
+            if rules is None:
+                entry = self._fetch(url, client, timeout_s)
+                self._save(entry)
+                rules = self._parse(entry)
+            self._rules[host] = rules
+        return rules
+
+    def allowed(self, url: str, client: httpx.Client | None = None, timeout_s: float = 10.0) -> bool:
+        return self.rules_for(url, client, timeout_s).allows(url, self.user_agent)
+
+    def _load(self, host: str) -> RobotsRules | None:
+        if self.store is None:
+            return None
+        with self.store_lock:
+            entry = self.store.load_robots(host)
+        if entry is None or entry.expires_at <= datetime.utcnow():
+            return None
+        trace("robots_cache", host=host, fetched_at=entry.fetched_at.isoformat())
+        return self._parse(entry)
+
+    def _save(self, entry: RobotsEntry) -> None:
+        if self.store is None:
+            return
+        with self.store_lock:
+            self.store.save_robots(entry)
+
+    def _parse(self, entry: RobotsEntry) -> RobotsRules:
+        if entry.body is None:
+            return RobotsRules(None, allow_all=entry.allow_all, crawl_delay_s=None, expires_at=entry.expires_at)
+        parser = RobotFileParser()
+        parser.parse(entry.body.splitlines())
+        return RobotsRules(
+            parser,
+            allow_all=True,
+            crawl_delay_s=_crawl_delay(parser, self.user_agent),
+            expires_at=entry.expires_at,
+        )
+
+    def _fetch(self, url: str, client: httpx.Client | None, timeout_s: float) -> RobotsEntry:
+        parts = urlparse(url)
+        host = host_key(url)
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        now = datetime.utcnow()
+        unreachable = RobotsEntry(
+            host, None, allow_all=False, fetched_at=now, expires_at=now + timedelta(seconds=UNREACHABLE_RETRY_S)
+        )
+        try:
+            if client is None:
+                with build_http_client(int(timeout_s), max_connections=1) as own_client:
+                    response = own_client.get(robots_url)
+            else:
+                response = client.get(robots_url)
+        except httpx.HTTPError as e:
+            logger.warning(f"robots.txt unreachable for {parts.netloc}: {e}")
+            return unreachable
+
+        if response.status_code >= 500:
+            logger.warning(f"robots.txt for {parts.netloc} returned {response.status_code}")
+            return unreachable
+        expires_at = now + timedelta(seconds=self.ttl_s)
+        if response.status_code >= 400:
+            return RobotsEntry(host, None, allow_all=True, fetched_at=now, expires_at=expires_at)
+        return RobotsEntry(host, response.text, allow_all=True, fetched_at=now, expires_at=expires_at)
+
+
+def _crawl_delay(parser: RobotFileParser, user_agent: str) -> float | None:
+    delay = parser.crawl_delay(user_agent)
+    if delay is not None:
+        return float(delay)
+    rate = parser.request_rate(user_agent)
+    if rate is not None and rate.requests > 0:
+        return rate.seconds / rate.requests
+    return None
+
+
+@dataclass
+class PolitenessScheduler:
+    """Per-host token buckets plus robots.txt checks for outgoing fetches.
+
+    Every host gets at most one request per ``host_delay_s`` (bursts of
+    ``burst``), slowed further to its robots.txt crawl delay once that is known.
+    ``wrap`` enforces this around the network fetch only, so responses served from
+    caches, WARC replay or local files never wait; dispatchers use ``ready_in``
+    to work on other hosts instead of waiting on a busy one. Non-http(s) URLs
+    are never throttled.
+    """
+
+    host_delay_s: float = 1.0
+    burst: int = 1
+    robots: RobotsCache | None = None
+    _buckets: dict[str, TokenBucket] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: FetchConfig,
+        store: EvidenceStore | None = None,
+        lock: threading.Lock | None = None,
+    ) -> "PolitenessScheduler":
+        robots = None
+        if config.respect_robots:
+            robots = RobotsCache(
+                user_agent=config.user_agent,
+                ttl_s=config.robots_ttl_hours * 3600,
+                store=store,
+                lock=lock,
+            )
+        return cls(host_delay_s=config.host_delay_s, burst=config.host_burst, robots=robots)
+
+    def ready_in(self, url: str, ahead: int = 0) -> float:
+        if not _throttled(url):
+            return 0.0
+        with self._lock:
+            return self._bucket(host_key(url)).ready_in(time.monotonic(), ahead)
+
+    def acquire(self, url: str) -> float:
+        """Block until ``url``'s host may be contacted; returns the time waited."""
+        with self._lock:
+            wait_s = self._bucket(host_key(url)).reserve(time.monotonic())
+        if wait_s > 0:
+            time.sleep(wait_s)
+        return wait_s
+
+    def wrap(self, fetch_fn: Callable[..., FetchedDoc]) -> Callable[..., FetchedDoc]:
+        def fetch(url: str, **kwargs: Any) -> FetchedDoc:
+            if not _throttled(url):
+                return fetch_fn(url, **kwargs)
+            if self.robots is not None:
+                rules = self.robots.rules_for(url, kwargs.get("client"), kwargs.get("timeout_s", 10.0))
+                if not rules.allows(url, self.robots.user_agent):
+                    trace("robots_disallowed", url=url)
+                    raise RobotsDisallowedError(f"robots.txt disallows {url}")
+                self._apply_crawl_delay(host_key(url), rules.crawl_delay_s)
+            waited = self.acquire(url)
+            if waited > 0:
+                logger.debug(f"Waited {waited:.2f}s for {host_key(url)}")
+            return fetch_fn(url, **kwargs)
+
+        return fetch
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            capacity = float(max(1, self.burst))
+            bucket = TokenBucket(interval_s=self.host_delay_s, capacity=capacity, tokens=capacity)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _apply_crawl_delay(self, host: str, crawl_delay_s: float | None) -> None:
+        if crawl_delay_s is None:
+            return
+        with self._lock:
+            bucket = self._bucket(host)
+            if crawl_delay_s > bucket.interval_s:
+                # A crawl delay is a minimum gap between requests, so no bursts either.
+                bucket.interval_s = crawl_delay_s
+                bucket.capacity = 1.0
+                bucket.tokens = min(bucket.tokens, 1.0)
+
+
+def _throttled(url: str) -> bool:
+    return urlparse(url).scheme in ("http", "https")
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+import asyncio
+import time
+
+from loguru import logger
+
+from research_agent.config import FetchConfig
+from research_agent.fetch.fetcher import FetchedDoc, build_http_client, fetch_url
+from research_agent.fetch.politeness import PolitenessScheduler, host_key
+
+
+FetchFn = Callable[..., FetchedDoc]
+
+
+@dataclass
+class FetchOutcome:
+    index: int
+    url: str
+    doc: FetchedDoc | None
+    error: Exception | None = None
+
+
+class FetchPool:
+    """Downloads URLs concurrently through one shared pooled client.
+
+    Dispatch happens on the caller's thread: a URL is only submitted when both a
+    global slot and a slot for its host are free, and with a ``scheduler`` only
+    once the host's politeness delay has passed, so a busy or slow host never
+    holds up downloads from other hosts. Outcomes are yielded as they complete.
+
+    The scheduler only steers dispatch here; pair it with ``scheduler.wrap`` on
+    the network fetch, which takes the tokens and checks robots.txt.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        timeout_s: int = 30,
+        fetch_fn: FetchFn = fetch_url,
+        scheduler: PolitenessScheduler | None = None,
+        user_agent: str | None = None,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.timeout_s = timeout_s
+        self.scheduler = scheduler
+        self._fetch_fn = fetch_fn
+        self._client = build_http_client(
+            timeout_s,
+            max_connections=self.max_concurrency,
+            user_agent=user_agent,
+        )
+        self._async_slots: asyncio.Semaphore | None = None
+        self._async_host_slots: dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_config(
+        cls,
+        config: FetchConfig,
+        fetch_fn: FetchFn = fetch_url,
+        scheduler: PolitenessScheduler | None = None,
+    ) -> "FetchPool":
+        return cls(
+            max_concurrency=config.max_concurrency,
+            per_host_concurrency=config.per_host_concurrency,
+            timeout_s=config.timeout_s,
+            fetch_fn=fetch_fn,
+            scheduler=scheduler,
+            user_agent=config.user_agent,
+        )
+
+    def fetch_all(self, urls: Iterable[str]) -> Iterator[FetchOutcome]:
+        pending = deque(enumerate(urls))
+        in_flight: dict[Future[FetchedDoc], tuple[int, str, str]] = {}
+        host_load: dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while pending or in_flight:
+                next_ready_s = self._dispatch(executor, pending, in_flight, host_load)
+                if not in_flight:
+                    # Every pending host is still inside its politeness delay.
+                    time.sleep(next_ready_s or 0.0)
+                    continue
+                done, _ = wait(in_flight, timeout=next_ready_s, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, url, host = in_flight.pop(future)
+                    host_load[host] -= 1
+                    try:
+                        yield FetchOutcome(index=index, url=url, doc=future.result())
+                    except Exception as exc:
+                        yield FetchOutcome(index=index, url=url, doc=None, error=exc)
+
+    async def fetch_async(self, url: str) -> FetchedDoc:
+        """Fetch one URL from a running event loop under the same global and per-host limits.
+
+        The host slot is taken, and the host's politeness delay waited out, before
+        the global slot, so a URL waiting on a busy host never holds a global slot
+        that another host could use.
+        """
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self.max_concurrency)
+        host = host_key(url)
+        host_slots = self._async_host_slots.setdefault(
+            host, asyncio.Semaphore(self.per_host_concurrency)
+        )
+        async with host_slots:
+            if self.scheduler is not None:
+                delay_s = self.scheduler.ready_in(url)
+                if delay_s > 0:
+                    await asyncio.sleep(delay_s)
+            async with self._async_slots:
+                logger.debug(f"Fetching {url}")
+                return await asyncio.to_thread(
+                    self._fetch_fn,
+                    url,
+                    timeout_s=self.timeout_s,
+                    client=self._client,
+                )
+
+    def _dispatch(
+        self,
+        executor: ThreadPoolExecutor,
+        pending: deque[tuple[int, str]],
+        in_flight: dict[Future[FetchedDoc], tuple[int, str, str]],
+        host_load: dict[str, int],
+    ) -> float | None:
+        """Submit every URL that may start now; returns seconds until a delayed host frees up."""
+        deferred: list[tuple[int, str]] = []
+        next_ready_s: float | None = None
+        while pending and len(in_flight) < self.max_concurrency:
+            index, url = pending.popleft()
+            host = host_key(url)
+            if host_load.get(host, 0) >= self.per_host_concurrency:
+                deferred.append((index, url))
+                continue
+            if self.scheduler is not None:
+                # Requests already in flight for the host may not have taken their token yet.
+                delay_s = self.scheduler.ready_in(url, ahead=host_load.get(host, 0))
+                if delay_s > 0:
+                    deferred.append((index, url))
+                    next_ready_s = delay_s if next_ready_s is None else min(next_ready_s, delay_s)
+                    continue
+            host_load[host] = host_load.get(host, 0) + 1
+            logger.debug(f"Fetching {url}")
+            future = executor.submit(self._fetch_fn, url, timeout_s=self.timeout_s, client=self._client)
+            in_flight[future] = (index, url, host)
+        pending.extendleft(reversed(deferred))
+        return next_ready_s
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> "FetchPool":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from itertools import chain
+from pathlib import Path
+from typing import Any
+import gzip
+import threading
+import uuid
+import zlib
+
+from loguru import logger
+
+from research_agent.evidence.store import EvidenceStore, WarcRecord
+from research_agent.fetch.fetcher import FetchedDoc
+from research_agent.fetch.pool import FetchFn
+
+WARC_VERSION = "WARC/1.1"
+DEFAULT_MAX_FILE_BYTES = 1 << 30
+# httpx hands us decoded bodies, so framing headers from the wire no longer apply.
+_DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+_RECORD_END = b"\r\n\r\n"
+
+
+class WarcMissError(RuntimeError):
+    """Raised on replay for a URL that was never captured."""
+
+
+@dataclass
+class WarcLocation:
+    path: Path
+    offset: int
+    length: int
+
+    def __str__(self) -> str:
+        return f"{self.path.name}#{self.offset}"
+
+
+@dataclass
+class WarcWriter:
+    """Appends fetched responses to rolling WARC files and indexes them in SQLite.
+
+    Every record is written as its own gzip member, so ``(file, offset, length)``
+    is enough to read one back with a single seek. A new file is started once the
+    current one reaches ``max_file_bytes``.
+    """
+
+    warc_dir: Path
+    store: EvidenceStore
+    max_file_bytes: int = DEFAULT_MAX_FILE_BYTES
+    # Guards ``store``; pass the lock of any other thread writing through it.
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    _write_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _path: Path | None = field(default=None, init=False, repr=False)
+    _sequence: int = field(default=0, init=False, repr=False)
+
+    def wrap(self, fetch_fn: FetchFn) -> FetchFn:
+        """Capture every full response ``fetch_fn`` returns; 304s carry no body and are skipped."""
+
+        def fetch(url: str, **kwargs: Any) -> FetchedDoc:
+            fetched = fetch_fn(url, **kwargs)
+            if fetched.status_code != 304:
+                try:
+                    fetched.warc_path = str(self.append(url, fetched))
+                except OSError as e:
+                    logger.warning(f"WARC capture failed for {url}: {e}")
+            return fetched
+
+        return fetch
+
+    def append(self, url: str, fetched: FetchedDoc) -> WarcLocation:
+        digest = fetched.sha256()
+        head = _response_head(fetched, digest)
+        with self._write_lock:
+            path = self._current_file()
+            with path.open("ab") as handle:
+                offset = handle.tell()
+                try:
+                    # Spooled bodies are compressed straight from the blob store.
+                    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+                    for part in chain([head], fetched.iter_body(), [_RECORD_END]):
+                        handle.write(compressor.compress(part))
+                    handle.write(compressor.flush())
+                    handle.flush()
+                except BaseException:
+                    # A partial gzip member would corrupt every record appended after it.
+                    handle.truncate(offset)
+                    raise
+                length = handle.tell() - offset
+        record = WarcRecord(
+            url=url,
+            target_uri=fetched.url,
+            digest=f"sha256:{digest}",
+            warc_file=path.name,
+            offset=offset,
+            length=length,
+            status=fetched.status_code,
+            content_type=fetched.headers.get("content-type", ""),
+            retrieved_at=fetched.retrieved_at,
+        )
+        with self.lock:
+            self.store.insert_warc_record(record)
+        return WarcLocation(path=path, offset=offset, length=length)
+
+    def _current_file(self) -> Path:
+        if self._path is not None and self._path.stat().st_size < self.max_file_bytes:
+            return self._path
+        self.warc_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        while True:
+            self._sequence += 1
+            path = self.warc_dir / f"research-agent-{stamp}-{self._sequence:05d}.warc.gz"
+            if not path.exists():
+                break
+        path.write_bytes(gzip.compress(_warcinfo_record(path.name)))
+        logger.debug(f"Started WARC file {path}")
+        self._path = path
+        return path
+
+
+@dataclass
+class WarcReplay:
+    """Serves fetches from captured WARC records without touching the network.
+
+    The SQLite index gives each URL's file and offset, so a replay reads exactly
+    one gzip member instead of scanning the archive.
+    """
+
+    warc_dir: Path
+    store: EvidenceStore
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def fetch(self, url: str, **kwargs: Any) -> FetchedDoc:
+        with self.lock:
+            record = self.store.latest_warc_record(url)
+        if record is None:
+            raise WarcMissError(f"{url} was not captured in {self.warc_dir}")
+        location = WarcLocation(self.warc_dir / record.warc_file, record.offset, record.length)
+        fetched = read_record(location)
+        fetched.warc_path = str(location)
+        return fetched
+
+
+def read_record(location: WarcLocation) -> FetchedDoc:
+    """Read one response record with a single seek into its WARC file."""
+    with location.path.open("rb") as handle:
+        handle.seek(location.offset)
+        member = handle.read(location.length)
+    return _parse_response_record(gzip.decompress(member))
+
+
+def _response_head(fetched: FetchedDoc, digest: str) -> bytes:
+    """WARC and HTTP headers of a response record; the body and record end follow."""
+    phrase = _reason_phrase(fetched.status_code)
+    lines = [f"HTTP/1.1 {fetched.status_code} {phrase}"]
+    for name, value in fetched.headers.items():
+        if name.lower() not in _DROPPED_HEADERS:
+            lines.append(f"{name}: {value}")
+    lines.append(f"Content-Length: {fetched.size()}")
+    # HTTP header bytes are ISO-8859-1, which is also how replay decodes them.
+    http_head = ("\r\n".join(lines) + "\r\n\r\n").encode("iso-8859-1", errors="replace")
+    headers = {
+        "WARC-Type": "response",
+        "WARC-Record-ID": f"<urn:uuid:{uuid.uuid4()}>",
+        "WARC-Date": fetched.retrieved_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "WARC-Target-URI": fetched.url,
+        "WARC-Payload-Digest": f"sha256:{digest}",
+        "Content-Type": "application/http;msgtype=response",
+        "Content-Length": str(len(http_head) + fetched.size()),
+    }
+    return _warc_head(headers) + http_head
+
+
+def _warcinfo_record(filename: str) -> bytes:
+    block = b"software: research-agent\r\nformat: WARC File Format 1.1\r\n"
+    headers = {
+        "WARC-Type": "warcinfo",
+        "WARC-Record-ID": f"<urn:uuid:{uuid.uuid4()}>",
+        "WARC-Date": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "WARC-Filename": filename,
+        "Content-Type": "application/warc-fields",
+        "Content-Length": str(len(block)),
+    }
+    return _warc_head(headers) + block + _RECORD_END
+
+
+def _warc_head(headers: dict[str, str]) -> bytes:
+    lines = [WARC_VERSION, *(f"{name}: {value}" for name, value in headers.items())]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+
+def _parse_response_record(record: bytes) -> FetchedDoc:
+    warc_head, _, rest = record.partition(b"\r\n\r\n")
+    warc_headers = _parse_headers(warc_head.decode("utf-8").split("\r\n")[1:])
+    block = rest[: int(warc_headers["content-length"])]
+    http_head, _, body = block.partition(b"\r\n\r\n")
+    status_line, *header_lines = http_head.decode("iso-8859-1").split("\r\n")
+    headers = _parse_headers(header_lines)
+    headers.pop("content-length", None)
+    return FetchedDoc(
+        url=warc_headers["warc-target-uri"],
+        status_code=int(status_line.split(" ", 2)[1]),
+        content=body,
+        headers=headers,
+        retrieved_at=datetime.strptime(warc_headers["warc-date"], "%Y-%m-%dT%H:%M:%SZ"),
+    )
+
+
+def _parse_headers(lines: list[str]) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for line in lines:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _reason_phrase(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
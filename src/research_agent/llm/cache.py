@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Any
+
+from loguru import logger
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evicted: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evicted": self.evicted,
+        }
+
+
+def response_cache_key(
+    model_name: str,
+    api_base: str,
+    messages: list[Any],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    raw = json.dumps(
+        {
+            "model": model_name,
+            "api_base": api_base.rstrip("/"),
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Persistent chat completion cache keyed by prompt, model and sampling params."""
+
+    def __init__(self, db_path: Path, max_entries: int = 20000, max_age_days: int = 30) -> None:
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        key TEXT PRIMARY KEY,
+                        model_name TEXT NOT NULL,
+                        response TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        created_at TEXT NOT NULL,
+                        last_used_at TEXT NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used_at)"
+                )
+            self._conn = conn
+            self.prune()
+        return self._conn
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            conn = self.connect()
+            row = conn.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE llm_responses SET last_used_at = ? WHERE key = ?",
+                    (datetime.utcnow().isoformat(), key),
+                )
+            self.stats.hits += 1
+            return str(row[0])
+
+    def put(self, key: str, model_name: str, response: str) -> None:
+        now = datetime.utcnow().isoformat()
+        with self._lock:
+            conn = self.connect()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO llm_responses (key, model_name, response, size, created_at, last_used_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        response=excluded.response,
+                        size=excluded.size,
+                        created_at=excluded.created_at,
+                        last_used_at=excluded.last_used_at
+                    """,
+                    (key, model_name, response, len(response), now, now),
+                )
+            self.stats.writes += 1
+
+    def prune(self) -> int:
+        """Drop entries older than max_age_days, then the least recently used beyond max_entries."""
+        conn = self._conn
+        if conn is None:
+            return 0
+        removed = 0
+        with conn:
+            if self.max_age_days > 0:
+                cutoff = (datetime.utcnow() - timedelta(days=self.max_age_days)).isoformat()
+                removed += conn.execute(
+                    "DELETE FROM llm_responses WHERE created_at < ?", (cutoff,)
+                ).rowcount
+            if self.max_entries > 0:
+                removed += conn.execute(
+                    """
+                    DELETE FROM llm_responses WHERE key IN (
+                        SELECT key FROM llm_responses ORDER BY last_used_at DESC, rowid DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                ).rowcount
+        if removed:
+            logger.debug(f"Evicted {removed} cached LLM responses")
+        self.stats.evicted += removed
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self.prune()
+                self._conn.close()
+                self._conn = None
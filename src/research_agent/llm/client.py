@@ -1,14 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import threading
+from typing import Any
 
 import httpx
 from loguru import logger
 
+from research_agent.llm.cache import LLMResponseCache, response_cache_key
 from research_agent.logging import trace
 from research_agent.types import ChatMessage
 
 
+@dataclass
+class TransportStats:
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "tls_handshakes": self.tls_handshakes,
+        }
+
+
 @dataclass
 class OpenAICompatClient:
     api_base: str
@@ -16,13 +38,33 @@ class OpenAICompatClient:
     timeout_s: int = 60
     api_key: str | None = None
     extra_headers: dict[str, str] | None = None
+    max_connections: int = 16
+    max_keepalive_connections: int = 8
+    keepalive_expiry_s: float = 30.0
+    http2: bool = False
+    response_cache: LLMResponseCache | None = None
+    stats: TransportStats = field(default_factory=TransportStats)
+    _http: httpx.Client | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def chat(
         self,
         messages: list[ChatMessage],
         temperature: float = 0.2,
         max_tokens: int = 512,
+        use_cache: bool = True,
     ) -> str:
+        cache_key = None
+        if self.response_cache is not None and use_cache:
+            cache_key = response_cache_key(
+                self.model_name, self.api_base, messages, temperature, max_tokens
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {self.model_name}")
+                trace("llm_cache_hit", model=self.model_name, key=cache_key)
+                return cached
+
         url = f"{self.api_base.rstrip('/')}/chat/completions"
         payload = {
             "model": self.model_name,
@@ -36,15 +78,22 @@ class OpenAICompatClient:
         trace("llm_request", model=self.model_name, messages=messages, max_tokens=max_tokens)
 
         try:
-            with httpx.Client(timeout=self.timeout_s) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
+            response = self._client().post(
+                url,
+                json=payload,
+                headers=headers,
+                extensions={"trace": self._on_transport_event},
+            )
+            response.raise_for_status()
         except httpx.RequestError as exc:
             logger.error(f"LLM request failed: {exc}")
             raise RuntimeError(f"LLM endpoint unreachable: {exc}") from exc
         except httpx.HTTPStatusError as exc:
             logger.error(f"LLM HTTP error: {exc.response.status_code}")
             raise RuntimeError(f"LLM HTTP error: {exc.response.status_code}") from exc
+        finally:
+            with self._lock:
+                self.stats.requests += 1
 
         data = response.json()
         choices = data.get("choices", [])
@@ -57,9 +106,55 @@ class OpenAICompatClient:
 
         logger.debug(f"LLM response received ({len(content)} chars)")
         trace("llm_response", model=self.model_name, response=content)
+        if cache_key is not None and self.response_cache is not None:
+            self.response_cache.put(cache_key, self.model_name, content)
 
         return content
 
+    def close(self) -> None:
+        if self.response_cache is not None:
+            self.response_cache.close()
+            trace("llm_cache_stats", model=self.model_name, **self.response_cache.stats.as_dict())
+        with self._lock:
+            http, self._http = self._http, None
+        if http is None:
+            return
+        http.close()
+        logger.debug(f"LLM transport closed: {self.stats.as_dict()}")
+        trace("llm_transport_stats", model=self.model_name, **self.stats.as_dict())
+
+    def __enter__(self) -> "OpenAICompatClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _client(self) -> httpx.Client:
+        with self._lock:
+            if self._http is None:
+                self._http = self._build_http_client()
+            return self._http
+
+    def _build_http_client(self) -> httpx.Client:
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry_s,
+        )
+        try:
+            return httpx.Client(timeout=self.timeout_s, limits=limits, http2=self.http2)
+        except ImportError:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+            return httpx.Client(timeout=self.timeout_s, limits=limits)
+
+    def _on_transport_event(self, event: str, info: dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            with self._lock:
+                self.stats.connections_opened += 1
+        elif event == "connection.start_tls.complete":
+            with self._lock:
+                self.stats.tls_handshakes += 1
+
     def _build_headers(self) -> dict[str, str]:
         headers: dict[str, str] = {}
         if self.api_key:
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
+from pathlib import Path
+from typing import Any
 
 from research_agent.config import AppConfig, ModelEndpointConfig
+from research_agent.llm.cache import LLMResponseCache
 from research_agent.llm.client import OpenAICompatClient
 
 
@@ -20,10 +23,27 @@ def get_model_client(
 ) -> RoutedModel:
     choice = _select_model(config, thinking_extent, override)
     if choice == "local":
-        return RoutedModel(name="local", client=_build_local(config.models.local))
-    if choice == "openrouter":
-        return RoutedModel(name="openrouter", client=_build_openrouter(config.models.openrouter))
-    raise ValueError(f"Unknown model choice: {choice}")
+        client = _build_local(config.models.local)
+    elif choice == "openrouter":
+        client = _build_openrouter(config.models.openrouter)
+    else:
+        raise ValueError(f"Unknown model choice: {choice}")
+    client.response_cache = _build_response_cache(config)
+    return RoutedModel(name=choice, client=client)
+
+
+def llm_cache_path(config: AppConfig) -> Path:
+    return Path(config.storage.sqlite_path).parent / "llm_cache.db"
+
+
+def _build_response_cache(config: AppConfig) -> LLMResponseCache | None:
+    if not config.cache.llm_enabled:
+        return None
+    return LLMResponseCache(
+        llm_cache_path(config),
+        max_entries=config.cache.llm_max_entries,
+        max_age_days=config.cache.llm_max_age_days,
+    )
 
 
 def _select_model(config: AppConfig, thinking_extent: str, override: str | None) -> str:
@@ -41,6 +61,7 @@ def _build_local(endpoint: ModelEndpointConfig) -> OpenAICompatClient:
         api_base=endpoint.api_base,
         model_name=endpoint.model_name,
         timeout_s=endpoint.timeout_s,
+        **_transport_options(endpoint),
     )
 
 
@@ -63,4 +84,14 @@ def _build_openrouter(endpoint: ModelEndpointConfig) -> OpenAICompatClient:
         timeout_s=endpoint.timeout_s,
         api_key=api_key,
         extra_headers=headers or None,
+        **_transport_options(endpoint),
     )
+
+
+def _transport_options(endpoint: ModelEndpointConfig) -> dict[str, Any]:
+    return {
+        "max_connections": endpoint.max_connections,
+        "max_keepalive_connections": endpoint.max_keepalive_connections,
+        "keepalive_expiry_s": endpoint.keepalive_expiry_s,
+        "http2": endpoint.http2,
+    }
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -17,6 +18,7 @@ from loguru import logger
 # Module-level trace file handle
 _trace_file: Any = None
 _trace_path: Path | None = None
+_trace_lock = threading.Lock()
 
 
 def setup_logging(
@@ -99,8 +101,12 @@ def trace(event: str, **payload: Any) -> None:
         "event": event,
         **payload,
     }
-    _trace_file.write(json.dumps(record, default=str) + "\n")
-    _trace_file.flush()
+    line = json.dumps(record, default=str) + "\n"
+    with _trace_lock:
+        if _trace_file is None:
+            return
+        _trace_file.write(line)
+        _trace_file.flush()
 
 
 def get_log_level(verbose: bool = False, debug: bool = False, quiet: bool = False) -> str:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import os
+import tempfile
+from typing import Any
+
+from loguru import logger
+
+from research_agent.config import AppConfig
+
+
+@dataclass
+class ParsedText:
+    text: str
+    parser: str
+    parser_version: str
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+class ParseCache:
+    """Parsed-text cache keyed by (content_hash, parser name, parser version)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> "ParseCache | None":
+        if not config.cache.parse_enabled:
+            return None
+        return cls(Path(config.storage.sqlite_path).parent / "parse_cache")
+
+    def get(self, content_hash: str, parser: str, parser_version: str) -> ParsedText | None:
+        path = self._path(content_hash, parser, parser_version)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {path}: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return ParsedText(
+            text=str(data.get("text", "")),
+            parser=parser,
+            parser_version=parser_version,
+            meta=data.get("meta") or {},
+        )
+
+    def put(self, content_hash: str, parsed: ParsedText) -> None:
+        path = self._path(content_hash, parsed.parser, parsed.parser_version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"text": parsed.text, "meta": parsed.meta}, ensure_ascii=False)
+        # Write-then-rename so concurrent runs never observe a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _path(self, content_hash: str, parser: str, parser_version: str) -> Path:
+        digest = content_hash.removeprefix("sha256:")
+        return self.root / digest[:2] / f"{digest}.{parser}-{parser_version}.json"
@@ -4,6 +4,10 @@ from html.parser import HTMLParser
 
 from loguru import logger
 
+PARSER_NAME = "html"
+# Bump when extraction output changes so cached parses are invalidated.
+PARSER_VERSION = "1"
+
 
 class _TextExtractor(HTMLParser):
     def __init__(self) -> None:
@@ -1,27 +1,113 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from io import BytesIO
+import multiprocessing
+import os
 
 from loguru import logger
+import pypdf
 from pypdf import PdfReader
 
+PARSER_NAME = "pypdf"
+# Bump when extraction output changes so cached parses are invalidated.
+PARSER_VERSION = f"1-{pypdf.__version__}"
 
-def extract_text(pdf_bytes: bytes) -> str:
-    text_parts: list[str] = []
+# Below this many pages per worker, process start-up costs more than it saves.
+MIN_PAGES_PER_WORKER = 8
+
+
+@dataclass
+class PdfText:
+    text: str
+    # (start, end) character offsets into ``text`` for each page, in page order.
+    # Pages without extractable text get an empty span at the current position.
+    page_offsets: list[tuple[int, int]] = field(default_factory=list)
+
+
+def extract_text(pdf_bytes: bytes, workers: int = 1) -> str:
+    return extract_pages(pdf_bytes, workers=workers).text
+
+
+def extract_pages(pdf_bytes: bytes, workers: int = 1) -> PdfText:
+    """Extract text page by page, fanning page ranges out to worker processes.
+
+    ``workers <= 0`` picks a worker count from the CPU count; ``workers == 1``
+    keeps everything in the calling process.
+    """
+    if workers <= 0:
+        workers = min(4, os.cpu_count() or 1)
     try:
         reader = PdfReader(BytesIO(pdf_bytes))
+        page_count = len(reader.pages)
     except Exception as e:
         logger.warning(f"PDF extraction failed: {e}")
-        return ""
+        return PdfText(text="")
+
+    ranges = _page_ranges(page_count, workers)
+    if len(ranges) <= 1:
+        pages = _extract_reader_pages(reader, 0, page_count)
+    else:
+        pages = _extract_parallel(pdf_bytes, ranges)
+        if pages is None:
+            pages = _extract_reader_pages(reader, 0, page_count)
+
+    result = _assemble(pages)
+    logger.debug(f"Extracted {len(result.text)} chars from {page_count}-page PDF")
+    return result
+
 
-    for page in reader.pages:
+def _page_ranges(page_count: int, workers: int) -> list[tuple[int, int]]:
+    workers = min(workers, page_count // MIN_PAGES_PER_WORKER)
+    if workers <= 1:
+        return [(0, page_count)]
+    step = -(-page_count // workers)
+    return [(start, min(page_count, start + step)) for start in range(0, page_count, step)]
+
+
+def _extract_parallel(pdf_bytes: bytes, ranges: list[tuple[int, int]]) -> list[str] | None:
+    # Spawn rather than fork: the runner may already have fetch/LLM threads alive.
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context) as pool:
+            futures = [pool.submit(_extract_range, pdf_bytes, start, stop) for start, stop in ranges]
+            pages: list[str] = []
+            for future in futures:
+                pages.extend(future.result())
+            return pages
+    except Exception as e:
+        logger.warning(f"Parallel PDF extraction failed, falling back to single process: {e}")
+        return None
+
+
+def _extract_range(pdf_bytes: bytes, start: int, stop: int) -> list[str]:
+    reader = PdfReader(BytesIO(pdf_bytes))
+    return _extract_reader_pages(reader, start, stop)
+
+
+def _extract_reader_pages(reader: PdfReader, start: int, stop: int) -> list[str]:
+    pages: list[str] = []
+    for index in range(start, stop):
         try:
-            page_text = page.extract_text()
+            page_text = reader.pages[index].extract_text()
         except Exception:
             page_text = ""
-        if page_text:
-            text_parts.append(page_text)
+        pages.append(page_text or "")
+    return pages
 
-    result = "\n".join(text_parts)
-    logger.debug(f"Extracted {len(result)} chars from PDF")
-    return result
+
+def _assemble(pages: list[str]) -> PdfText:
+    parts: list[str] = []
+    offsets: list[tuple[int, int]] = []
+    cursor = 0
+    for page_text in pages:
+        if not page_text:
+            offsets.append((cursor, cursor))
+            continue
+        if parts:
+            cursor += 1
+        parts.append(page_text)
+        offsets.append((cursor, cursor + len(page_text)))
+        cursor += len(page_text)
+    return PdfText(text="\n".join(parts), page_offsets=offsets)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+
+from research_agent.config import AppConfig
+from research_agent.parse import html, pdf
+from research_agent.parse.cache import ParseCache, ParsedText
+
+TEXT_PARSER_NAME = "text"
+TEXT_PARSER_VERSION = "1"
+
+
+@dataclass
+class SourceParser:
+    cache: ParseCache | None = None
+    pdf_workers: int = 1
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> "SourceParser":
+        return cls(cache=ParseCache.from_config(config), pdf_workers=config.parse.pdf_workers)
+
+    def parse(
+        self,
+        raw: bytes,
+        content_type: str,
+        url: str = "",
+        content_hash: str | None = None,
+    ) -> ParsedText:
+        return parse_source(
+            raw,
+            content_type,
+            url=url,
+            content_hash=content_hash,
+            cache=self.cache,
+            pdf_workers=self.pdf_workers,
+        )
+
+
+def parse_source(
+    raw: bytes,
+    content_type: str,
+    url: str = "",
+    content_hash: str | None = None,
+    cache: ParseCache | None = None,
+    pdf_workers: int = 1,
+) -> ParsedText:
+    """Parse raw HTML/PDF/text bytes, reusing a cached parse of identical content."""
+    kind = source_kind(content_type, url)
+    parser, version = _parser_for(kind)
+    digest = ""
+    if cache is not None:
+        digest = content_hash or hashlib.sha256(raw).hexdigest()
+        cached = cache.get(digest, parser, version)
+        if cached is not None:
+            return cached
+
+    if kind == "pdf":
+        pdf_text = pdf.extract_pages(raw, workers=pdf_workers)
+        parsed = ParsedText(
+            text=pdf_text.text,
+            parser=parser,
+            parser_version=version,
+            meta={"page_offsets": pdf_text.page_offsets},
+        )
+    elif kind == "html":
+        text = html.extract_text(raw.decode("utf-8", errors="replace"))
+        parsed = ParsedText(text=text, parser=parser, parser_version=version)
+    else:
+        text = raw.decode("utf-8", errors="replace")
+        parsed = ParsedText(text=text, parser=parser, parser_version=version)
+
+    if cache is not None:
+        cache.put(digest, parsed)
+    return parsed
+
+
+def source_kind(content_type: str, url: str = "") -> str:
+    lowered = content_type.lower()
+    if "pdf" in lowered or url.lower().endswith(".pdf"):
+        return "pdf"
+    if lowered.startswith("text/plain"):
+        return "text"
+    return "html"
+
+
+def _parser_for(kind: str) -> tuple[str, str]:
+    if kind == "pdf":
+        return pdf.PARSER_NAME, pdf.PARSER_VERSION
+    if kind == "html":
+        return html.PARSER_NAME, html.PARSER_VERSION
+    return TEXT_PARSER_NAME, TEXT_PARSER_VERSION
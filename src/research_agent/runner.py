@@ -1,25 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from typing import Any
 import hashlib
 import json
+import threading
 import uuid
 from urllib.parse import urlparse, unquote
 
 from loguru import logger
 
+from research_agent.blobs.store import BlobRef, BlobStore
 from research_agent.config import AppConfig, SearchConfig
-from research_agent.logging import setup_logging
+from research_agent.logging import setup_logging, trace
+from research_agent.evidence.policy import policy_for_extent
 from research_agent.evidence.reduce import reduce_evidence
 from research_agent.evidence.store import EvidenceStore
-from research_agent.fetch.fetcher import fetch_url
+from research_agent.fetch.fetcher import FetchedDoc, fetch_url
+from research_agent.fetch.http_cache import HttpCache
+from research_agent.fetch.politeness import PolitenessScheduler
+from research_agent.fetch.pool import FetchFn, FetchPool
+from research_agent.fetch.warc import WarcReplay, WarcWriter
 from research_agent.llm.router import get_model_client
-from research_agent.parse.html import extract_text as extract_html_text
-from research_agent.parse.pdf import extract_text as extract_pdf_text
+from research_agent.parse.source import SourceParser
 from research_agent.report.render import render_report
 from research_agent.search.broker import SearchBroker
+from research_agent.search.cache import build_search_cache
+from research_agent.search.providers.local_index import LocalIndexProvider
+from research_agent.streaming import run_streaming
 from research_agent.types import (
     ClaimGroup,
     DocumentText,
@@ -42,6 +53,78 @@ class PipelineResult:
     documents: list[DocumentText]
     propositions: list[Proposition]
     claim_groups: list[ClaimGroup]
+    source_files: dict[str, SourceFiles] = field(default_factory=dict)
+
+
+@dataclass
+class SourceFiles:
+    raw_hash: str
+    text_hash: str
+    raw_path: Path
+    text_path: Path
+
+
+@dataclass
+class SourceContext:
+    """Per-run state shared by the fetched and local ingest paths."""
+
+    run_id: str
+    sources_dir: Path
+    store: EvidenceStore
+    parser: SourceParser
+    blobs: BlobStore
+    files: dict[str, SourceFiles] = field(default_factory=dict)
+    # Streaming runs ingest on worker threads; store writes are serialized here.
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Set when fetches go through the HTTP cache; reported once the run's fetches end.
+    http_cache: HttpCache | None = None
+
+    def record(self, source_doc: SourceDoc, text: str, **run_source: Any) -> None:
+        with self.lock:
+            self.store.upsert_source(source_doc)
+            self.store.insert_run_source(run_id=self.run_id, **run_source)
+            self.store.index_source_text(source_doc.id, str(source_doc.meta.get("title", "")), text)
+
+    def write_files(self, doc_id: str, raw: bytes, text: str, raw_ref: BlobRef | None = None) -> SourceFiles:
+        """Store raw and parsed bytes; ``raw_ref`` is a body the fetcher already spooled."""
+        if raw_ref is None:
+            raw_ref = self.blobs.put_bytes(raw)
+        text_ref = self.blobs.put_text(text)
+        files = SourceFiles(
+            raw_hash=raw_ref.digest,
+            text_hash=text_ref.digest,
+            raw_path=self._link(raw_ref, f"{doc_id}.bin"),
+            text_path=self._link(text_ref, f"{doc_id}.text.txt"),
+        )
+        self.files[doc_id] = files
+        return files
+
+    def report_http_cache(self) -> None:
+        if self.http_cache is None:
+            return
+        stats = self.http_cache.stats.as_dict()
+        logger.info(f"HTTP cache: {stats}")
+        trace("http_cache_stats", mode=self.http_cache.mode, **stats)
+
+    def write_manifest(self) -> Path:
+        manifest = {
+            doc_id: {
+                "raw_blob": files.raw_hash,
+                "text_blob": files.text_hash,
+                "raw_path": str(files.raw_path),
+                "text_path": str(files.text_path),
+            }
+            for doc_id, files in self.files.items()
+        }
+        path = self.sources_dir / "manifest.json"
+        path.write_text(json.dumps(manifest, indent=2))
+        return path
+
+    def _link(self, ref: BlobRef, name: str) -> Path:
+        dest = self.sources_dir / name
+        if self.blobs.link_into(ref, dest):
+            return dest
+        return ref.path
 
 
 def run(
@@ -109,13 +192,7 @@ def run(
             logger.info("Running in native mode")
             pipeline = _run_native(question, config, store, routed.client, run_id, run_dir)
 
-        for proposition in pipeline.propositions:
-            store.upsert_proposition(proposition)
-            for anchor in proposition.anchors:
-                store.insert_annotation(anchor)
-
-        for claim in pipeline.claim_groups:
-            store.upsert_claim_group(claim)
+        store.persist_evidence(pipeline.propositions, pipeline.claim_groups)
 
         report = render_report(question, pipeline.claim_groups)
         report_path = run_dir / "report.md"
@@ -128,8 +205,10 @@ def run(
             routed,
             pipeline.documents,
             pipeline.claim_groups,
+            pipeline.source_files,
         )
 
+        client_stats = _close_client(routed.client)
         store.record_run(
             run_id=run_id,
             question=question,
@@ -138,10 +217,15 @@ def run(
             thinking_extent=config.agent.thinking.extent,
             report_path=str(report_path),
             status="completed",
-            meta={**run_meta, "provenance_path": str(provenance_path)},
+            meta={
+                **run_meta,
+                "provenance_path": str(provenance_path),
+                **client_stats,
+            },
         )
     except Exception:
         logger.exception("Run failed")
+        _close_client(routed.client)
         store.record_run(
             run_id=run_id,
             question=question,
@@ -167,33 +251,98 @@ def _run_native(
     run_id: str,
     run_dir: Path,
 ) -> PipelineResult:
-    broker = SearchBroker.from_config(config.search)
-    queries = build_queries(question, config.search)
-    sources_dir = run_dir / "sources"
-    sources_dir.mkdir(parents=True, exist_ok=True)
-
-    seen_urls: set[str] = set()
-    documents: list[DocumentText] = []
-    for query in queries:
-        logger.debug(f"Query: {query.q}")
-        results = broker.search(query)
-        logger.info(f"Search returned {len(results)} results")
-        for result in results:
-            if result.url in seen_urls:
-                continue
-            seen_urls.add(result.url)
-            logger.debug(f"Fetching {result.url}")
-            doc = _fetch_and_parse(result, query.q, run_id, sources_dir, store)
-            if doc and doc.text:
-                logger.debug(f"Parsed doc {doc.doc_id}")
-                documents.append(doc)
+    broker = SearchBroker.from_config(config.search, config.storage, cache=build_search_cache(config))
+    try:
+        queries = build_queries(question, config.search)
+        context = _source_context(config, store, run_id, run_dir)
+        if config.agent.pipeline == "streaming":
+            return _run_streaming(question, queries, broker, config, llm_client, context)
+
+        seen_urls: set[str] = set()
+        targets: list[tuple[SearchResult, str]] = []
+        for query in queries:
+            logger.debug(f"Query: {query.q}")
+            results = broker.search(query)
+            logger.info(f"Search returned {len(results)} results")
+            for result in results:
+                if result.url in seen_urls:
+                    continue
+                seen_urls.add(result.url)
+                targets.append((result, query.q))
+
+        logger.info(f"Fetching {len(targets)} results")
+        parsed: dict[int, DocumentText] = {}
+        scheduler = _scheduler(config, context)
+        fetch_fn = _fetch_fn(config, broker, context, scheduler)
+        with FetchPool.from_config(config.fetch, fetch_fn=fetch_fn, scheduler=scheduler) as pool:
+            for outcome in pool.fetch_all(result.url for result, _ in targets):
+                result, query_text = targets[outcome.index]
+                if outcome.doc is None:
+                    logger.warning(f"Failed to fetch {result.url}: {outcome.error}")
+                    continue
+                doc = _parse_fetched(result, outcome.doc, query_text, context)
+                if doc.text:
+                    logger.debug(f"Parsed doc {doc.doc_id}")
+                    parsed[outcome.index] = doc
+        documents = [parsed[index] for index in sorted(parsed)]
+        context.write_manifest()
+        context.report_http_cache()
+
+        logger.info(f"Reducing evidence from {len(documents)} documents")
+        reduce_result = reduce_evidence(
+            documents,
+            llm_client,
+            config.agent.thinking.extent,
+            question=question,
+            store=store if config.cache.extraction_enabled else None,
+            label_store=store if config.cache.labels_enabled else None,
+        )
+        return PipelineResult(
+            documents=documents,
+            propositions=reduce_result.propositions,
+            claim_groups=reduce_result.claim_groups,
+            source_files=context.files,
+        )
+    finally:
+        # Closes the search cache and the local index's own store connection.
+        broker.close()
 
-    logger.info(f"Reducing evidence from {len(documents)} documents")
-    reduce_result = reduce_evidence(documents, llm_client, config.agent.thinking.extent)
+def _run_streaming(
+    question: str,
+    queries: list[SearchQuery],
+    broker: SearchBroker,
+    config: AppConfig,
+    llm_client,
+    context: SourceContext,
+) -> PipelineResult:
+    logger.info("Streaming search, fetch, parse and extraction")
+
+    def ingest(result: SearchResult, fetched: FetchedDoc, query_text: str) -> DocumentText:
+        return _parse_fetched(result, fetched, query_text, context)
+
+    scheduler = _scheduler(config, context)
+    fetch_fn = _fetch_fn(config, broker, context, scheduler)
+    with FetchPool.from_config(config.fetch, fetch_fn=fetch_fn, scheduler=scheduler) as pool:
+        streamed = run_streaming(
+            queries,
+            broker,
+            pool,
+            ingest,
+            llm_client,
+            policy_for_extent(config.agent.thinking.extent),
+            queue_size=config.agent.pipeline_queue_size,
+            question=question,
+            label_store=context.store if config.cache.labels_enabled else None,
+            store=context.store if config.cache.extraction_enabled else None,
+            store_lock=context.lock,
+        )
+    context.write_manifest()
+    context.report_http_cache()
     return PipelineResult(
-        documents=documents,
-        propositions=reduce_result.propositions,
-        claim_groups=reduce_result.claim_groups,
+        documents=streamed.documents,
+        propositions=streamed.propositions,
+        claim_groups=streamed.claim_groups,
+        source_files=context.files,
     )
 
 
@@ -219,8 +368,7 @@ def _run_offline(
     sources_path: Path | None,
     input_dir: Path | None,
 ) -> PipelineResult:
-    sources_dir = run_dir / "sources"
-    sources_dir.mkdir(parents=True, exist_ok=True)
+    context = _source_context(config, store, run_id, run_dir)
     files = _collect_offline_sources(sources_path, input_dir)
     if not files:
         raise ValueError("No offline sources found. Provide --sources or --input-dir with files.")
@@ -230,7 +378,7 @@ def _run_offline(
     seen_doc_ids: set[str] = set()
     for rank, path in enumerate(files, start=1):
         logger.debug(f"Ingesting {path}")
-        doc = _ingest_local_source(path, run_id, sources_dir, store, rank)
+        doc = _ingest_local_source(path, rank, context)
         if not doc or not doc.text:
             continue
         if doc.doc_id in seen_doc_ids:
@@ -238,16 +386,106 @@ def _run_offline(
         seen_doc_ids.add(doc.doc_id)
         logger.debug(f"Ingested {doc.doc_id}")
         documents.append(doc)
+    context.write_manifest()
 
     logger.info(f"Reducing evidence from {len(documents)} documents")
-    reduce_result = reduce_evidence(documents, llm_client, config.agent.thinking.extent)
+    reduce_result = reduce_evidence(
+        documents,
+        llm_client,
+        config.agent.thinking.extent,
+        question=question,
+        store=store if config.cache.extraction_enabled else None,
+        label_store=store if config.cache.labels_enabled else None,
+    )
     return PipelineResult(
         documents=documents,
         propositions=reduce_result.propositions,
         claim_groups=reduce_result.claim_groups,
+        source_files=context.files,
+    )
+
+
+def _source_context(
+    config: AppConfig,
+    store: EvidenceStore,
+    run_id: str,
+    run_dir: Path,
+) -> SourceContext:
+    sources_dir = run_dir / "sources"
+    sources_dir.mkdir(parents=True, exist_ok=True)
+    return SourceContext(
+        run_id=run_id,
+        sources_dir=sources_dir,
+        store=store,
+        parser=SourceParser.from_config(config),
+        blobs=BlobStore.from_config(config.storage),
     )
 
 
+def _scheduler(config: AppConfig, context: SourceContext) -> PolitenessScheduler | None:
+    """Politeness for runs that may reach the network; offline runs read at disk speed."""
+    if config.storage.warc_replay or config.cache.http_mode == "cache_only":
+        return None
+    return PolitenessScheduler.from_config(config.fetch, store=context.store, lock=context.lock)
+
+
+def _fetch_fn(
+    config: AppConfig,
+    broker: SearchBroker,
+    context: SourceContext,
+    scheduler: PolitenessScheduler | None = None,
+) -> FetchFn:
+    storage = config.storage
+    if storage.warc_replay:
+        replay = WarcReplay(warc_dir=storage.warc_dir, store=context.store, lock=context.lock)
+        return _local_first(replay.fetch, broker)
+
+    fetch_fn: FetchFn = partial(
+        fetch_url,
+        max_bytes=int(config.fetch.max_body_mb * 1024 * 1024),
+        spool=context.blobs,
+        spool_bytes=int(config.fetch.spool_mb * 1024 * 1024),
+    )
+    if scheduler is not None:
+        # Innermost, so only requests that really reach an origin wait or check robots.txt.
+        fetch_fn = scheduler.wrap(fetch_fn)
+    if storage.warc_capture:
+        writer = WarcWriter(
+            warc_dir=storage.warc_dir,
+            store=context.store,
+            max_file_bytes=int(storage.warc_max_file_mb * 1024 * 1024),
+            lock=context.lock,
+        )
+        fetch_fn = writer.wrap(fetch_fn)
+    if config.cache.http_mode != "off":
+        http_cache = HttpCache(
+            store=context.store,
+            blobs=context.blobs,
+            fresh_s=config.cache.http_fresh_hours * 3600,
+            mode=config.cache.http_mode,
+            lock=context.lock,
+        )
+        context.http_cache = http_cache
+        fetch_fn = http_cache.wrap(fetch_fn)
+    return _local_first(fetch_fn, broker)
+
+
+def _local_first(fetch_fn: FetchFn, broker: SearchBroker) -> FetchFn:
+    """Serve results from the local index out of the blob store, the rest via ``fetch_fn``."""
+    local = [provider for provider in broker.providers if isinstance(provider, LocalIndexProvider)]
+    if not local:
+        return fetch_fn
+
+    def fetch(url: str, **kwargs: Any) -> FetchedDoc:
+        for provider in local:
+            stored = provider.fetch(url)
+            if stored is not None:
+                return stored
+        return fetch_fn(url, **kwargs)
+
+    return fetch
+
+
 def build_queries(question: str, search_config: SearchConfig) -> list[SearchQuery]:
     return [
         SearchQuery(
@@ -259,48 +497,43 @@ def build_queries(question: str, search_config: SearchConfig) -> list[SearchQuer
     ]
 
 
-def _fetch_and_parse(
+def _parse_fetched(
     result: SearchResult,
+    fetched: FetchedDoc,
     query_text: str,
-    run_id: str,
-    sources_dir: Path,
-    store: EvidenceStore,
-) -> DocumentText | None:
-    try:
-        fetched = fetch_url(result.url)
-    except Exception as e:
-        logger.warning(f"Failed to fetch {result.url}: {e}")
-        return None
-
+    context: SourceContext,
+) -> DocumentText:
     content_type = fetched.headers.get("content-type", "text/html")
-    content_hash = hashlib.sha256(fetched.content).hexdigest()
+    content_hash = fetched.sha256()
     doc_id = f"src_{content_hash[:12]}"
 
-    raw_path = sources_dir / f"{doc_id}.bin"
-    raw_path.write_bytes(fetched.content)
-
-    text = ""
-    if _is_pdf(content_type, fetched.url):
-        text = extract_pdf_text(fetched.content)
-    else:
-        text = extract_html_text(fetched.content.decode("utf-8", errors="replace"))
-
-    text_path = sources_dir / f"{doc_id}.text.txt"
-    text_path.write_text(text)
+    raw = fetched.body()
+    parsed = context.parser.parse(
+        raw,
+        content_type,
+        url=fetched.url,
+        content_hash=content_hash,
+    )
+    text = parsed.text
+    meta: dict[str, object] = {"title": result.title, "snippet": result.snippet, **parsed.meta}
+    files = context.write_files(doc_id, raw, text, raw_ref=fetched.blob)
 
     source_doc = SourceDoc(
         id=doc_id,
         url=fetched.url,
         retrieved_at=fetched.retrieved_at,
         content_hash=f"sha256:{content_hash}",
-        warc_path=None,
+        warc_path=fetched.warc_path,
         mime=content_type.split(";")[0],
         engine=result.engine,
-        meta={"title": result.title, "snippet": result.snippet},
+        meta=meta,
+        etag=fetched.headers.get("etag"),
+        last_modified=fetched.headers.get("last-modified"),
+        requested_url=result.url if result.url != fetched.url else None,
     )
-    store.upsert_source(source_doc)
-    store.insert_run_source(
-        run_id=run_id,
+    context.record(
+        source_doc,
+        text,
         doc_id=doc_id,
         url=fetched.url,
         engine=result.engine,
@@ -311,8 +544,9 @@ def _fetch_and_parse(
         snippet=result.snippet,
         content_type=content_type,
         content_hash=content_hash,
-        raw_path=str(raw_path),
-        text_path=str(text_path),
+        raw_path=str(files.raw_path),
+        text_path=str(files.text_path),
+        text_hash=files.text_hash,
     )
 
     return DocumentText(
@@ -329,12 +563,6 @@ def _fetch_and_parse(
     )
 
 
-def _is_pdf(content_type: str, url: str) -> bool:
-    if "pdf" in content_type.lower():
-        return True
-    return url.lower().endswith(".pdf")
-
-
 def _collect_offline_sources(sources_path: Path | None, input_dir: Path | None) -> list[Path]:
     collected: list[Path] = []
     seen: set[Path] = set()
@@ -388,10 +616,8 @@ def _parse_source_line(line: str, base_dir: Path) -> Path | None:
 
 def _ingest_local_source(
     path: Path,
-    run_id: str,
-    sources_dir: Path,
-    store: EvidenceStore,
     rank: int,
+    context: SourceContext,
 ) -> DocumentText | None:
     try:
         raw = path.read_bytes()
@@ -403,18 +629,10 @@ def _ingest_local_source(
     content_hash = hashlib.sha256(raw).hexdigest()
     doc_id = f"src_{content_hash[:12]}"
 
-    raw_path = sources_dir / f"{doc_id}.bin"
-    raw_path.write_bytes(raw)
-
-    if content_type == "application/pdf":
-        text = extract_pdf_text(raw)
-    elif content_type == "text/html":
-        text = extract_html_text(raw.decode("utf-8", errors="replace"))
-    else:
-        text = raw.decode("utf-8", errors="replace")
-
-    text_path = sources_dir / f"{doc_id}.text.txt"
-    text_path.write_text(text)
+    parsed = context.parser.parse(raw, content_type, url=path.name, content_hash=content_hash)
+    text = parsed.text
+    meta: dict[str, object] = {"title": path.name, **parsed.meta}
+    files = context.write_files(doc_id, raw, text)
 
     url = path.resolve().as_uri()
     retrieved_at = datetime.utcnow()
@@ -426,11 +644,11 @@ def _ingest_local_source(
         warc_path=None,
         mime=content_type,
         engine="local",
-        meta={"title": path.name},
+        meta=meta,
     )
-    store.upsert_source(source_doc)
-    store.insert_run_source(
-        run_id=run_id,
+    context.record(
+        source_doc,
+        text,
         doc_id=doc_id,
         url=url,
         engine="local",
@@ -441,8 +659,9 @@ def _ingest_local_source(
         snippet="",
         content_type=content_type,
         content_hash=content_hash,
-        raw_path=str(raw_path),
-        text_path=str(text_path),
+        raw_path=str(files.raw_path),
+        text_path=str(files.text_path),
+        text_hash=files.text_hash,
     )
 
     return DocumentText(
@@ -468,6 +687,25 @@ def _guess_content_type(path: Path) -> str:
     return "text/plain"
 
 
+def _close_client(llm_client) -> dict[str, object]:
+    close = getattr(llm_client, "close", None)
+    if close is None:
+        return {}
+    close()
+    client_stats: dict[str, object] = {}
+    stats = getattr(llm_client, "stats", None)
+    if stats is not None:
+        logger.info(
+            f"LLM transport: {stats.requests} requests over {stats.connections_opened} connections"
+        )
+        client_stats["llm_transport"] = stats.as_dict()
+    cache = getattr(llm_client, "response_cache", None)
+    if cache is not None:
+        logger.info(f"LLM cache: {cache.stats.hits} hits, {cache.stats.misses} misses")
+        client_stats["llm_cache"] = cache.stats.as_dict()
+    return client_stats
+
+
 def _write_provenance(
     run_dir: Path,
     run_id: str,
@@ -475,6 +713,7 @@ def _write_provenance(
     routed,
     documents: list[DocumentText],
     claim_groups: list[ClaimGroup],
+    source_files: dict[str, SourceFiles],
 ) -> Path:
     data = {
         "run_id": run_id,
@@ -496,8 +735,7 @@ def _write_provenance(
                 "content_type": doc.content_type,
                 "engine": doc.engine,
                 "rank": doc.rank,
-                "raw_path": str(run_dir / "sources" / f"{doc.doc_id}.bin"),
-                "text_path": str(run_dir / "sources" / f"{doc.doc_id}.text.txt"),
+                **_provenance_paths(source_files.get(doc.doc_id)),
             }
             for doc in documents
         ],
@@ -517,6 +755,17 @@ def _write_provenance(
     return provenance_path
 
 
+def _provenance_paths(files: SourceFiles | None) -> dict[str, str | None]:
+    if files is None:
+        return {"raw_path": None, "text_path": None, "raw_blob": None, "text_blob": None}
+    return {
+        "raw_path": str(files.raw_path),
+        "text_path": str(files.text_path),
+        "raw_blob": files.raw_hash,
+        "text_blob": files.text_hash,
+    }
+
+
 def _make_run_id() -> str:
     stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     return f"{stamp}_{uuid.uuid4().hex[:6]}"
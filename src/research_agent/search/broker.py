@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Protocol
+import threading
+import time
 
 from loguru import logger
 
-from research_agent.config import SearchConfig
+from research_agent.config import SearchConfig, StorageConfig
+from research_agent.logging import trace
+from research_agent.search.cache import CachedSearch, SearchCache, search_cache_key
 from research_agent.types import SearchQuery, SearchResult
-from research_agent.search.providers import brave, google_pse, serper, tavily
+from research_agent.search.providers import brave, google_pse, local_index, serper, tavily
 
 
 class SearchProvider(Protocol):
@@ -21,9 +26,23 @@ class SearchProvider(Protocol):
 @dataclass
 class SearchBroker:
     providers: list[SearchProvider]
+    provider_timeout_s: float = 10.0
+    provider_timeouts: dict[str, float] = field(default_factory=dict)
+    deadline_s: float = 20.0
+    cache: SearchCache | None = None
+    # Spend cap for paid provider calls made by this broker; None means unlimited.
+    budget_usd: float | None = None
+    spent_usd: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _refreshing: set[str] = field(default_factory=set, init=False, repr=False)
 
     @classmethod
-    def from_config(cls, config: SearchConfig) -> "SearchBroker":
+    def from_config(
+        cls,
+        config: SearchConfig,
+        storage: StorageConfig | None = None,
+        cache: SearchCache | None = None,
+    ) -> "SearchBroker":
         providers: list[SearchProvider] = []
         for name in config.providers:
             if name == "brave":
@@ -34,26 +53,210 @@ class SearchBroker:
                 providers.append(tavily.TavilyProvider())
             elif name == "serper":
                 providers.append(serper.SerperProvider())
+            elif name == "local_index":
+                if storage is None:
+                    logger.warning("local_index provider needs storage config; skipping")
+                    continue
+                providers.append(local_index.LocalIndexProvider.from_config(storage))
             else:
                 continue
+            if not _configured(providers[-1]):
+                logger.warning(f"Search provider {name} is not configured; it will be skipped")
         logger.debug(f"Initialized search providers: {[p.name for p in providers]}")
-        return cls(providers=providers)
+        return cls(
+            providers=providers,
+            provider_timeout_s=config.provider_timeout_s,
+            provider_timeouts=dict(config.provider_timeouts),
+            deadline_s=config.deadline_s,
+            cache=cache,
+            budget_usd=config.api_budget_usd,
+        )
 
     def search(self, query: SearchQuery) -> list[SearchResult]:
-        results: list[SearchResult] = []
-        for provider in self.providers:
-            try:
-                logger.debug(f"Searching {provider.name}...")
-                provider_results = provider.search(query)
-                logger.debug(f"{provider.name} returned {len(provider_results)} results")
-                results.extend(provider_results)
-            except Exception as e:
-                logger.warning(f"Provider {provider.name} failed: {e}")
+        """Query every provider concurrently and fuse whatever arrives in time.
+
+        Fresh cached results are used without a call. Stale ones are used at once
+        and refreshed in the background. Once the budget is spent, paid providers
+        fall back to any cached results and are otherwise skipped. Providers
+        without credentials are skipped before they are charged or cached.
+
+        The budget is charged when a call starts and refunded if the provider
+        raises. A call abandoned at its timeout stays charged, since it may still
+        complete and be billed.
+
+        A provider that fails or outlives its timeout (or the broker deadline) is
+        dropped from this query; its thread is abandoned rather than waited for.
+        """
+        if not self.providers:
+            return []
+        started = time.monotonic()
+        by_provider: list[list[SearchResult]] = [[] for _ in self.providers]
+        live: list[int] = []
+        for idx, provider in enumerate(self.providers):
+            if not _configured(provider):
+                _trace_provider(provider.name, started, "unconfigured", 0)
                 continue
+            cached = self._cached(provider, query)
+            if cached is not None and not cached.stale:
+                by_provider[idx] = cached.results
+                _trace_provider(provider.name, started, "cache", len(cached.results))
+            elif not self._charge(provider):
+                if cached is not None:
+                    by_provider[idx] = cached.results
+                logger.warning(f"Search budget spent; {provider.name} served from cache only")
+                _trace_provider(provider.name, started, "budget", len(by_provider[idx]))
+            elif cached is not None:
+                by_provider[idx] = cached.results
+                _trace_provider(provider.name, started, "stale", len(cached.results))
+                self._revalidate(provider, query)
+            else:
+                live.append(idx)
+
+        if live:
+            self._search_live(query, live, by_provider, started)
+
+        # Fuse in configured provider order so ranking does not depend on timing.
+        results = [result for provider_results in by_provider for result in provider_results]
         ranked = rrf_rank(results)
         logger.info(f"Search returned {len(ranked)} total results")
         return ranked
 
+    def close(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
+        for provider in self.providers:
+            close = getattr(provider, "close", None)
+            if close is not None:
+                close()
+
+    def _search_live(
+        self,
+        query: SearchQuery,
+        live: list[int],
+        by_provider: list[list[SearchResult]],
+        started: float,
+    ) -> None:
+        cutoffs = {
+            idx: started
+            + min(
+                self.provider_timeouts.get(self.providers[idx].name, self.provider_timeout_s),
+                self.deadline_s,
+            )
+            for idx in live
+        }
+        executor = ThreadPoolExecutor(max_workers=len(live), thread_name_prefix="search")
+        futures: dict[Future[list[SearchResult]], int] = {}
+        for idx in live:
+            logger.debug(f"Searching {self.providers[idx].name}...")
+            futures[executor.submit(self._query_provider, self.providers[idx], query)] = idx
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+                for future in [f for f in pending if cutoffs[futures[f]] <= now]:
+                    pending.discard(future)
+                    idx = futures[future]
+                    name = self.providers[idx].name
+                    logger.warning(f"Provider {name} timed out after {cutoffs[idx] - started:.1f}s")
+                    _trace_provider(name, started, "timeout", 0)
+                if not pending:
+                    break
+                next_cutoff = min(cutoffs[futures[f]] for f in pending)
+                done, _ = wait(pending, timeout=max(0.0, next_cutoff - now), return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    idx = futures[future]
+                    name = self.providers[idx].name
+                    try:
+                        provider_results = future.result()
+                    except Exception as e:
+                        logger.warning(f"Provider {name} failed: {e}")
+                        _trace_provider(name, started, "error", 0)
+                        self._refund(self.providers[idx])
+                        continue
+                    logger.debug(f"{name} returned {len(provider_results)} results")
+                    _trace_provider(name, started, "ok", len(provider_results))
+                    by_provider[idx] = provider_results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _query_provider(self, provider: SearchProvider, query: SearchQuery) -> list[SearchResult]:
+        results = provider.search(query)
+        # Cached from the worker, so a provider that misses its timeout still
+        # warms the cache for the next run.
+        if self.cache is not None and _cacheable(provider):
+            self.cache.put(provider.name, query, results)
+        return results
+
+    def _cached(self, provider: SearchProvider, query: SearchQuery) -> CachedSearch | None:
+        if self.cache is None or not _cacheable(provider):
+            return None
+        try:
+            return self.cache.get(provider.name, query)
+        except Exception as e:
+            logger.warning(f"Search cache lookup failed for {provider.name}: {e}")
+            return None
+
+    def _charge(self, provider: SearchProvider) -> bool:
+        """Reserve one query's cost against the budget; False once it would be exceeded."""
+        cost = float(getattr(provider, "cost_per_query_usd", 0.0))
+        if cost <= 0 or self.budget_usd is None:
+            return True
+        with self._lock:
+            if self.spent_usd + cost > self.budget_usd + 1e-9:
+                return False
+            self.spent_usd += cost
+        trace("search_spend", provider=provider.name, cost_usd=cost, spent_usd=round(self.spent_usd, 6))
+        return True
+
+    def _refund(self, provider: SearchProvider) -> None:
+        """Return a failed call's reservation to the budget."""
+        cost = float(getattr(provider, "cost_per_query_usd", 0.0))
+        if cost <= 0 or self.budget_usd is None:
+            return
+        with self._lock:
+            self.spent_usd = max(0.0, self.spent_usd - cost)
+        trace("search_refund", provider=provider.name, cost_usd=cost, spent_usd=round(self.spent_usd, 6))
+
+    def _revalidate(self, provider: SearchProvider, query: SearchQuery) -> None:
+        key = search_cache_key(provider.name, query)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._query_provider(provider, query)
+            except Exception as e:
+                logger.debug(f"Background refresh of {provider.name} failed: {e}")
+                self._refund(provider)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"search-refresh-{provider.name}", daemon=True).start()
+
+
+def _configured(provider: SearchProvider) -> bool:
+    # False for providers missing credentials; calling them would never reach an API.
+    return bool(getattr(provider, "configured", True))
+
+
+def _cacheable(provider: SearchProvider) -> bool:
+    # Providers over local data opt out; their results change as the corpus grows.
+    return bool(getattr(provider, "cacheable", True))
+
+
+def _trace_provider(name: str, started: float, status: str, results: int) -> None:
+    trace(
+        "search_provider",
+        provider=name,
+        status=status,
+        results=results,
+        latency_s=round(time.monotonic() - started, 3),
+    )
+
 
 def rrf_rank(results: list[SearchResult], k: int = 60) -> list[SearchResult]:
     """
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from typing import Any
+
+from loguru import logger
+
+from research_agent.config import AppConfig
+from research_agent.llm.cache import CacheStats
+from research_agent.types import SearchQuery, SearchResult
+
+_TRIM_RE = re.compile(r"^[\s\"'?!.,;:]+|[\s\"'?!.,;:]+$")
+
+
+@dataclass
+class CachedSearch:
+    results: list[SearchResult]
+    age_s: float
+    # Past the provider TTL but still inside the stale-while-revalidate window.
+    stale: bool
+
+
+def normalize_query(text: str) -> str:
+    """Case-fold, collapse whitespace and trim surrounding punctuation."""
+    return _TRIM_RE.sub("", " ".join(text.casefold().split()))
+
+
+def search_cache_key(provider: str, query: SearchQuery) -> str:
+    raw = json.dumps(
+        {
+            "provider": provider,
+            "q": normalize_query(query.q),
+            "sites": sorted({site.lower().strip() for site in query.site_filters}),
+            "time_range": query.time_range,
+            "freshness_days": query.freshness_days,
+            "region": query.region,
+            "topk": query.topk,
+            "safe_mode": query.safe_mode,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def search_cache_path(config: AppConfig) -> Path:
+    return Path(config.storage.sqlite_path).parent / "search_cache.db"
+
+
+def build_search_cache(config: AppConfig) -> SearchCache | None:
+    if not config.cache.search_enabled:
+        return None
+    return SearchCache(
+        search_cache_path(config),
+        ttl_s=config.cache.search_ttl_hours * 3600,
+        ttls={name: hours * 3600 for name, hours in config.cache.search_ttls_hours.items()},
+        stale_s=config.cache.search_stale_hours * 3600,
+    )
+
+
+class SearchCache:
+    """Persistent provider result cache with per-provider TTLs.
+
+    Entries younger than the provider TTL are fresh; for ``stale_s`` after that
+    they are still served while the caller revalidates, and are then dropped.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_s: float = 86400.0,
+        ttls: dict[str, float] | None = None,
+        stale_s: float = 7 * 86400.0,
+    ) -> None:
+        self.db_path = db_path
+        self.ttl_s = ttl_s
+        self.ttls = dict(ttls or {})
+        self.stale_s = stale_s
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Abandoned provider calls and background refreshes may finish after close.
+        self._closed = False
+
+    def connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS search_results (
+                        key TEXT PRIMARY KEY,
+                        provider TEXT NOT NULL,
+                        query TEXT NOT NULL,
+                        results_json TEXT NOT NULL,
+                        created_at TEXT NOT NULL
+                    )
+                    """
+                )
+            self._conn = conn
+            self.prune()
+        return self._conn
+
+    def ttl_for(self, provider: str) -> float:
+        return self.ttls.get(provider, self.ttl_s)
+
+    def get(self, provider: str, query: SearchQuery) -> CachedSearch | None:
+        key = search_cache_key(provider, query)
+        with self._lock:
+            if self._closed:
+                return None
+            row = self.connect().execute(
+                "SELECT results_json, created_at FROM search_results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        age_s = (datetime.utcnow() - datetime.fromisoformat(row[1])).total_seconds()
+        ttl_s = self.ttl_for(provider)
+        if age_s > ttl_s + self.stale_s:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        results = [_result_from_dict(item) for item in json.loads(row[0])]
+        return CachedSearch(results=results, age_s=age_s, stale=age_s > ttl_s)
+
+    def put(self, provider: str, query: SearchQuery, results: list[SearchResult]) -> None:
+        key = search_cache_key(provider, query)
+        payload = json.dumps([asdict(result) for result in results], default=_json_default)
+        with self._lock:
+            if self._closed:
+                logger.debug(f"Search cache closed; dropping late {provider} results")
+                return
+            conn = self.connect()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO search_results (key, provider, query, results_json, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        results_json=excluded.results_json,
+                        created_at=excluded.created_at
+                    """,
+                    (key, provider, normalize_query(query.q), payload, datetime.utcnow().isoformat()),
+                )
+            self.stats.writes += 1
+
+    def prune(self) -> int:
+        """Drop entries no provider would serve any more, even as stale."""
+        conn = self._conn
+        if conn is None:
+            return 0
+        longest = max([self.ttl_s, *self.ttls.values()]) + self.stale_s
+        cutoff = (datetime.utcnow() - timedelta(seconds=longest)).isoformat()
+        with conn:
+            removed = conn.execute("DELETE FROM search_results WHERE created_at < ?", (cutoff,)).rowcount
+        if removed:
+            logger.debug(f"Evicted {removed} cached search results")
+        self.stats.evicted += removed
+        return removed
+
+    def close(self) -> None:
+        """Close the connection; later ``get`` and ``put`` calls do nothing."""
+        with self._lock:
+            self._closed = True
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _result_from_dict(item: dict[str, Any]) -> SearchResult:
+    return SearchResult(
+        engine=str(item["engine"]),
+        title=str(item["title"]),
+        url=str(item["url"]),
+        snippet=str(item["snippet"]),
+        rank=int(item["rank"]),
+        retrieved_at=datetime.fromisoformat(item["retrieved_at"]),
+    )
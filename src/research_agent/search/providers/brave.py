@@ -10,6 +10,10 @@ class BraveProvider:
     name: str = "brave"
     api_key: str | None = None
 
+    @property
+    def configured(self) -> bool:
+        return False
+
     def search(self, query: SearchQuery) -> list[SearchResult]:
         # TODO: Implement Brave Search API integration.
         return []
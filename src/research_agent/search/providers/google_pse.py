@@ -18,12 +18,17 @@ class GooglePSEProvider:
     cx: str | None = None
     api_base: str = DEFAULT_API_BASE
     timeout_s: int = 20
+    # List price beyond the free daily quota ($5 per 1000 queries); charged against the run budget.
+    cost_per_query_usd: float = 0.005
+
+    @property
+    def configured(self) -> bool:
+        return all(self._credentials())
 
     def search(self, query: SearchQuery) -> list[SearchResult]:
-        api_key = self.api_key or os.getenv("GOOGLE_PSE_API_KEY")
-        cx = self.cx or os.getenv("GOOGLE_PSE_CX")
+        api_key, cx = self._credentials()
         if not api_key or not cx:
-            return []
+            raise RuntimeError("google_pse needs GOOGLE_PSE_API_KEY and GOOGLE_PSE_CX")
 
         params = {
             "key": api_key,
@@ -66,6 +71,9 @@ class GooglePSEProvider:
             )
         return results
 
+    def _credentials(self) -> tuple[str | None, str | None]:
+        return self.api_key or os.getenv("GOOGLE_PSE_API_KEY"), self.cx or os.getenv("GOOGLE_PSE_CX")
+
 
 def _apply_site_filters(query: str, sites: list[str]) -> str:
     if not sites:
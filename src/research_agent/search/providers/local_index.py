@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+import threading
+
+from loguru import logger
+
+from research_agent.blobs.store import BlobStore
+from research_agent.config import StorageConfig
+from research_agent.evidence.store import EvidenceStore
+from research_agent.fetch.fetcher import FetchedDoc
+from research_agent.types import SearchQuery, SearchResult
+
+DEFAULT_TOPK = 10
+
+
+@dataclass
+class LocalIndexProvider:
+    """Searches every source ingested so far through the evidence store's text index.
+
+    Results it returns can be re-read from the blob store with ``fetch``, so a run
+    over the local corpus needs no network at all.
+    """
+
+    store: EvidenceStore
+    blobs: BlobStore
+    name: str = "local_index"
+    # Results track the growing corpus, so the broker never caches them.
+    cacheable: bool = False
+    # url -> doc_id for every result handed out, so fetch only serves those.
+    _served: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @classmethod
+    def from_config(cls, config: StorageConfig) -> "LocalIndexProvider":
+        # A connection of its own: searches run on broker threads while the runner
+        # writes through its own store.
+        return cls(store=EvidenceStore(Path(config.sqlite_path)), blobs=BlobStore.from_config(config))
+
+    def search(self, query: SearchQuery) -> list[SearchResult]:
+        topk = query.topk or DEFAULT_TOPK
+        # Site filters are applied after ranking, so over-fetch to fill topk.
+        limit = topk * 4 if query.site_filters else topk
+        with self._lock:
+            hits = self.store.search_sources(query.q, limit=limit)
+        now = datetime.utcnow()
+        results: list[SearchResult] = []
+        for hit in hits:
+            if query.site_filters and not _matches_site(hit.url, query.site_filters):
+                continue
+            self._served[hit.url] = hit.doc_id
+            results.append(
+                SearchResult(
+                    engine=self.name,
+                    title=hit.title,
+                    url=hit.url,
+                    snippet=hit.snippet,
+                    rank=len(results) + 1,
+                    retrieved_at=now,
+                )
+            )
+            if len(results) >= topk:
+                break
+        return results
+
+    def fetch(self, url: str) -> FetchedDoc | None:
+        """Stored raw bytes for a URL this provider returned, or None to use the network."""
+        doc_id = self._served.get(url)
+        if doc_id is None:
+            return None
+        with self._lock:
+            source = self.store.get_source(doc_id)
+        if source is None or self.blobs.find(source.content_hash) is None:
+            logger.debug(f"No stored copy of {url}; fetching from the network")
+            return None
+        return FetchedDoc(
+            url=source.url,
+            status_code=200,
+            content=self.blobs.get_bytes(source.content_hash),
+            headers={"content-type": source.mime},
+            retrieved_at=source.retrieved_at,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self.store.close()
+
+
+def _matches_site(url: str, sites: list[str]) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    for site in sites:
+        site = site.lower().strip().lstrip(".")
+        if host == site or host.endswith("." + site):
+            return True
+    return False
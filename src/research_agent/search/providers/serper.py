@@ -11,6 +11,10 @@ class SerperProvider:
     api_key: str | None = None
     engine: str | None = None
 
+    @property
+    def configured(self) -> bool:
+        return False
+
     def search(self, query: SearchQuery) -> list[SearchResult]:
         # TODO: Implement Serper (or other SERP API) integration.
         return []
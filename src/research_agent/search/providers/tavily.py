@@ -10,6 +10,10 @@ class TavilyProvider:
     name: str = "tavily"
     api_key: str | None = None
 
+    @property
+    def configured(self) -> bool:
+        return False
+
     def search(self, query: SearchQuery) -> list[SearchResult]:
         # TODO: Implement Tavily Search API.
         return []
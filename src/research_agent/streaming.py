@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+import asyncio
+import os
+import threading
+import time
+
+from loguru import logger
+
+from research_agent.evidence.extract import extract_propositions_async
+from research_agent.evidence.policy import EvidencePolicy
+from research_agent.evidence.reduce import adjudicate_async, prepare_claims
+from research_agent.evidence.store import EvidenceStore
+from research_agent.fetch.fetcher import FetchedDoc
+from research_agent.fetch.pool import FetchPool
+from research_agent.llm.client import OpenAICompatClient
+from research_agent.logging import trace
+from research_agent.search.broker import SearchBroker
+from research_agent.types import ClaimGroup, DocumentText, Proposition, SearchQuery, SearchResult
+
+# Parses a fetched result into a document and records it; runs on a worker thread.
+IngestFn = Callable[[SearchResult, FetchedDoc, str], DocumentText]
+
+T = TypeVar("T")
+
+
+@dataclass
+class StreamResult:
+    documents: list[DocumentText]
+    propositions: list[Proposition]
+    claim_groups: list[ClaimGroup]
+
+
+@dataclass
+class _Target:
+    index: int
+    result: SearchResult
+    query_text: str
+
+
+def run_streaming(
+    queries: list[SearchQuery],
+    broker: SearchBroker,
+    pool: FetchPool,
+    ingest_fn: IngestFn,
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+    queue_size: int = 8,
+    question: str | None = None,
+    label_store: EvidenceStore | None = None,
+    store: EvidenceStore | None = None,
+    store_lock: threading.Lock | None = None,
+) -> StreamResult:
+    """Run search -> fetch -> parse -> extract as overlapping stages, then adjudicate.
+
+    Each document moves to the next stage as soon as it is ready; bounded queues
+    between stages stop a fast stage from running ahead of a slow one. Claim groups
+    depend on propositions from every document, so grouping and adjudication start
+    once extraction has drained, with all groups labelled concurrently.
+
+    Documents and propositions come back in search order, matching the staged runner.
+    With a ``store`` extractions are reused and recorded; ``store_lock`` must be the
+    lock ``ingest_fn`` holds while it writes through the same connection.
+    """
+    return asyncio.run(
+        _stream(
+            queries,
+            broker,
+            pool,
+            ingest_fn,
+            llm_client,
+            policy,
+            max(1, queue_size),
+            question,
+            label_store,
+            store,
+            store_lock,
+        )
+    )
+
+
+async def _stream(
+    queries: list[SearchQuery],
+    broker: SearchBroker,
+    pool: FetchPool,
+    ingest_fn: IngestFn,
+    llm_client: OpenAICompatClient,
+    policy: EvidencePolicy,
+    queue_size: int,
+    question: str | None,
+    label_store: EvidenceStore | None,
+    store: EvidenceStore | None,
+    store_lock: threading.Lock | None,
+) -> StreamResult:
+    llm_slots = max(1, policy.max_inflight_llm_requests)
+    parse_workers = min(4, os.cpu_count() or 1)
+    # Every stage hands blocking work to threads; size the default executor so
+    # fetch, parse and LLM calls never queue behind each other.
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=pool.max_concurrency + parse_workers + llm_slots + 1)
+    )
+
+    fetch_queue: asyncio.Queue[_Target | None] = asyncio.Queue(queue_size)
+    parse_queue: asyncio.Queue[tuple[_Target, FetchedDoc] | None] = asyncio.Queue(queue_size)
+    extract_queue: asyncio.Queue[tuple[int, DocumentText] | None] = asyncio.Queue(queue_size)
+    limiter = asyncio.Semaphore(llm_slots)
+    documents: dict[int, DocumentText] = {}
+    extracted: dict[int, list[Proposition]] = {}
+    started = time.monotonic()
+
+    async def search() -> None:
+        seen_urls: set[str] = set()
+        index = 0
+        for query in queries:
+            logger.debug(f"Query: {query.q}")
+            results = await asyncio.to_thread(broker.search, query)
+            logger.info(f"Search returned {len(results)} results")
+            for result in results:
+                if result.url in seen_urls:
+                    continue
+                seen_urls.add(result.url)
+                await fetch_queue.put(_Target(index=index, result=result, query_text=query.q))
+                index += 1
+        await fetch_queue.put(None)
+
+    async def fetch(target: _Target) -> None:
+        try:
+            fetched = await pool.fetch_async(target.result.url)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {target.result.url}: {e}")
+            return
+        await parse_queue.put((target, fetched))
+
+    async def parse(item: tuple[_Target, FetchedDoc]) -> None:
+        target, fetched = item
+        doc = await asyncio.to_thread(ingest_fn, target.result, fetched, target.query_text)
+        if not doc.text:
+            return
+        logger.debug(f"Parsed doc {doc.doc_id}")
+        documents[target.index] = doc
+        await extract_queue.put((target.index, doc))
+
+    async def extract(item: tuple[int, DocumentText]) -> None:
+        index, doc = item
+        extracted[index] = await extract_propositions_async(
+            doc,
+            llm_client,
+            policy,
+            limiter,
+            question=question,
+            store=store,
+            store_lock=store_lock,
+        )
+        trace(
+            "stream_document_done",
+            doc_id=doc.doc_id,
+            elapsed_s=round(time.monotonic() - started, 3),
+        )
+
+    await asyncio.gather(
+        search(),
+        _drain(fetch_queue, fetch, pool.max_concurrency, parse_queue),
+        _drain(parse_queue, parse, parse_workers, extract_queue),
+        _drain(extract_queue, extract, llm_slots, None),
+    )
+
+    ordered = sorted(documents)
+    docs = [documents[index] for index in ordered]
+    propositions = [prop for index in ordered for prop in extracted.get(index, [])]
+    logger.info(f"Extracted {len(propositions)} propositions from {len(docs)} documents")
+
+    canonical, merged = prepare_claims(propositions, docs, policy)
+    claim_groups = await adjudicate_async(merged, llm_client, policy, limiter, store=label_store)
+    logger.info(f"Adjudicated {len(claim_groups)} claims")
+    trace("stream_completed", elapsed_s=round(time.monotonic() - started, 3))
+    return StreamResult(documents=docs, propositions=canonical, claim_groups=claim_groups)
+
+
+async def _drain(
+    queue: asyncio.Queue[T | None],
+    handle: Callable[[T], Awaitable[None]],
+    workers: int,
+    downstream: asyncio.Queue | None,
+) -> None:
+    """Run ``workers`` consumers until the ``None`` sentinel, then close ``downstream``."""
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                # Put the sentinel back so sibling workers stop too.
+                await queue.put(None)
+                return
+            await handle(item)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    if downstream is not None:
+        await downstream.put(None)
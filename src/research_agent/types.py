@@ -12,6 +12,10 @@ class AnnotationSelector(TypedDict, total=False):
     suffix: str
     start: int
     end: int
+    # How the quote was located: exact | casefold | whitespace | fuzzy
+    match: str
+    # 1.0 for literal matches; 1 - edits / quote length for fuzzy ones
+    score: float
 
 
 @dataclass
@@ -35,6 +39,11 @@ class SourceDoc:
     engine: str | None = None
     license_hint: str | None = None
     meta: dict[str, Any] = field(default_factory=dict)
+    # HTTP validators from the response, used for conditional refetches.
+    etag: str | None = None
+    last_modified: str | None = None
+    # The URL that was fetched when it redirected to ``url``.
+    requested_url: str | None = None
 
 
 @dataclass
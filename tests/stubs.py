@@ -85,7 +85,7 @@ def stub_search_results(urls: list[str]) -> list[SearchResult]:
 
 
 def stub_fetch_url_factory(fixtures_dir: Path, url_map: dict[str, str]):
-    def _stub(url: str, timeout_s: int = 30) -> FetchedDoc:
+    def _stub(url: str, timeout_s: int = 30, client=None, **kwargs) -> FetchedDoc:
         fixture_name = url_map[url]
         content = (fixtures_dir / fixture_name).read_bytes()
         return FetchedDoc(
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from research_agent.evidence.adjudicate import label_evidence_batch, pack_claim_batches
+from research_agent.evidence.policy import policy_for_extent
+from research_agent.evidence.reduce import MergedGroup, adjudicate
+from research_agent.evidence.store import EvidenceStore
+
+
+class _BatchLLM:
+    model_name = "stub"
+    api_base = "stub://local"
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def chat(self, messages, temperature: float = 0.1, max_tokens: int = 512) -> str:
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        if "For each CLAIM" in prompt:
+            # Only claim 0 is answered; claim 1 must fall back to its own call.
+            return json.dumps(
+                [
+                    {"claim": 0, "index": 0, "label": "support"},
+                    {"claim": 0, "index": 1, "label": "refute"},
+                ]
+            )
+        return json.dumps([{"index": 0, "label": "neutral"}])
+
+
+class _BrokenLLM(_BatchLLM):
+    def chat(self, messages, temperature: float = 0.1, max_tokens: int = 512) -> str:
+        self.prompts.append(messages[-1]["content"])
+        return "I cannot label these."
+
+
+def _evidence(*quotes: str) -> list[dict[str, object]]:
+    return [{"quote": quote, "title": "", "url": ""} for quote in quotes]
+
+
+class AdjudicateBatchTests(unittest.TestCase):
+    def test_batch_labels_and_falls_back_per_claim(self) -> None:
+        policy = policy_for_extent("heavy")
+        llm = _BatchLLM()
+        labels = label_evidence_batch(
+            [
+                ("Water boils at 100 C.", _evidence("boils at 100 C", "boils at 90 C")),
+                ("Ice melts at 0 C.", _evidence("melts at 0 C")),
+            ],
+            llm,
+            policy,
+        )
+        self.assertEqual(labels, [["support", "refute"], ["neutral"]])
+        self.assertEqual(len(llm.prompts), 2)
+        self.assertIn("Label each QUOTE", llm.prompts[1])
+
+    def test_partly_covered_claim_falls_back_per_claim(self) -> None:
+        policy = policy_for_extent("heavy")
+        llm = _BatchLLM()
+        labels = label_evidence_batch(
+            [
+                ("Water boils at 100 C.", _evidence("boils at 100 C", "boils at 90 C", "boils at 80 C")),
+                ("Ice melts at 0 C.", _evidence("melts at 0 C")),
+            ],
+            llm,
+            policy,
+        )
+        # The batch reply skips quote 2 of claim 0, so both claims are relabelled alone.
+        self.assertEqual(len(llm.prompts), 3)
+        self.assertEqual(labels[1], ["neutral"])
+        self.assertEqual(len(labels[0]), 3)
+
+    def test_pack_respects_budget(self) -> None:
+        claims = [(f"claim {idx} " * 20, _evidence("quote " * 40)) for idx in range(10)]
+        policy = policy_for_extent("heavy")
+        policy.adjudication_batch_tokens = 250
+        batches = pack_claim_batches(claims, policy)
+        self.assertGreater(len(batches), 1)
+        self.assertEqual([idx for batch in batches for idx in batch], list(range(10)))
+
+        policy.adjudication_batch_tokens = 0
+        self.assertEqual(pack_claim_batches(claims, policy), [[idx] for idx in range(10)])
+
+    def test_memoized_labels_skip_seen_quotes(self) -> None:
+        policy = policy_for_extent("medium")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            group = MergedGroup(
+                signature="sig1",
+                claim_text="Water boils at 100 C.",
+                propositions=[],
+                evidence=_evidence("boils at 100 C"),
+            )
+            first_llm = _BatchLLM()
+            adjudicate([group], first_llm, policy, store=store)
+            self.assertEqual(len(first_llm.prompts), 1)
+
+            group.evidence = _evidence("boils at 100 C", "boils at 212 F")
+            second_llm = _BatchLLM()
+            claims = adjudicate([group], second_llm, policy, store=store)
+            store.close()
+
+        self.assertEqual(len(second_llm.prompts), 1)
+        self.assertNotIn("[1]", second_llm.prompts[0])
+        self.assertIn("[0] boils at 212 F", second_llm.prompts[0])
+        labels = [entry["label"] for entry in claims[0].merge["evidence"]]
+        self.assertEqual(labels, ["neutral", "neutral"])
+
+    def test_unparsed_labels_are_not_memoized(self) -> None:
+        policy = policy_for_extent("medium")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            group = MergedGroup(
+                signature="sig1",
+                claim_text="Water boils at 100 C.",
+                propositions=[],
+                evidence=_evidence("boils at 100 C"),
+            )
+            broken = _BrokenLLM()
+            claims = adjudicate([group], broken, policy, store=store)
+            self.assertEqual(claims[0].merge["evidence"][0]["label"], "neutral")
+
+            working = _BatchLLM()
+            adjudicate([group], working, policy, store=store)
+            third = _BatchLLM()
+            adjudicate([group], third, policy, store=store)
+            store.close()
+
+        # The broken reply is asked again; the working one is then remembered.
+        self.assertEqual(len(working.prompts), 1)
+        self.assertEqual(len(third.prompts), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
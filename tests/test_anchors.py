@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import unittest
+
+from research_agent.evidence.anchors import AnchorIndex
+
+
+class AnchorIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.text = "Intro.  Water   BOILS at 100 C at sea level. Straße is a street.\nWater boils at 100 C."
+        self.index = AnchorIndex(self.text)
+
+    def _span(self, quote: str, **kwargs) -> tuple[str, str]:
+        match = self.index.find(quote, **kwargs)
+        self.assertIsNotNone(match)
+        return self.text[match.start : match.end], match.mode
+
+    def test_match_modes(self) -> None:
+        self.assertEqual(self._span("Water boils at 100 C."), ("Water boils at 100 C.", "exact"))
+        self.assertEqual(self._span("straße IS A"), ("Straße is a", "casefold"))
+        self.assertEqual(self._span("STRASSE is a"), ("Straße is a", "casefold"))
+        self.assertEqual(
+            self._span("water boils at\n100 c at sea"),
+            ("Water   BOILS at 100 C at sea", "whitespace"),
+        )
+        self.assertIsNone(self.index.find("water freezes at 0 C"))
+
+    def test_partial_edge_words_and_span_preference(self) -> None:
+        self.assertEqual(self._span("oils at 100"), ("oils at 100", "exact"))
+        text, mode = self._span("water boils at 100 c", within=(0, 40))
+        self.assertEqual((text, mode), ("Water   BOILS at 100 C", "whitespace"))
+
+
+    def test_fuzzy_recovers_paraphrased_quote(self) -> None:
+        text = "Preface. Pure water boils at 100 °C at sea level, per the handbook. Ice melts at 0 °C."
+        index = AnchorIndex(text)
+        self.assertIsNone(index.find("Pure water boil at 100°C at sea-level"))
+        match = index.find_fuzzy("Pure water boil at 100°C at sea-level", within=(9, 67))
+        self.assertIsNotNone(match)
+        self.assertEqual(text[match.start : match.end], "Pure water boils at 100 °C at sea level")
+        self.assertEqual(match.mode, "fuzzy")
+        self.assertGreaterEqual(match.score, 0.8)
+        self.assertIsNone(index.find_fuzzy("Pure water boil at 100°C at sea-level", within=(68, 90)))
+        self.assertIsNone(index.find_fuzzy("The handbook says nothing about ice"))
+
+
+if __name__ == "__main__":
+    unittest.main()
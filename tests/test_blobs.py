@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from research_agent.blobs.store import BlobStore
+
+
+class BlobStoreTests(unittest.TestCase):
+    def test_put_dedupes_and_links(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blobs = BlobStore(Path(tmpdir) / "blobs")
+            first = blobs.put_bytes(b"same bytes")
+            second = blobs.put_bytes(b"same bytes")
+            self.assertEqual(first.path, second.path)
+            self.assertEqual(len(list(blobs.iter_blobs())), 1)
+
+            dest = Path(tmpdir) / "run" / "doc.bin"
+            self.assertTrue(blobs.link_into(first, dest))
+            self.assertEqual(dest.read_bytes(), b"same bytes")
+            self.assertEqual(dest.stat().st_ino, first.path.stat().st_ino)
+
+    def test_gzip_roundtrip_is_not_linked(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blobs = BlobStore(Path(tmpdir) / "blobs", compression="gzip")
+            ref = blobs.put_text("hello " * 100)
+            self.assertTrue(ref.path.name.endswith(".gz"))
+            self.assertEqual(blobs.get_bytes(ref.digest), ("hello " * 100).encode("utf-8"))
+            self.assertFalse(blobs.link_into(ref, Path(tmpdir) / "doc.text.txt"))
+
+    def test_collect_garbage_keeps_referenced_and_recent(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blobs = BlobStore(Path(tmpdir) / "blobs")
+            kept = blobs.put_bytes(b"kept")
+            dropped = blobs.put_bytes(b"dropped")
+
+            self.assertEqual(blobs.collect_garbage({kept.digest}), [])
+            removed = blobs.collect_garbage({kept.digest}, min_age_s=0)
+            self.assertEqual([ref.digest for ref in removed], [dropped.digest])
+            self.assertIsNone(blobs.find(dropped.digest))
+            self.assertIsNotNone(blobs.find(kept.digest))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import unittest
+
+from research_agent.evidence.canonicalize import claim_features, cluster_claims
+
+
+class CanonicalizeTests(unittest.TestCase):
+    def test_quantities_normalize_units(self) -> None:
+        self.assertEqual(claim_features("boils at 100 °C").quantities, {"100c"})
+        self.assertEqual(claim_features("boils at 100 degrees Celsius").quantities, {"100c"})
+        self.assertEqual(claim_features("boils at 212F, 1,000 m up").quantities, {"212f", "1000m"})
+
+    def test_paraphrases_share_a_cluster(self) -> None:
+        texts = [
+            "Water boils at 100 C at sea level.",
+            "At sea level, water boils at 100 °C.",
+            "water boils at 100 C at sea level.",
+            "Water boils at 100 degrees Celsius at sea level",
+        ]
+        self.assertEqual(cluster_claims(texts), [0, 0, 0, 0])
+
+    def test_different_quantities_or_negation_stay_apart(self) -> None:
+        texts = [
+            "At sea level, water boils at 100 C (212 F).",
+            "Water boils at 100 F (37.8 C) at sea level.",
+            "At sea level, water does not boil at 100 C (212 F).",
+            "Boiling point decreases as altitude increases.",
+        ]
+        self.assertEqual(cluster_claims(texts), [0, 1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
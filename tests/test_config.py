@@ -8,7 +8,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from research_agent.config import load_config
+from research_agent.config import _from_dict, load_config
 
 
 class ConfigTests(unittest.TestCase):
@@ -73,6 +73,11 @@ routing:
             self.assertEqual(config.models.openrouter.model_name, "openrouter-stub")
             self.assertEqual(config.models.openrouter.timeout_s, 99)
 
+    def test_unknown_http_cache_mode_is_rejected(self) -> None:
+        self.assertEqual(_from_dict({"cache": {"http_mode": " Cache_Only "}}).cache.http_mode, "cache_only")
+        with self.assertRaisesRegex(ValueError, "cache.http_mode"):
+            _from_dict({"cache": {"http_mode": "cache-only"}})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,12 +2,27 @@ from __future__ import annotations
 
 from tests import path_setup  # noqa: F401
 
+import asyncio
+import json
+import tempfile
+import threading
 import unittest
+from dataclasses import replace
 from datetime import datetime
+from pathlib import Path
 
-from research_agent.evidence.extract import chunk_text, extract_propositions
+from research_agent.evidence.anchors import AnchorIndex
+from research_agent.evidence.extract import (
+    _make_anchor,
+    chunk_spans,
+    chunk_text,
+    extract_propositions,
+    extract_propositions_async,
+    extract_propositions_many,
+)
 from research_agent.evidence.policy import policy_for_extent
-from research_agent.types import DocumentText
+from research_agent.evidence.store import EvidenceStore
+from research_agent.types import DocumentText, SourceDoc
 from tests.stubs import StubLLM
 
 
@@ -18,6 +33,28 @@ class ExtractTests(unittest.TestCase):
         self.assertGreater(len(chunks), 1)
         self.assertEqual(chunks[0][-5:], chunks[1][:5])
 
+    def test_chunk_spans_keep_whole_sentences(self) -> None:
+        text = "Alpha is first. Beta is second. Gamma is third.\n\nDelta starts a paragraph."
+        chunks = chunk_spans(text, chunk_chars=35, overlap_sentences=1)
+        self.assertEqual(
+            [chunk.text.strip() for chunk in chunks],
+            [
+                "Alpha is first. Beta is second.",
+                "Beta is second. Gamma is third.",
+                "Delta starts a paragraph.",
+            ],
+        )
+        for chunk in chunks:
+            self.assertEqual(text[chunk.start : chunk.end], chunk.text)
+
+    def test_anchor_resolves_within_chunk(self) -> None:
+        text = "Water boils at 100 C. Filler text. Water boils at 100 C."
+        chunk = chunk_spans(text, chunk_chars=25, overlap_sentences=0)[-1]
+        anchor = _make_anchor(AnchorIndex(text), "Water boils at 100 C.", "doc1", chunk)
+        self.assertIsNotNone(anchor)
+        self.assertEqual(anchor.selector["start"], text.rindex("Water"))
+        self.assertEqual(anchor.selector["match"], "exact")
+
     def test_extract_propositions(self) -> None:
         doc = DocumentText(
             doc_id="doc1",
@@ -40,6 +77,240 @@ class ExtractTests(unittest.TestCase):
         self.assertIn("start", selector)
         self.assertIn("end", selector)
 
+    def test_concurrent_extraction_matches_serial_order(self) -> None:
+        docs = [
+            DocumentText(
+                doc_id=f"doc{n}",
+                url=f"http://example.com/{n}",
+                title="Example",
+                snippet="",
+                text=" ".join(f"Water boils at {n}{i} C in case {i}." for i in range(12)),
+                content_hash=f"hash{n}",
+                content_type="text/plain",
+                retrieved_at=datetime.utcnow(),
+            )
+            for n in range(3)
+        ]
+        base = replace(
+            policy_for_extent("medium"),
+            chunk_chars=80,
+            chunk_overlap=0,
+            chunk_overlap_sentences=0,
+            max_chunks_per_doc=6,
+        )
+        serial = extract_propositions_many(docs, StubLLM(), replace(base, max_inflight_llm_requests=1))
+        concurrent = extract_propositions_many(docs, StubLLM(), replace(base, max_inflight_llm_requests=8))
+        self.assertEqual(len(concurrent), len(docs))
+        for serial_props, concurrent_props in zip(serial, concurrent):
+            self.assertEqual(len(concurrent_props), base.max_props_per_doc)
+            self.assertEqual([p.id for p in serial_props], [p.id for p in concurrent_props])
+
+    def test_serial_early_stop_counts_duplicates_once(self) -> None:
+        doc = DocumentText(
+            doc_id="doc0",
+            url="http://example.com/0",
+            title="Example",
+            snippet="",
+            text="Water boils at 100 C. Water boils at 100 C. Ice melts at 0 C.",
+            content_hash="hash0",
+            content_type="text/plain",
+            retrieved_at=datetime.utcnow(),
+        )
+        base = replace(
+            policy_for_extent("medium"),
+            chunk_chars=25,
+            chunk_overlap=0,
+            chunk_overlap_sentences=0,
+            max_chunks_per_doc=3,
+            max_props_per_doc=2,
+        )
+        serial = extract_propositions_many([doc], SentenceLLM(), replace(base, max_inflight_llm_requests=1))
+        concurrent = extract_propositions_many([doc], SentenceLLM(), replace(base, max_inflight_llm_requests=4))
+        self.assertEqual(len(serial[0]), 2)
+        self.assertEqual([p.id for p in serial[0]], [p.id for p in concurrent[0]])
+
+    def test_stored_extraction_is_reused_for_unchanged_documents(self) -> None:
+        docs = [
+            DocumentText(
+                doc_id=f"doc{n}",
+                url=f"http://example.com/{n}",
+                title="Example",
+                snippet="",
+                text=f"Water boils at 10{n} C at sea level.",
+                content_hash=f"hash{n}",
+                content_type="text/plain",
+                retrieved_at=datetime.utcnow(),
+            )
+            for n in range(2)
+        ]
+        policy = policy_for_extent("medium")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            for doc in docs:
+                store.upsert_source(
+                    SourceDoc(
+                        id=doc.doc_id,
+                        url=doc.url,
+                        retrieved_at=doc.retrieved_at,
+                        content_hash=doc.content_hash,
+                        warc_path=None,
+                        mime=doc.content_type,
+                    )
+                )
+
+            first_llm = CountingLLM()
+            first = extract_propositions_many(docs, first_llm, policy, store=store)
+            self.assertEqual(first_llm.calls, 2)
+
+            changed = [docs[0], replace(docs[1], text="Water boils at 90 C on a mountain.")]
+            second_llm = CountingLLM()
+            second = extract_propositions_many(changed, second_llm, policy, store=store)
+            store.close()
+
+        self.assertEqual(second_llm.calls, 1)
+        self.assertEqual([p.id for p in second[0]], [p.id for p in first[0]])
+        self.assertEqual(second[0][0].anchors[0].selector, first[0][0].anchors[0].selector)
+        self.assertEqual(second[1][0].payload["claim_text"], "Water boils at 90 C on a mountain.")
+
+    def test_adding_a_document_only_extracts_that_document(self) -> None:
+        docs = [
+            DocumentText(
+                doc_id=f"doc{n}",
+                url=f"http://example.com/{n}",
+                title="Example",
+                snippet="",
+                text=f"Water boils at 10{n} C at sea level.",
+                content_hash=f"hash{n}",
+                content_type="text/plain",
+                retrieved_at=datetime.utcnow(),
+            )
+            for n in range(4)
+        ]
+        policy = policy_for_extent("medium")
+        policy.max_chunks_per_run = 3
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            for doc in docs:
+                store.upsert_source(
+                    SourceDoc(
+                        id=doc.doc_id,
+                        url=doc.url,
+                        retrieved_at=doc.retrieved_at,
+                        content_hash=doc.content_hash,
+                        warc_path=None,
+                        mime=doc.content_type,
+                    )
+                )
+            first_llm = CountingLLM()
+            extract_propositions_many(docs[:3], first_llm, policy, question="boils", store=store)
+            # The run cap would now drop one earlier document's chunk from the plan.
+            second_llm = CountingLLM()
+            second = extract_propositions_many(docs, second_llm, policy, question="boils", store=store)
+            store.close()
+
+        self.assertEqual(first_llm.calls, 3)
+        self.assertEqual(second_llm.calls, 1)
+        self.assertTrue(all(second))
+
+    def test_failed_extraction_is_not_stored(self) -> None:
+        doc = DocumentText(
+            doc_id="doc0",
+            url="http://example.com/0",
+            title="Example",
+            snippet="",
+            text="Water boils at 100 C at sea level.",
+            content_hash="hash0",
+            content_type="text/plain",
+            retrieved_at=datetime.utcnow(),
+        )
+        policy = policy_for_extent("medium")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            store.upsert_source(
+                SourceDoc(
+                    id=doc.doc_id,
+                    url=doc.url,
+                    retrieved_at=doc.retrieved_at,
+                    content_hash=doc.content_hash,
+                    warc_path=None,
+                    mime=doc.content_type,
+                )
+            )
+            broken = extract_propositions_many([doc], BrokenLLM(), policy, store=store)
+            retry_llm = CountingLLM()
+            retried = extract_propositions_many([doc], retry_llm, policy, store=store)
+            store.close()
+
+        self.assertEqual(broken, [[]])
+        self.assertEqual(retry_llm.calls, 1)
+        self.assertEqual(len(retried[0]), 1)
+
+    def test_streaming_extraction_uses_the_store(self) -> None:
+        doc = DocumentText(
+            doc_id="doc0",
+            url="http://example.com/0",
+            title="Example",
+            snippet="",
+            text="Water boils at 100 C at sea level.",
+            content_hash="hash0",
+            content_type="text/plain",
+            retrieved_at=datetime.utcnow(),
+        )
+        policy = policy_for_extent("medium")
+        lock = threading.Lock()
+
+        def extract_async(llm: StubLLM, store: EvidenceStore) -> list:
+            limiter = asyncio.Semaphore(2)
+            return asyncio.run(
+                extract_propositions_async(doc, llm, policy, limiter, store=store, store_lock=lock)
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            store.upsert_source(
+                SourceDoc(
+                    id=doc.doc_id,
+                    url=doc.url,
+                    retrieved_at=doc.retrieved_at,
+                    content_hash=doc.content_hash,
+                    warc_path=None,
+                    mime=doc.content_type,
+                )
+            )
+            first_llm, second_llm, staged_llm = CountingLLM(), CountingLLM(), CountingLLM()
+            first = extract_async(first_llm, store)
+            second = extract_async(second_llm, store)
+            staged = extract_propositions_many([doc], staged_llm, policy, store=store)
+            store.close()
+
+        self.assertEqual(first_llm.calls, 1)
+        self.assertEqual((second_llm.calls, staged_llm.calls), (0, 0))
+        self.assertEqual([p.id for p in second], [p.id for p in first])
+        self.assertEqual([p.id for p in staged[0]], [p.id for p in first])
+
+
+class CountingLLM(StubLLM):
+    calls: int = 0
+
+    def chat(self, messages, temperature=0.1, max_tokens=512):
+        self.calls += 1
+        return super().chat(messages, temperature=temperature, max_tokens=max_tokens)
+
+
+class SentenceLLM(StubLLM):
+    def chat(self, messages, temperature=0.1, max_tokens=512):
+        text = messages[-1]["content"].split("TEXT:\n", 1)[1]
+        return json.dumps([{"claim_text": text.strip(), "quote": text.strip(), "claim_type": "Fact"}])
+
+
+class BrokenLLM(StubLLM):
+    def chat(self, messages, temperature=0.1, max_tokens=512):
+        return "Sorry, I cannot help with that."
+
 
 if __name__ == "__main__":
     unittest.main()
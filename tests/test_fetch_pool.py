@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import threading
+import time
+import unittest
+from datetime import datetime
+from urllib.parse import urlparse
+
+from research_agent.fetch.fetcher import FetchedDoc
+from research_agent.fetch.pool import FetchPool
+
+
+class _TrackingFetch:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.peak_total = 0
+
+    def __call__(self, url: str, timeout_s: int = 30, client=None) -> FetchedDoc:
+        host = urlparse(url).netloc
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+        time.sleep(0.02)
+        with self.lock:
+            self.active[host] -= 1
+        if url.endswith("/fail"):
+            raise RuntimeError("boom")
+        return FetchedDoc(
+            url=url,
+            status_code=200,
+            content=url.encode("utf-8"),
+            headers={"content-type": "text/plain"},
+            retrieved_at=datetime.utcnow(),
+        )
+
+
+class FetchPoolTests(unittest.TestCase):
+    def test_respects_global_and_per_host_limits(self) -> None:
+        urls = [f"http://a.test/{i}" for i in range(6)] + [f"http://b.test/{i}" for i in range(6)]
+        urls.append("http://c.test/fail")
+        tracker = _TrackingFetch()
+        with FetchPool(max_concurrency=4, per_host_concurrency=2, fetch_fn=tracker) as pool:
+            outcomes = list(pool.fetch_all(urls))
+
+        self.assertEqual(sorted(o.index for o in outcomes), list(range(len(urls))))
+        failed = [o for o in outcomes if o.doc is None]
+        self.assertEqual(len(failed), 1)
+        self.assertIsInstance(failed[0].error, RuntimeError)
+        self.assertLessEqual(tracker.peak_total, 4)
+        self.assertLessEqual(max(tracker.peak.values()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+
+import httpx
+
+from research_agent.blobs.store import BlobStore
+from research_agent.fetch.fetcher import FetchAbortedError, fetch_url, sniff_content_type
+
+URL = "https://example.com/doc"
+
+
+def _client(content: bytes, content_type: str | None = None) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"content-type": content_type} if content_type else {}
+        # Chunked bodies carry no Content-Length, so only the streaming cap applies.
+        return httpx.Response(200, headers=headers, stream=httpx.ByteStream(content))
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class FetcherTests(unittest.TestCase):
+    def test_small_body_is_buffered_and_hashed(self) -> None:
+        body = b"<p>Water boils at 100 C.</p>"
+        with _client(body, "text/html") as client:
+            fetched = fetch_url(URL, client=client)
+        self.assertEqual(fetched.content, body)
+        self.assertIsNone(fetched.blob)
+        self.assertEqual(fetched.sha256(), hashlib.sha256(body).hexdigest())
+
+    def test_oversized_body_is_aborted(self) -> None:
+        with _client(b"a" * 5000, "text/plain") as client:
+            with self.assertRaises(FetchAbortedError):
+                fetch_url(URL, client=client, max_bytes=4096)
+
+    def test_binary_payload_is_aborted_and_pdf_is_sniffed(self) -> None:
+        with _client(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64, "application/octet-stream") as client:
+            with self.assertRaises(FetchAbortedError):
+                fetch_url(URL, client=client)
+        with _client(b"%PDF-1.7\n...", "application/octet-stream") as client:
+            fetched = fetch_url(URL, client=client)
+        self.assertEqual(fetched.headers["content-type"], "application/pdf")
+        self.assertEqual(sniff_content_type(b"\xef\xbb\xbf<!doctype html>"), "text/html")
+
+    def test_utf16_text_is_not_mistaken_for_binary(self) -> None:
+        body = "<p>Water boils at 100 C.</p>".encode("utf-16")
+        with _client(body, "text/html; charset=UTF-16") as client:
+            self.assertEqual(fetch_url(URL, client=client).content, body)
+        self.assertEqual(sniff_content_type(body), "text/html")
+        self.assertEqual(sniff_content_type("Water".encode("utf-16-le"), "utf-16-le"), "text/plain")
+        self.assertIsNone(sniff_content_type("Water".encode("utf-16-le")))
+
+    def test_large_body_is_spooled_to_the_blob_store(self) -> None:
+        body = b"water " * 4000
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blobs = BlobStore(Path(tmpdir) / "blobs", compression="gzip")
+            with _client(body, "text/plain") as client:
+                fetched = fetch_url(URL, client=client, spool=blobs, spool_bytes=1024)
+            assert fetched.blob is not None
+            self.assertEqual(fetched.content, b"")
+            self.assertEqual(fetched.size(), len(body))
+            self.assertEqual(fetched.sha256(), hashlib.sha256(body).hexdigest())
+            self.assertEqual(fetched.body(), body)
+            self.assertEqual(blobs.get_bytes(fetched.blob.digest), body)
+
+
+if __name__ == "__main__":
+    unittest.main()
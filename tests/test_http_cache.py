@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+from research_agent.blobs.store import BlobStore
+from research_agent.evidence.store import EvidenceStore
+from research_agent.fetch.fetcher import FetchedDoc, fetch_url
+from research_agent.fetch.http_cache import HttpCache, NotCachedError
+from research_agent.types import SourceDoc
+
+URL = "https://example.com/boiling"
+BODY = b"<p>Water boils at 100 C.</p>"
+
+
+class HttpCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        base = Path(self._tmp.name)
+        self.store = EvidenceStore(base / "agent.db")
+        self.store.init()
+        self.blobs = BlobStore(base / "blobs")
+        self.requests: list[httpx.Request] = []
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self._tmp.cleanup()
+
+    def _record(self, age: timedelta) -> None:
+        ref = self.blobs.put_bytes(BODY)
+        self.store.upsert_source(
+            SourceDoc(
+                id=f"src_{ref.digest[:12]}",
+                url=URL,
+                retrieved_at=datetime.utcnow() - age,
+                content_hash=f"sha256:{ref.digest}",
+                warc_path=None,
+                mime="text/html",
+                etag='"v1"',
+                last_modified="Mon, 05 Oct 2026 10:00:00 GMT",
+            )
+        )
+
+    def _client(self, status: int) -> httpx.Client:
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if status == 304:
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, content=b"<p>new</p>", headers={"content-type": "text/html"})
+
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_stale_source_is_revalidated_and_304_reuses_stored_body(self) -> None:
+        self._record(age=timedelta(days=2))
+        cache = HttpCache(self.store, self.blobs, fresh_s=3600)
+        with self._client(304) as client:
+            fetched = cache.fetch(URL, fetch_url, client=client)
+        self.assertEqual(self.requests[0].headers["if-none-match"], '"v1"')
+        self.assertEqual(self.requests[0].headers["if-modified-since"], "Mon, 05 Oct 2026 10:00:00 GMT")
+        self.assertEqual(fetched.content, BODY)
+        self.assertEqual(fetched.headers["etag"], '"v1"')
+        self.assertGreater(fetched.retrieved_at, datetime.utcnow() - timedelta(minutes=1))
+        self.assertEqual(cache.stats.not_modified, 1)
+
+    def test_changed_source_is_refetched(self) -> None:
+        self._record(age=timedelta(days=2))
+        cache = HttpCache(self.store, self.blobs, fresh_s=3600)
+        with self._client(200) as client:
+            fetched = cache.fetch(URL, fetch_url, client=client)
+        self.assertEqual(fetched.content, b"<p>new</p>")
+        self.assertEqual(cache.stats.refetched, 1)
+
+    def test_fresh_and_cache_only_sources_skip_the_network(self) -> None:
+        def offline(url: str, **kwargs: object) -> FetchedDoc:
+            raise AssertionError("network used")
+
+        self._record(age=timedelta(minutes=5))
+        self.assertEqual(HttpCache(self.store, self.blobs, fresh_s=3600).fetch(URL, offline).content, BODY)
+
+        replay = HttpCache(self.store, self.blobs, fresh_s=0, mode="cache_only")
+        self.assertEqual(replay.fetch(URL, offline).content, BODY)
+        with self.assertRaises(NotCachedError):
+            replay.fetch("https://example.com/unseen", offline)
+
+    def test_redirected_url_hits_on_the_requested_url(self) -> None:
+        final = "https://example.com/boiling-point"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == URL:
+                return httpx.Response(301, headers={"location": final})
+            return httpx.Response(200, content=BODY, headers={"content-type": "text/html"})
+
+        cache = HttpCache(self.store, self.blobs, fresh_s=3600)
+        with httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True) as client:
+            fetched = cache.fetch(URL, fetch_url, client=client)
+        self.assertEqual(fetched.url, final)
+        ref = self.blobs.put_bytes(fetched.content)
+        self.store.upsert_source(
+            SourceDoc(
+                id=f"src_{ref.digest[:12]}",
+                url=fetched.url,
+                retrieved_at=fetched.retrieved_at,
+                content_hash=f"sha256:{ref.digest}",
+                warc_path=None,
+                mime="text/html",
+                requested_url=URL,
+            )
+        )
+
+        replay = HttpCache(self.store, self.blobs, mode="cache_only")
+        for url in (URL, final):
+            replayed = replay.fetch(url, fetch_url)
+            self.assertEqual(replayed.content, BODY)
+            self.assertEqual(replayed.url, final)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from research_agent.llm.cache import LLMResponseCache
+from research_agent.llm.client import OpenAICompatClient
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("content-length", "0"))
+        self.rfile.read(length)
+        body = json.dumps({"choices": [{"message": {"content": "OK"}}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+class OpenAICompatClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.api_base = f"http://127.0.0.1:{self.server.server_port}/v1"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_pooled_connection(self) -> None:
+        client = OpenAICompatClient(api_base=self.api_base, model_name="stub")
+        with client:
+            for _ in range(3):
+                self.assertEqual(client.chat([{"role": "user", "content": "hi"}]), "OK")
+        self.assertEqual(client.stats.requests, 3)
+        self.assertEqual(client.stats.connections_opened, 1)
+        self.assertEqual(client.stats.connections_reused, 2)
+
+    def test_response_cache_hits_and_bypass(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = LLMResponseCache(Path(tmpdir) / "llm_cache.db")
+            client = OpenAICompatClient(
+                api_base=self.api_base,
+                model_name="stub",
+                response_cache=cache,
+            )
+            messages = [{"role": "user", "content": "hi"}]
+            with client:
+                client.chat(messages)
+                client.chat(messages)
+                client.chat(messages, temperature=0.7)
+                client.chat(messages, use_cache=False)
+            self.assertEqual(client.stats.requests, 3)
+            self.assertEqual(cache.stats.hits, 1)
+            self.assertEqual(cache.stats.misses, 2)
+
+    def test_response_cache_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = LLMResponseCache(Path(tmpdir) / "llm_cache.db", max_entries=1)
+            cache.put("a", "stub", "first")
+            cache.put("b", "stub", "second")
+            cache.close()
+            self.assertEqual(cache.stats.evicted, 1)
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("b"), "second")
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
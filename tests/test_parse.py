@@ -2,8 +2,13 @@ from __future__ import annotations
 
 from tests import path_setup  # noqa: F401
 
+import tempfile
 import unittest
+from pathlib import Path
 
+from research_agent.parse import pdf
+from research_agent.parse.cache import ParseCache
+from research_agent.parse.source import parse_source
 from research_agent.parse.html import extract_text as extract_html_text
 from research_agent.parse.pdf import extract_text as extract_pdf_text
 
@@ -18,6 +23,30 @@ class ParseTests(unittest.TestCase):
         text = extract_pdf_text(b"not a pdf")
         self.assertEqual(text, "")
 
+    def test_pdf_page_ranges_cover_all_pages(self) -> None:
+        self.assertEqual(pdf._page_ranges(10, 4), [(0, 10)])
+        ranges = pdf._page_ranges(40, 4)
+        self.assertEqual(ranges, [(0, 10), (10, 20), (20, 30), (30, 40)])
+
+    def test_pdf_assemble_page_offsets(self) -> None:
+        result = pdf._assemble(["first", "", "second"])
+        self.assertEqual(result.text, "first\nsecond")
+        self.assertEqual(result.page_offsets, [(0, 5), (5, 5), (6, 12)])
+        start, end = result.page_offsets[2]
+        self.assertEqual(result.text[start:end], "second")
+
+    def test_parse_source_reuses_cached_text(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ParseCache(Path(tmpdir))
+            raw = b"<html><body><p>Water boils at 100 C.</p></body></html>"
+            first = parse_source(raw, "text/html", cache=cache)
+            second = parse_source(raw, "text/html; charset=utf-8", cache=cache)
+            self.assertEqual(first.text, "Water boils at 100 C.")
+            self.assertEqual(second.text, first.text)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            parse_source(raw, "text/plain", cache=cache)
+            self.assertEqual(cache.misses, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,7 +19,7 @@ from research_agent.config import (
     ThinkingConfig,
 )
 from research_agent.llm.router import RoutedModel
-from research_agent.runner import run
+from research_agent.runner import RunOutput, run
 from research_agent.search.broker import SearchBroker
 from research_agent.types import SearchResult
 from tests.stubs import StubLLM, stub_fetch_url_factory
@@ -28,82 +28,100 @@ from tests.stubs import StubLLM, stub_fetch_url_factory
 class PipelineTests(unittest.TestCase):
     def test_pipeline_water_boiling(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            config = AppConfig(
-                agent=AgentConfig(
-                    mode="native",
-                    thinking=ThinkingConfig(
-                        extent="medium",
-                        max_react_steps=8,
-                        beams=2,
-                        critique_passes=1,
-                        summarization_ratio=0.2,
-                    ),
-                ),
-                search=SearchConfig(
-                    providers=["google_pse"],
-                    topk_per_engine=8,
-                    freshness_days=365,
-                    safe_mode="standard",
-                    api_budget_usd=0.0,
-                ),
-                storage=StorageConfig(
-                    sqlite_path=base / "agent.db",
-                    warc_dir=base / "warc",
-                    runs_dir=base / "runs",
-                ),
-                models=ModelsConfig(
-                    default="local",
-                    local=ModelEndpointConfig(
-                        api_base="http://localhost:8000/v1",
-                        model_name="stub",
-                        timeout_s=60,
-                    ),
-                    openrouter=ModelEndpointConfig(
-                        api_base="http://openrouter.local/v1",
-                        model_name="stub-openrouter",
-                        timeout_s=60,
-                    ),
-                ),
-                routing=RoutingConfig(heavy_uses_openrouter=False),
+            output = _run_water(Path(tmpdir), pipeline="staged")
+            report_text = output.report_path.read_text()
+            self.assertIn("water boils", report_text.lower())
+            self.assertTrue((output.report_path.parent / "provenance.json").exists())
+
+    def test_streaming_pipeline_matches_staged(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            staged = _run_water(Path(tmpdir) / "staged", pipeline="staged")
+            streamed = _run_water(Path(tmpdir) / "streaming", pipeline="streaming")
+            self.assertTrue(streamed.claim_groups)
+            self.assertEqual(
+                [(g.signature, g.stance, g.propositions) for g in streamed.claim_groups],
+                [(g.signature, g.stance, g.propositions) for g in staged.claim_groups],
+            )
+            self.assertEqual(
+                [g.merge for g in streamed.claim_groups],
+                [g.merge for g in staged.claim_groups],
             )
 
-            urls = [
-                "fixture://water_boiling_1",
-                "fixture://water_boiling_2",
-            ]
-            results = []
-            now = datetime.utcnow()
-            for idx, url in enumerate(urls, start=1):
-                results.append(
-                    SearchResult(
-                        engine="google_pse",
-                        title=f"Fixture {idx}",
-                        url=url,
-                        snippet="fixture snippet",
-                        rank=idx,
-                        retrieved_at=now,
-                    )
-                )
 
-            fixtures_dir = Path(__file__).resolve().parent / "fixtures"
-            url_map = {
-                "fixture://water_boiling_1": "water_boiling_1.html",
-                "fixture://water_boiling_2": "water_boiling_2.html",
-            }
-            fetch_stub = stub_fetch_url_factory(fixtures_dir, url_map)
+def _run_water(base: Path, pipeline: str) -> RunOutput:
+    config = AppConfig(
+        agent=AgentConfig(
+            mode="native",
+            pipeline=pipeline,
+            thinking=ThinkingConfig(
+                extent="medium",
+                max_react_steps=8,
+                beams=2,
+                critique_passes=1,
+                summarization_ratio=0.2,
+            ),
+        ),
+        search=SearchConfig(
+            providers=["google_pse"],
+            topk_per_engine=8,
+            freshness_days=365,
+            safe_mode="standard",
+            api_budget_usd=0.0,
+        ),
+        storage=StorageConfig(
+            sqlite_path=base / "agent.db",
+            warc_dir=base / "warc",
+            runs_dir=base / "runs",
+            blobs_dir=base / "blobs",
+        ),
+        models=ModelsConfig(
+            default="local",
+            local=ModelEndpointConfig(
+                api_base="http://localhost:8000/v1",
+                model_name="stub",
+                timeout_s=60,
+            ),
+            openrouter=ModelEndpointConfig(
+                api_base="http://openrouter.local/v1",
+                model_name="stub-openrouter",
+                timeout_s=60,
+            ),
+        ),
+        routing=RoutingConfig(heavy_uses_openrouter=False),
+    )
 
-            with patch.object(SearchBroker, "search", return_value=results):
-                with patch("research_agent.runner.fetch_url", side_effect=fetch_stub):
-                    with patch(
-                        "research_agent.runner.get_model_client",
-                        return_value=RoutedModel(name="local", client=StubLLM()),
-                    ):
-                        output = run("water boils at what temperature", config)
+    urls = [
+        "fixture://water_boiling_1",
+        "fixture://water_boiling_2",
+    ]
+    results = []
+    now = datetime.utcnow()
+    for idx, url in enumerate(urls, start=1):
+        results.append(
+            SearchResult(
+                engine="google_pse",
+                title=f"Fixture {idx}",
+                url=url,
+                snippet="fixture snippet",
+                rank=idx,
+                retrieved_at=now,
+            )
+        )
 
-            report_text = output.report_path.read_text()
-            self.assertIn("water boils", report_text.lower())
-            self.assertTrue((output.report_path.parent / "provenance.json").exists())
+    fixtures_dir = Path(__file__).resolve().parent / "fixtures"
+    url_map = {
+        "fixture://water_boiling_1": "water_boiling_1.html",
+        "fixture://water_boiling_2": "water_boiling_2.html",
+    }
+    fetch_stub = stub_fetch_url_factory(fixtures_dir, url_map)
+
+    with patch.object(SearchBroker, "search", return_value=results):
+        with patch("research_agent.runner.fetch_url", side_effect=fetch_stub):
+            with patch(
+                "research_agent.runner.get_model_client",
+                return_value=RoutedModel(name="local", client=StubLLM()),
+            ):
+                return run("water boils at what temperature", config)
 
 
 if __name__ == "__main__":
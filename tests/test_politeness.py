@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import httpx
+
+from research_agent.config import _from_dict
+from research_agent.evidence.store import EvidenceStore
+from research_agent.fetch.fetcher import FetchedDoc
+from research_agent.fetch.politeness import (
+    PolitenessScheduler,
+    RobotsCache,
+    RobotsDisallowedError,
+    TokenBucket,
+)
+from research_agent.fetch.pool import FetchPool
+from research_agent.runner import _scheduler
+
+ROBOTS = b"User-agent: *\nDisallow: /private\nCrawl-delay: 5\n"
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.started: list[tuple[str, float]] = []
+
+    def __call__(self, url: str, **kwargs: object) -> FetchedDoc:
+        with self.lock:
+            self.started.append((urlparse(url).netloc, time.monotonic()))
+        return FetchedDoc(
+            url=url,
+            status_code=200,
+            content=b"ok",
+            headers={"content-type": "text/plain"},
+            retrieved_at=datetime.utcnow(),
+        )
+
+
+class PolitenessTests(unittest.TestCase):
+    def test_token_bucket_queues_reservations(self) -> None:
+        bucket = TokenBucket(interval_s=1.0, capacity=2.0, tokens=2.0, updated=0.0)
+        self.assertEqual(bucket.reserve(0.0), 0.0)
+        self.assertEqual(bucket.reserve(0.0), 0.0)
+        self.assertAlmostEqual(bucket.reserve(0.0), 1.0)
+        self.assertAlmostEqual(bucket.ready_in(0.5), 1.5)
+
+    def test_robots_rules_are_cached_and_enforced(self) -> None:
+        robots_requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            robots_requests.append(str(request.url))
+            return httpx.Response(200, content=ROBOTS)
+
+        scheduler = PolitenessScheduler(host_delay_s=0.0, robots=RobotsCache(ttl_s=3600))
+        recorder = _Recorder()
+        fetch = scheduler.wrap(recorder)
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            fetch("https://a.test/public/1", client=client)
+            with self.assertRaises(RobotsDisallowedError):
+                fetch("https://a.test/private/2", client=client)
+
+        self.assertEqual(robots_requests, ["https://a.test/robots.txt"])
+        self.assertEqual(len(recorder.started), 1)
+        # The crawl delay outranks the scheduler's default of no delay.
+        self.assertGreater(scheduler.ready_in("https://a.test/public/3"), 4.0)
+        self.assertEqual(scheduler.ready_in("https://b.test/"), 0.0)
+
+    def test_robots_decisions_persist_across_runs(self) -> None:
+        robots_requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            robots_requests.append(str(request.url))
+            return httpx.Response(200, content=ROBOTS)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+                for _ in range(2):
+                    robots = RobotsCache(ttl_s=3600, store=store)
+                    self.assertFalse(robots.allowed("https://a.test/private/1", client=client))
+                    self.assertEqual(robots.rules_for("https://a.test/", client=client).crawl_delay_s, 5.0)
+                expired = RobotsCache(ttl_s=0, store=store)
+                expired.allowed("https://b.test/", client=client)
+                RobotsCache(ttl_s=0, store=store).allowed("https://b.test/", client=client)
+            store.close()
+
+        self.assertEqual(robots_requests, ["https://a.test/robots.txt"] + ["https://b.test/robots.txt"] * 2)
+
+    def test_pool_interleaves_hosts_under_per_host_delay(self) -> None:
+        urls = [f"http://a.test/{i}" for i in range(3)] + [f"http://b.test/{i}" for i in range(3)]
+        scheduler = PolitenessScheduler(host_delay_s=0.1)
+        recorder = _Recorder()
+        fetch = scheduler.wrap(recorder)
+        with FetchPool(max_concurrency=4, per_host_concurrency=2, fetch_fn=fetch, scheduler=scheduler) as pool:
+            started = time.monotonic()
+            outcomes = list(pool.fetch_all(urls))
+            elapsed = time.monotonic() - started
+
+        self.assertTrue(all(outcome.doc is not None for outcome in outcomes))
+        for host in ("a.test", "b.test"):
+            times = [at for name, at in recorder.started if name == host]
+            gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+            self.assertTrue(all(gap >= 0.09 for gap in gaps), gaps)
+        # Both hosts progress together: about two delays, not four.
+        self.assertLess(elapsed, 0.35)
+
+    def test_cache_hits_and_local_files_do_not_wait(self) -> None:
+        cached = {f"https://a.test/{i}" for i in range(3)}
+        network = _Recorder()
+
+        def cache_first(url: str, **kwargs: object) -> FetchedDoc:
+            if url in cached:
+                return FetchedDoc(url, 200, b"cached", {"content-type": "text/plain"}, datetime.utcnow())
+            return fetch(url, **kwargs)
+
+        scheduler = PolitenessScheduler(host_delay_s=10.0)
+        fetch = scheduler.wrap(network)
+        urls = sorted(cached) + [f"file:///tmp/doc{i}.txt" for i in range(3)]
+        with FetchPool(max_concurrency=4, per_host_concurrency=2, fetch_fn=cache_first, scheduler=scheduler) as pool:
+            started = time.monotonic()
+            outcomes = list(pool.fetch_all(urls))
+            elapsed = time.monotonic() - started
+
+        self.assertTrue(all(outcome.doc is not None for outcome in outcomes))
+        self.assertEqual(len(network.started), 3)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(scheduler.ready_in("https://a.test/3"), 0.0)
+
+    def test_offline_runs_are_not_throttled(self) -> None:
+        for data in ({"storage": {"warc_replay": True}}, {"cache": {"http_mode": "cache_only"}}):
+            self.assertIsNone(_scheduler(_from_dict(data), context=None))
+
+
+if __name__ == "__main__":
+    unittest.main()
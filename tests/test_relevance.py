@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import unittest
+
+from research_agent.evidence.relevance import select_chunks, tokenize
+
+
+class RelevanceTests(unittest.TestCase):
+    def test_tokenize_drops_stopwords_and_folds_suffixes(self) -> None:
+        self.assertEqual(tokenize("What is the boiling point of water?"), ["boil", "point", "water"])
+
+    def test_selects_relevant_chunks_per_document_in_order(self) -> None:
+        chunked = [
+            [
+                "Table of contents and author affiliations.",
+                "Water boils at 100 C at sea level.",
+                "Acknowledgements and funding.",
+                "At altitude water boils below 100 C.",
+            ]
+        ]
+        selected = select_chunks("At what temperature does water boil?", chunked, max_per_doc=2)
+        self.assertEqual(selected, [[1, 3]])
+
+    def test_run_cap_prefers_best_chunks_across_documents(self) -> None:
+        chunked = [
+            ["Unrelated preface text.", "Water boils at 100 C."],
+            ["Boiling water: water boils at 100 C, water boiling point."],
+        ]
+        selected = select_chunks("water boiling point", chunked, max_per_doc=2, max_per_run=1)
+        self.assertEqual(selected, [[], [0]])
+
+    def test_without_question_keeps_leading_chunks(self) -> None:
+        chunked = [["a", "b", "c"], ["d"]]
+        self.assertEqual(select_chunks(None, chunked, max_per_doc=2), [[0, 1], [0]])
+        self.assertEqual(select_chunks("water", chunked, max_per_doc=2), [[0, 1], [0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from research_agent.search.broker import SearchBroker
+from research_agent.search.cache import SearchCache, normalize_query
+from research_agent.search.providers.google_pse import GooglePSEProvider
+from research_agent.types import SearchQuery, SearchResult
+
+
+@dataclass
+class _Provider:
+    name: str
+    urls: list[str]
+    delay_s: float = 0.0
+    fail: bool = False
+    cost_per_query_usd: float = 0.0
+    calls: int = 0
+
+    def search(self, query: SearchQuery) -> list[SearchResult]:
+        self.calls += 1
+        time.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("boom")
+        return [
+            SearchResult(
+                engine=self.name,
+                title=url,
+                url=url,
+                snippet="",
+                rank=rank,
+                retrieved_at=datetime.utcnow(),
+            )
+            for rank, url in enumerate(self.urls, start=1)
+        ]
+
+
+class _HungProvider:
+    name = "hung"
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def search(self, query: SearchQuery) -> list[SearchResult]:
+        self.release.wait(5.0)
+        return []
+
+
+class SearchBrokerTests(unittest.TestCase):
+    def test_providers_run_concurrently(self) -> None:
+        broker = SearchBroker(
+            providers=[
+                _Provider("a", ["http://a/1", "http://shared"], delay_s=0.3),
+                _Provider("b", ["http://shared", "http://b/1"], delay_s=0.3),
+            ]
+        )
+        started = time.monotonic()
+        results = broker.search(SearchQuery(q="water"))
+        self.assertLess(time.monotonic() - started, 0.55)
+        self.assertEqual(results[0].url, "http://shared")
+        self.assertEqual({r.url for r in results}, {"http://a/1", "http://b/1", "http://shared"})
+
+    def test_slow_and_failing_providers_degrade_to_partial_results(self) -> None:
+        hung = _HungProvider()
+        broker = SearchBroker(
+            providers=[
+                _Provider("fast", ["http://fast/1"]),
+                _Provider("broken", ["http://broken/1"], fail=True),
+                _Provider("slowish", ["http://slowish/1"], delay_s=0.3),
+                hung,
+            ],
+            provider_timeout_s=0.2,
+            provider_timeouts={"slowish": 1.0},
+            deadline_s=0.6,
+        )
+        started = time.monotonic()
+        results = broker.search(SearchQuery(q="water"))
+        elapsed = time.monotonic() - started
+        hung.release.set()
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual([r.url for r in results], ["http://fast/1", "http://slowish/1"])
+
+
+class SearchCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "search_cache.db"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_fresh_entries_skip_the_provider_for_equivalent_queries(self) -> None:
+        provider = _Provider("paid", ["http://paid/1"], cost_per_query_usd=0.01)
+        broker = SearchBroker(providers=[provider], cache=SearchCache(self.db_path), budget_usd=1.0)
+        first = broker.search(SearchQuery(q="Boiling point of water?", topk=5))
+        second = broker.search(SearchQuery(q="  boiling point  of WATER ", topk=5))
+        broker.cache.close()
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual([r.url for r in second], [r.url for r in first])
+        self.assertAlmostEqual(broker.spent_usd, 0.01)
+        self.assertEqual(normalize_query("  Boiling point of water? "), "boiling point of water")
+
+    def test_stale_entries_are_served_and_refreshed(self) -> None:
+        cache = SearchCache(self.db_path, ttl_s=0.0, stale_s=3600.0)
+        query = SearchQuery(q="water", topk=5)
+        cache.put("paid", query, [])
+        provider = _Provider("paid", ["http://paid/new"])
+        broker = SearchBroker(providers=[provider], cache=cache)
+        results = broker.search(query)
+        self.assertEqual(results, [])
+        for _ in range(100):
+            if provider.calls and not broker._refreshing:
+                break
+            time.sleep(0.01)
+        refreshed = cache.get("paid", query)
+        cache.close()
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual([r.url for r in refreshed.results], ["http://paid/new"])
+
+    def test_budget_degrades_to_cached_results(self) -> None:
+        cache = SearchCache(self.db_path, ttl_s=0.0, stale_s=3600.0)
+        cached_query = SearchQuery(q="cached", topk=5)
+        cache.put("paid", cached_query, _Provider("paid", ["http://paid/old"]).search(cached_query))
+        provider = _Provider("paid", ["http://paid/live"], cost_per_query_usd=0.01)
+        broker = SearchBroker(providers=[provider], cache=cache, budget_usd=0.01)
+
+        self.assertEqual([r.url for r in broker.search(SearchQuery(q="first", topk=5))], ["http://paid/live"])
+        self.assertEqual([r.url for r in broker.search(cached_query)], ["http://paid/old"])
+        self.assertEqual(broker.search(SearchQuery(q="uncached", topk=5)), [])
+        cache.close()
+        self.assertEqual(provider.calls, 1)
+
+    def test_unconfigured_provider_is_neither_charged_nor_cached(self) -> None:
+        cache = SearchCache(self.db_path)
+        query = SearchQuery(q="water", topk=5)
+        env = {k: v for k, v in os.environ.items() if not k.startswith("GOOGLE_PSE_")}
+        with mock.patch.dict(os.environ, env, clear=True):
+            broker = SearchBroker(providers=[GooglePSEProvider()], cache=cache, budget_usd=1.0)
+            self.assertEqual(broker.search(query), [])
+            with self.assertRaises(RuntimeError):
+                GooglePSEProvider().search(query)
+        stored = cache.get("google_pse", query)
+        cache.close()
+        self.assertEqual(broker.spent_usd, 0.0)
+        self.assertIsNone(stored)
+
+    def test_close_releases_cache_and_providers(self) -> None:
+        closed: list[str] = []
+
+        class _ClosingProvider(_Provider):
+            def close(self) -> None:
+                closed.append(self.name)
+
+        cache = SearchCache(self.db_path)
+        broker = SearchBroker(providers=[_ClosingProvider("a", []), _Provider("b", [])], cache=cache)
+        broker.search(SearchQuery(q="water"))
+        broker.close()
+        self.assertEqual(closed, ["a"])
+        self.assertIsNone(cache._conn)
+
+    def test_late_writes_after_close_do_not_reopen_the_cache(self) -> None:
+        cache = SearchCache(self.db_path)
+        query = SearchQuery(q="water", topk=5)
+        cache.put("paid", query, [])
+        cache.close()
+        cache.put("paid", query, _Provider("paid", ["http://paid/late"]).search(query))
+        self.assertIsNone(cache.get("paid", query))
+        self.assertIsNone(cache._conn)
+
+    def test_failed_calls_are_refunded(self) -> None:
+        provider = _Provider("paid", ["http://paid/1"], fail=True, cost_per_query_usd=0.01)
+        broker = SearchBroker(providers=[provider], budget_usd=0.01)
+        for q in ("first", "second"):
+            self.assertEqual(broker.search(SearchQuery(q=q, topk=5)), [])
+        self.assertEqual(provider.calls, 2)
+        self.assertEqual(broker.spent_usd, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
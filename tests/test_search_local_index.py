@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from research_agent.blobs.store import BlobStore
+from research_agent.config import SearchConfig, StorageConfig
+from research_agent.evidence.store import EvidenceStore
+from research_agent.search.broker import SearchBroker
+from research_agent.search.providers.local_index import LocalIndexProvider
+from research_agent.types import SearchQuery, SourceDoc
+
+SOURCES = [
+    ("https://physics.example.org/boiling", "Boiling", b"<p>Water boils at 100 C at sea level.</p>"),
+    ("https://cooking.example.com/pasta", "Pasta", b"<p>Salt the water before it boils.</p>"),
+    ("https://ice.example.com/melting", "Ice", b"<p>Ice melts at 0 C.</p>"),
+]
+
+
+class LocalIndexProviderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        base = Path(self._tmp.name)
+        self.storage = StorageConfig(
+            sqlite_path=base / "agent.db",
+            warc_dir=base / "warc",
+            runs_dir=base / "runs",
+            blobs_dir=base / "blobs",
+        )
+        store = EvidenceStore(self.storage.sqlite_path)
+        store.init()
+        blobs = BlobStore.from_config(self.storage)
+        for url, title, raw in SOURCES:
+            ref = blobs.put_bytes(raw)
+            doc_id = f"src_{ref.digest[:12]}"
+            store.upsert_source(
+                SourceDoc(
+                    id=doc_id,
+                    url=url,
+                    retrieved_at=datetime.utcnow(),
+                    content_hash=f"sha256:{ref.digest}",
+                    warc_path=None,
+                    mime="text/html",
+                    meta={"title": title},
+                )
+            )
+            store.index_source_text(doc_id, title, raw.decode("utf-8"))
+        store.close()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_ranks_ingested_sources_and_serves_them_offline(self) -> None:
+        provider = LocalIndexProvider.from_config(self.storage)
+        results = provider.search(SearchQuery(q="boiling point of water", topk=5))
+        self.assertEqual([r.url for r in results], [SOURCES[0][0], SOURCES[1][0]])
+        self.assertEqual([r.rank for r in results], [1, 2])
+        self.assertTrue(all(r.engine == "local_index" for r in results))
+
+        fetched = provider.fetch(SOURCES[0][0])
+        self.assertIsNotNone(fetched)
+        self.assertEqual(fetched.content, SOURCES[0][2])
+        self.assertEqual(fetched.headers["content-type"], "text/html")
+        # Only URLs this provider returned are served from disk.
+        self.assertIsNone(provider.fetch(SOURCES[2][0]))
+        provider.store.close()
+
+    def test_site_filters_and_broker_registration(self) -> None:
+        broker = SearchBroker.from_config(
+            SearchConfig(
+                providers=["local_index"],
+                topk_per_engine=5,
+                freshness_days=365,
+                safe_mode="standard",
+                api_budget_usd=0.0,
+            ),
+            self.storage,
+        )
+        self.assertEqual([p.name for p in broker.providers], ["local_index"])
+        results = broker.search(SearchQuery(q="water", site_filters=["example.com"], topk=5))
+        self.assertEqual([r.url for r in results], [SOURCES[1][0]])
+        broker.providers[0].store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from research_agent.evidence.store import EvidenceStore
+from research_agent.types import Annotation, ClaimGroup, Proposition, SourceDoc
+
+
+class EvidenceStoreTests(unittest.TestCase):
+    def test_persist_evidence_bulk_and_pragmas(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            store.upsert_source(
+                SourceDoc(
+                    id="doc1",
+                    url="http://example.com",
+                    retrieved_at=datetime.utcnow(),
+                    content_hash="sha256:abc",
+                    warc_path=None,
+                    mime="text/html",
+                )
+            )
+            propositions = [
+                Proposition(
+                    id=f"prop_{idx}",
+                    type="Fact",
+                    payload={"claim_text": f"claim {idx}", "quote": f"quote {idx}"},
+                    anchors=[
+                        Annotation(
+                            doc_id="doc1",
+                            selector={"type": "TextQuoteSelector", "exact": f"quote {idx}"},
+                            quote=f"quote {idx}",
+                            context="",
+                        )
+                    ],
+                    doc_id="doc1",
+                    quality={},
+                    extracted_at=datetime.utcnow(),
+                )
+                for idx in range(5)
+            ]
+            claims = [
+                ClaimGroup(
+                    signature="sig1",
+                    claim_text="claim 0",
+                    domain="general",
+                    propositions=["prop_0"],
+                    merge=None,
+                    stance="insufficient",
+                    rationale="",
+                )
+            ]
+            store.persist_evidence(propositions, claims)
+
+            conn = store.connect()
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM propositions").fetchone()[0], 5)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM annotations").fetchone()[0], 5)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM claim_groups").fetchone()[0], 1)
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+            store.close()
+
+    def test_search_evidence_ranks_claims_and_source_text(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EvidenceStore(Path(tmpdir) / "agent.db")
+            store.init()
+            for doc_id, title, text in [
+                ("doc1", "Boiling point", "At sea level water boils at 100 degrees Celsius."),
+                ("doc2", "Ice", "Ice melts at zero degrees."),
+            ]:
+                store.upsert_source(
+                    SourceDoc(
+                        id=doc_id,
+                        url=f"http://example.com/{doc_id}",
+                        retrieved_at=datetime.utcnow(),
+                        content_hash=f"sha256:{doc_id}",
+                        warc_path=None,
+                        mime="text/plain",
+                        meta={"title": title},
+                    )
+                )
+                store.index_source_text(doc_id, title, text)
+            prop = Proposition(
+                id="prop_boil",
+                type="Fact",
+                payload={"claim_text": "Water boils at 100 C.", "quote": "water boils at 100"},
+                anchors=[],
+                doc_id="doc1",
+                quality={},
+                extracted_at=datetime.utcnow(),
+            )
+            store.upsert_propositions([prop])
+            # Re-upserting and re-indexing must replace index rows, not add to them.
+            store.upsert_propositions([prop])
+            store.index_source_text("doc1", "Boiling point", "At sea level water boils at 100 degrees Celsius.")
+
+            hits = store.search_evidence("When does water boil?")
+            conn = store.connect()
+            indexed = conn.execute("SELECT COUNT(*) FROM propositions_fts").fetchone()[0]
+            store.close()
+
+        self.assertEqual(indexed, 1)
+        self.assertEqual(
+            sorted((hit.kind, hit.doc_id) for hit in hits),
+            [("proposition", "doc1"), ("source", "doc1")],
+        )
+        claim = next(hit for hit in hits if hit.kind == "proposition")
+        self.assertEqual(claim.proposition_id, "prop_boil")
+        self.assertEqual(claim.title, "Boiling point")
+        self.assertIn("[boils]", claim.snippet)
+        # Each index is scaled to its own best hit before merging.
+        self.assertEqual([hit.score for hit in hits], [1.0, 1.0])
+        self.assertEqual(hits[0].kind, "proposition")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from tests import path_setup  # noqa: F401
+
+import gzip
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from research_agent.blobs.store import BlobStore
+from research_agent.evidence.store import EvidenceStore
+from research_agent.fetch.fetcher import FetchedDoc, fetch_url
+from research_agent.fetch.warc import WarcMissError, WarcReplay, WarcWriter
+
+PAGES = {
+    "https://example.com/boiling": b"<p>Water boils at 100 C.</p>",
+    "https://example.com/freezing": b"<p>Water freezes at 0 C.</p>",
+}
+
+
+class WarcTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        base = Path(self._tmp.name)
+        self.warc_dir = base / "warc"
+        self.store = EvidenceStore(base / "agent.db")
+        self.store.init()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=PAGES[str(request.url)],
+                headers={
+                    "content-type": "text/html; charset=utf-8",
+                    "etag": '"v1"',
+                    "x-title": "Caf\u00e9".encode("iso-8859-1"),
+                },
+            )
+
+        self.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.store.close()
+        self._tmp.cleanup()
+
+    def test_captured_fetches_replay_from_offsets(self) -> None:
+        # A tiny cap rolls every record after the first into a new file.
+        writer = WarcWriter(warc_dir=self.warc_dir, store=self.store, max_file_bytes=1)
+        fetch = writer.wrap(fetch_url)
+        for url in PAGES:
+            fetched = fetch(url, client=self.client)
+            self.assertIsNotNone(fetched.warc_path)
+
+        files = sorted(self.warc_dir.glob("*.warc.gz"))
+        self.assertEqual(len(files), 2)
+        # Concatenated gzip members read back as one valid WARC stream.
+        self.assertIn(b"WARC-Type: warcinfo", gzip.decompress(files[0].read_bytes()))
+
+        replay = WarcReplay(warc_dir=self.warc_dir, store=self.store)
+        for url, body in PAGES.items():
+            replayed = replay.fetch(url)
+            self.assertEqual(replayed.content, body)
+            self.assertEqual(replayed.status_code, 200)
+            self.assertEqual(replayed.url, url)
+            self.assertEqual(replayed.headers["content-type"], "text/html; charset=utf-8")
+            self.assertEqual(replayed.headers["etag"], '"v1"')
+            self.assertEqual(replayed.headers["x-title"], "Caf\u00e9")
+
+        record = self.store.latest_warc_record("https://example.com/boiling")
+        assert record is not None
+        self.assertTrue(record.digest.startswith("sha256:"))
+        self.assertGreater(record.offset, 0)
+
+        with self.assertRaises(WarcMissError):
+            replay.fetch("https://example.com/never-fetched")
+
+    def test_deduplicated_spooled_body_keeps_its_raw_size(self) -> None:
+        body = b"<p>" + b"water boils " * 2000 + b"</p>"
+        PAGES["https://example.com/large"] = body
+        self.addCleanup(PAGES.pop, "https://example.com/large")
+        blobs = BlobStore(Path(self._tmp.name) / "blobs", compression="gzip")
+        writer = WarcWriter(warc_dir=self.warc_dir, store=self.store)
+        fetch = writer.wrap(fetch_url)
+
+        # The second fetch hashes to a blob already on disk, stored compressed.
+        for _ in range(2):
+            fetched = fetch("https://example.com/large", client=self.client, spool=blobs, spool_bytes=1024)
+            assert fetched.blob is not None
+            self.assertEqual(fetched.size(), len(body))
+
+        replayed = WarcReplay(warc_dir=self.warc_dir, store=self.store).fetch("https://example.com/large")
+        self.assertEqual(replayed.content, body)
+
+    def test_failed_write_leaves_no_partial_record(self) -> None:
+        class _BrokenBody(FetchedDoc):
+            def iter_body(self):
+                yield b"<p>Water"
+                raise OSError("disk went away")
+
+        writer = WarcWriter(warc_dir=self.warc_dir, store=self.store)
+        fetch = writer.wrap(fetch_url)
+        fetch("https://example.com/boiling", client=self.client)
+        (path,) = self.warc_dir.glob("*.warc.gz")
+        size = path.stat().st_size
+
+        broken = _BrokenBody("https://example.com/broken", 200, b"", {}, datetime.utcnow())
+        with self.assertRaises(OSError):
+            writer.append("https://example.com/broken", broken)
+        self.assertEqual(path.stat().st_size, size)
+
+        fetch("https://example.com/freezing", client=self.client)
+        replay = WarcReplay(warc_dir=self.warc_dir, store=self.store)
+        self.assertEqual(replay.fetch("https://example.com/freezing").content, PAGES["https://example.com/freezing"])
+        self.assertIn(b"Water freezes", gzip.decompress(path.read_bytes()))
+
+
+if __name__ == "__main__":
+    unittest.main()